@@ -0,0 +1,270 @@
+"""
+Пакетный запуск поисковых запросов без диалога с пользователем
+
+Файл запросов - JSON Lines, по объекту на строку:
+    {"query": "Python разработчик", "filter_words": ["django"], "salary_range": "100000-200000", "top_n": 10}
+Обязателен только query; пустые строки и строки с "#" в начале пропускаются.
+
+Запросы выполняются в пуле потоков или процессов, все найденные вакансии
+сохраняет один писатель JSONStorage в главном процессе, топ вакансий по
+каждому запросу выводится в JSON Lines или CSV.
+
+Запуск: python batch.py queries.jsonl -o results.jsonl [--workers 4] [--processes] [--format csv]
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, IO, List, Optional, Tuple
+from main import process_vacancies
+from src.models.vacancy import Vacancy
+from src.storage.json_storage import JSONStorage
+from src.utils.filters import (
+    filter_vacancies,
+    get_top_vacancies,
+    get_vacancies_by_salary,
+    parse_salary_range,
+    sort_vacancies,
+)
+
+CSV_FIELDS = [
+    "query", "rank", "id", "name", "employer", "area",
+    "salary_from", "salary_to", "currency", "alternate_url",
+]
+
+
+def load_queries(file: IO) -> List[Dict[str, Any]]:
+    """
+    Читает и проверяет файл запросов
+
+    :param file: Открытый файл JSON Lines
+    :return: Список запросов с заполненными значениями по умолчанию
+    :raises ValueError: Если строка некорректна
+    """
+    queries = []
+    for line_number, line in enumerate(file, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            spec = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Строка {line_number}: некорректный JSON ({e})")
+        if not isinstance(spec, dict) or not str(spec.get("query", "")).strip():
+            raise ValueError(f"Строка {line_number}: не указан query")
+
+        filter_words = spec.get("filter_words") or []
+        if isinstance(filter_words, str):
+            filter_words = filter_words.split()
+        salary_range = str(spec.get("salary_range") or "").strip()
+        try:
+            parse_salary_range(salary_range)
+            top_n = int(spec.get("top_n", 10))
+        except ValueError as e:
+            raise ValueError(f"Строка {line_number}: {e}")
+        if top_n <= 0:
+            raise ValueError(f"Строка {line_number}: top_n должно быть положительным")
+
+        queries.append(
+            {
+                "query": str(spec["query"]).strip(),
+                "filter_words": filter_words,
+                "salary_range": salary_range,
+                "top_n": top_n,
+            }
+        )
+    return queries
+
+
+def run_query(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Выполняет один запрос: загрузка через main.process_vacancies и фильтрация
+
+    Выполняется в рабочем потоке или процессе, в хранилище не пишет и ничего
+    не выводит: о ходе работы сообщает главный поток (см. run_batch).
+
+    :return: Результат с вакансиями, топом, счётчиками и временем этапов
+    """
+    started = time.perf_counter()
+    errors: List[Tuple[int, str]] = []
+    vacancies = process_vacancies(spec["query"], quiet=True, errors=errors)
+    fetched = time.perf_counter()
+
+    filtered = filter_vacancies(vacancies, spec["filter_words"])
+    ranged = get_vacancies_by_salary(filtered, spec["salary_range"])
+    top = get_top_vacancies(sort_vacancies(ranged), spec["top_n"])
+    finished = time.perf_counter()
+
+    return {
+        "spec": spec,
+        "vacancies": vacancies,
+        "errors": len(errors),
+        "top": top,
+        "filtered": len(filtered),
+        "ranged": len(ranged),
+        "fetch_time": fetched - started,
+        "process_time": finished - fetched,
+    }
+
+
+def write_results(writer: Any, output_format: str, query: str, top: List[Vacancy]) -> None:
+    """Записывает топ вакансий запроса в выходной файл"""
+    for rank, vacancy in enumerate(top, 1):
+        if output_format == "jsonl":
+            record = {"query": query, "rank": rank, **vacancy.to_dict()}
+            writer.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            writer.writerow(
+                {
+                    "query": query,
+                    "rank": rank,
+                    "id": vacancy.id,
+                    "name": vacancy.name,
+                    "employer": vacancy.employer.name if vacancy.employer else "",
+                    "area": vacancy.area.name if vacancy.area else "",
+                    "salary_from": vacancy.salary_from,
+                    "salary_to": vacancy.salary_to,
+                    "currency": vacancy.salary_currency or "",
+                    "alternate_url": vacancy.alternate_url or "",
+                }
+            )
+
+
+def run_batch(
+    queries: List[Dict[str, Any]],
+    output: IO,
+    output_format: str = "jsonl",
+    storage: Optional[JSONStorage] = None,
+    workers: int = 4,
+    use_processes: bool = False,
+    progress: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Выполняет запросы параллельно и сохраняет результаты
+
+    Вакансии сохраняются и выводятся в главном процессе по мере готовности
+    запросов, поэтому у хранилища и выходного файла ровно один писатель.
+    Ошибка загрузки или сохранения одного запроса попадает в его сводку и не
+    прерывает остальные.
+
+    :param queries: Запросы (см. load_queries)
+    :param output: Открытый выходной файл
+    :param output_format: "jsonl" или "csv"
+    :param storage: Хранилище (None - не сохранять)
+    :param workers: Размер пула
+    :param use_processes: Пул процессов вместо пула потоков
+    :param progress: Сообщать о завершении каждого запроса (из главного потока)
+    :return: Сводка по каждому запросу в порядке завершения
+    """
+    if output_format not in ("jsonl", "csv"):
+        raise ValueError(f"Unknown output format: {output_format}")
+    writer: Any = output
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+
+    pool: Executor = (ProcessPoolExecutor if use_processes else ThreadPoolExecutor)(max_workers=max(1, workers))
+    summaries = []
+    with pool:
+        futures = {pool.submit(run_query, spec): spec for spec in queries}
+        for future in as_completed(futures):
+            spec = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                summaries.append({"query": spec["query"], "error": str(e)})
+                _report(progress, len(summaries), len(queries), spec["query"], f"ошибка загрузки: {e}")
+                continue
+
+            saved_started = time.perf_counter()
+            write_results(writer, output_format, spec["query"], result["top"])
+            try:
+                saved = storage.add_vacancies(result["vacancies"])["inserted"] if storage is not None else 0
+            except Exception as e:
+                summaries.append({"query": spec["query"], "error": f"ошибка сохранения: {e}"})
+                _report(progress, len(summaries), len(queries), spec["query"], f"ошибка сохранения: {e}")
+                continue
+            save_time = time.perf_counter() - saved_started
+
+            total_time = result["fetch_time"] + result["process_time"] + save_time
+            summaries.append(
+                {
+                    "query": spec["query"],
+                    "fetched": len(result["vacancies"]),
+                    "errors": result["errors"],
+                    "filtered": result["filtered"],
+                    "ranged": result["ranged"],
+                    "top": len(result["top"]),
+                    "saved": saved,
+                    "fetch_time": result["fetch_time"],
+                    "process_time": result["process_time"],
+                    "save_time": save_time,
+                    "throughput": len(result["vacancies"]) / total_time if total_time else 0.0,
+                }
+            )
+            _report(progress, len(summaries), len(queries), spec["query"], f"получено {len(result['vacancies'])}")
+    return summaries
+
+
+def _report(enabled: bool, done: int, total: int, query: str, message: str) -> None:
+    """Сообщение о ходе пакета"""
+    if enabled:
+        print(f"[{done}/{total}] {query}: {message}")
+
+
+def print_summary(summaries: List[Dict[str, Any]], elapsed: float) -> None:
+    """Выводит время и производительность по запросам и в целом"""
+    print("\nИтоги по запросам:")
+    print("------------------")
+    total = 0
+    for summary in summaries:
+        if "error" in summary:
+            print(f"{summary['query']}: ошибка - {summary['error']}")
+            continue
+        total += summary["fetched"]
+        print(
+            f"{summary['query']}: получено {summary['fetched']}, после фильтров {summary['ranged']}, "
+            f"в топе {summary['top']}, сохранено {summary['saved']}; "
+            f"загрузка {summary['fetch_time']:.2f} с, обработка {summary['process_time']:.3f} с, "
+            f"сохранение {summary['save_time']:.3f} с, {summary['throughput']:.0f} вак/с"
+        )
+    print(
+        f"\nВсего: {len(summaries)} запросов, {total} вакансий за {elapsed:.2f} с "
+        f"({total / elapsed if elapsed else 0.0:.0f} вак/с)"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Пакетный поиск вакансий на HeadHunter")
+    parser.add_argument("queries", help="Файл запросов в формате JSON Lines")
+    parser.add_argument("-o", "--output", required=True, help="Файл результатов")
+    parser.add_argument(
+        "--format", choices=["jsonl", "csv"], help="Формат результатов (по умолчанию по расширению файла)"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Количество параллельных запросов")
+    parser.add_argument("--processes", action="store_true", help="Пул процессов вместо пула потоков")
+    parser.add_argument("--storage", default="data/vacancies.json", help="JSON-хранилище вакансий")
+    parser.add_argument("--no-save", action="store_true", help="Не сохранять вакансии в хранилище")
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+    try:
+        with open(args.queries, "r", encoding="utf-8") as file:
+            queries = load_queries(file)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка чтения файла запросов: {e}", file=sys.stderr)
+        return 2
+
+    storage = None if args.no_save else JSONStorage(file_path=args.storage)
+    started = time.perf_counter()
+    with open(args.output, "w", encoding="utf-8", newline="") as output:
+        summaries = run_batch(queries, output, output_format, storage, args.workers, args.processes, progress=True)
+    print_summary(summaries, time.perf_counter() - started)
+    return 1 if any("error" in summary for summary in summaries) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
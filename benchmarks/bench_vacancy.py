@@ -0,0 +1,49 @@
+"""
+Замер памяти на объект Vacancy и скорости разбора from_hh_data
+
+Память считается через tracemalloc для объектов, созданных при разборе
+(строки id и описаний переиспользуются из исходных словарей и не входят в замер).
+
+Запуск: python -m benchmarks.bench_vacancy [количество вакансий]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Dict
+from benchmarks.generator import make_hh_items
+from src.models.vacancy import Vacancy
+
+
+def measure(count: int) -> Dict[str, float]:
+    """Возвращает скорость разбора (вакансий в секунду) и память на вакансию (байт)"""
+    items = make_hh_items(count)
+
+    started = time.perf_counter()
+    vacancies = [Vacancy.from_hh_data(item) for item in items]
+    single_rate = count / (time.perf_counter() - started)
+    del vacancies
+
+    started = time.perf_counter()
+    vacancies = Vacancy.from_hh_data_many(items)
+    batch_rate = count / (time.perf_counter() - started)
+    del vacancies
+
+    gc.collect()
+    tracemalloc.start()
+    vacancies = Vacancy.from_hh_data_many(items)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "count": count,
+        "from_hh_data_per_sec": round(single_rate),
+        "from_hh_data_many_per_sec": round(batch_rate),
+        "bytes_per_vacancy": round(current / len(vacancies)),
+    }
+
+
+if __name__ == "__main__":
+    result = measure(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
+    for name, value in result.items():
+        print(f"{name}: {value}")
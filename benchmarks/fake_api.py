@@ -0,0 +1,74 @@
+"""Локальный сервер, имитирующий метод /vacancies API HeadHunter"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+from src.api.hh_api import MAX_RESULTS
+
+
+class FakeHHServer:
+    """
+    HTTP-сервер с заданным набором вакансий и постраничной выдачей как у HH
+
+    Использование:
+        with FakeHHServer(items) as server:
+            api = HeadHunterAPI(base_url=server.url)
+    """
+
+    def __init__(self, items: List[Dict]):
+        self.items = items
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Адрес метода поиска вакансий"""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/vacancies"
+
+    def __enter__(self) -> "FakeHHServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def page(self, page: int, per_page: int) -> bytes:
+        """Тело ответа для страницы выдачи"""
+        found = len(self.items)
+        available = min(found, MAX_RESULTS)
+        start = page * per_page
+        return json.dumps(
+            {
+                "items": self.items[start:min(start + per_page, available)],
+                "found": found,
+                "page": page,
+                "pages": -(-available // per_page),
+                "per_page": per_page,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                server.requests += 1
+                body = server.page(int(query.get("page", ["0"])[0]), int(query.get("per_page", ["20"])[0]))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
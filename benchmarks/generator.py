@@ -0,0 +1,42 @@
+"""Синтетические вакансии в формате API HeadHunter для замеров"""
+import random
+from typing import Dict, Iterator, List
+
+AREAS = ["Москва", "Санкт-Петербург", "Казань", "Новосибирск", "Екатеринбург"]
+EXPERIENCES = ["Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет"]
+EMPLOYMENTS = ["Полная занятость", "Частичная занятость", "Проектная работа"]
+LANGUAGES = ["Python", "Java", "Go", "JavaScript", "C++"]
+CURRENCIES = ["RUR"] * 8 + ["USD", "KZT"]
+
+
+def iter_hh_items(count: int, seed: int = 0) -> Iterator[Dict]:
+    """
+    Генерирует вакансии в формате API HeadHunter по одной (для объёмов до 1M)
+
+    Данные воспроизводимы: одинаковые count и seed дают одинаковые вакансии.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        salary_from = rng.choice([None, rng.randrange(30000, 300000, 10000)])
+        yield {
+            "id": str(100000000 + i),
+            "name": f"{LANGUAGES[i % len(LANGUAGES)]} разработчик {i % 50}",
+            "salary": {
+                "from": salary_from,
+                "to": rng.choice([None, (salary_from or 30000) + 50000]),
+                "currency": rng.choice(CURRENCIES),
+            },
+            # Строки создаются заново, как после json.loads
+            "area": {"name": "".join(rng.choice(AREAS))},
+            "employer": {"name": f"Компания {rng.randrange(count // 10 + 1)}"},
+            "experience": {"name": "".join(rng.choice(EXPERIENCES))},
+            "employment": {"name": "".join(rng.choice(EMPLOYMENTS))},
+            "snippet": {"requirement": f"Опыт {i}", "responsibility": f"Разработка {i}"},
+            "alternate_url": f"https://hh.ru/vacancy/{100000000 + i}",
+            "published_at": f"2024-01-{1 + i % 28:02d}T{i % 24:02d}:00:00+0300",
+        }
+
+
+def make_hh_items(count: int, seed: int = 0) -> List[Dict]:
+    """Генерирует список вакансий в формате API HeadHunter"""
+    return list(iter_hh_items(count, seed))
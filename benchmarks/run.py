@@ -0,0 +1,228 @@
+"""
+Набор замеров производительности: разбор, фильтры, хранилище и конвейер целиком
+
+Для каждого размера данных (синтетические вакансии, см. benchmarks.generator)
+замеряются from_hh_data, to_dict, filter_vacancies, get_vacancies_by_salary,
+sort_vacancies, JSONStorage.add_vacancy и add_vacancies, открытие хранилища
+через open_reader в сравнении с полным чтением файла, а также конвейер
+run_pipeline с загрузкой через локальный сервер, имитирующий API HH.
+Берётся лучшее время из нескольких повторов.
+
+Результаты сохраняются в JSON; при указании --compare текущие результаты
+сравниваются с сохранёнными ранее (например, на другом коммите), а при
+замедлении больше порога команда завершается с кодом 1.
+
+Запуск: python -m benchmarks.run --sizes 1000 10000 100000 -o results.json [--compare baseline.json]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from benchmarks.fake_api import FakeHHServer
+from benchmarks.generator import make_hh_items
+from src.api.hh_api import MAX_RESULTS, HeadHunterAPI
+from src.models.vacancy import Vacancy
+from src.storage.json_storage import JSONStorage
+from src.utils.filters import filter_vacancies, get_vacancies_by_salary, sort_vacancies
+from src.utils.pipeline import run_pipeline
+
+# Каждый add_vacancy перезаписывает файл целиком, поэтому замер ограничен по размеру
+ADD_VACANCY_OPS = 20
+ADD_VACANCY_MAX_SIZE = 10000
+
+FILTER_WORDS = ["python"]
+SALARY_RANGE = "100000-200000"
+
+
+def best_time(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Лучшее время выполнения func из repeat повторов (setup не входит в замер)"""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def result(name: str, size: int, ops: int, seconds: float) -> Dict[str, Any]:
+    """Запись результата замера"""
+    return {
+        "name": name,
+        "size": size,
+        "ops": ops,
+        "seconds": round(seconds, 6),
+        "ops_per_sec": round(ops / seconds, 1) if seconds else None,
+    }
+
+
+def run_size(size: int, repeat: int, work_dir: str, only: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Выполняет все замеры для одного размера данных"""
+    results: List[Dict[str, Any]] = []
+
+    def enabled(name: str) -> bool:
+        return not only or name in only
+
+    items = make_hh_items(size)
+    vacancies = Vacancy.from_hh_data_many(items)
+    records = [vacancy.to_dict() for vacancy in vacancies]
+
+    if enabled("from_hh_data"):
+        seconds = best_time(lambda: [Vacancy.from_hh_data(item) for item in items], repeat)
+        results.append(result("from_hh_data", size, size, seconds))
+    if enabled("from_hh_data_many"):
+        seconds = best_time(lambda: Vacancy.from_hh_data_many(items), repeat)
+        results.append(result("from_hh_data_many", size, size, seconds))
+    if enabled("to_dict"):
+        seconds = best_time(lambda: [vacancy.to_dict() for vacancy in vacancies], repeat)
+        results.append(result("to_dict", size, size, seconds))
+    if enabled("filter_vacancies"):
+        seconds = best_time(lambda: filter_vacancies(vacancies, FILTER_WORDS), repeat)
+        results.append(result("filter_vacancies", size, size, seconds))
+    if enabled("get_vacancies_by_salary"):
+        seconds = best_time(lambda: get_vacancies_by_salary(vacancies, SALARY_RANGE), repeat)
+        results.append(result("get_vacancies_by_salary", size, size, seconds))
+    if enabled("sort_vacancies"):
+        seconds = best_time(lambda: sort_vacancies(vacancies), repeat)
+        results.append(result("sort_vacancies", size, size, seconds))
+
+    file_path = os.path.join(work_dir, f"vacancies_{size}.json")
+    storage = JSONStorage(file_path=file_path)
+
+    def reset_storage(stored: List[Dict]) -> Callable[[], None]:
+        return lambda: storage._write_file(stored)
+
+    if enabled("add_vacancies"):
+        seconds = best_time(lambda: storage.add_vacancies(records), repeat, setup=reset_storage([]))
+        results.append(result("add_vacancies", size, size, seconds))
+
+    if enabled("add_vacancy") and size <= ADD_VACANCY_MAX_SIZE:
+        new_records = [dict(record, id=f"new-{i}") for i, record in enumerate(records[:ADD_VACANCY_OPS])]
+
+        def add_one_by_one() -> None:
+            for record in new_records:
+                storage.add_vacancy(record)
+
+        seconds = best_time(add_one_by_one, repeat, setup=reset_storage(records))
+        results.append(result("add_vacancy", size, len(new_records), seconds))
+
+    if enabled("open_reader") or enabled("read_file"):
+        storage._write_file(records)
+        if enabled("open_reader"):
+            # Открытие после записи хранилищем: смещения берутся из кэша, файл не размечается
+            seconds = best_time(lambda: storage.open_reader().close(), repeat)
+            results.append(result("open_reader", size, size, seconds))
+        if enabled("read_file"):
+            seconds = best_time(storage._read_file, repeat)
+            results.append(result("read_file", size, size, seconds))
+
+    if enabled("pipeline"):
+        # API отдаёт не больше MAX_RESULTS вакансий на запрос
+        api_items = items[:MAX_RESULTS]
+        with FakeHHServer(api_items) as server:
+            api = HeadHunterAPI(base_url=server.url)
+            try:
+                seconds = best_time(
+                    lambda: run_pipeline(
+                        api.iter_all_vacancies("python"), FILTER_WORDS, SALARY_RANGE, 10, storage=storage
+                    ),
+                    repeat,
+                    setup=reset_storage([]),
+                )
+            finally:
+                api.close()
+        results.append(result("pipeline", size, len(api_items), seconds))
+
+    return results
+
+
+def collect_metadata() -> Dict[str, Any]:
+    """Сведения об окружении для сопоставления результатов"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Сравнивает результаты с базовыми
+
+    :param threshold: Допустимое относительное замедление (0.1 - на 10%)
+    :return: Список сравнений (name, size, baseline, current, ratio, regression)
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    comparisons = []
+    for record in current["results"]:
+        old = previous.get((record["name"], record["size"]))
+        if old is None or not old["seconds"]:
+            continue
+        ratio = record["seconds"] / old["seconds"]
+        comparisons.append(
+            {
+                "name": record["name"],
+                "size": record["size"],
+                "baseline": old["seconds"],
+                "current": record["seconds"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Замеры производительности")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Размеры данных")
+    parser.add_argument("--repeat", type=int, default=3, help="Количество повторов каждого замера")
+    parser.add_argument("--only", nargs="+", help="Выполнить только указанные замеры")
+    parser.add_argument("-o", "--output", help="Файл для сохранения результатов в JSON")
+    parser.add_argument("--compare", help="Файл с базовыми результатами для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Допустимое замедление (доля)")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = {"meta": collect_metadata(), "results": []}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            for record in run_size(size, args.repeat, work_dir, args.only):
+                report["results"].append(record)
+                print(
+                    f"{record['name']:<24} {record['size']:>8} "
+                    f"{record['seconds']:>10.4f} с {record['ops_per_sec'] or 0:>12.0f} оп/с"
+                )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=4)
+
+    if not args.compare:
+        return 0
+    with open(args.compare, "r", encoding="utf-8") as file:
+        comparisons = compare(json.load(file), report, args.threshold)
+    print("\nСравнение с базовыми результатами:")
+    for item in comparisons:
+        mark = "  ЗАМЕДЛЕНИЕ" if item["regression"] else ""
+        print(f"{item['name']:<24} {item['size']:>8} x{item['ratio']:.2f}{mark}")
+    return 1 if any(item["regression"] for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,14 @@
+from src.api.harvester import ShardedHarvester
 from src.api.hh_api import HeadHunterAPI
-from src.storage.json_storage import JSONStorage
+from src.storage.json_storage import JSONStorage, StorageCorruptedError
 from src.models.vacancy import Vacancy
-from src.utils.filters import (
-    filter_vacancies,
-    get_vacancies_by_salary,
-    sort_vacancies,
-    get_top_vacancies,
-)
+from src.utils.pipeline import run_pipeline
+from src.utils.currency import ExchangeRates, load_rates
+from src.utils.metrics import instrumentation_from_env
+from src.utils.sync import IncrementalSync
 import requests
+import sys
+from typing import Optional
 
 
 def display_vacancy(vacancy: Vacancy, index: int) -> None:
@@ -83,96 +84,132 @@ def get_user_input() -> tuple:
     return search_query, top_n, filter_words, salary_range
 
 
-def process_vacancies(search_query: str) -> list[Vacancy]:
-    """Получает и обрабатывает вакансии с API"""
-    print("\nПолучение вакансий с HeadHunter...")
+def process_vacancies(search_query: str, quiet: bool = False, errors: Optional[list] = None) -> list[Vacancy]:
+    """
+    Получает и обрабатывает вакансии с API
+
+    :param search_query: Поисковый запрос
+    :param quiet: Не выводить сообщения (для пакетного запуска в рабочих потоках, см. batch.py)
+    :param errors: Список, в который добавляются пары (номер записи, текст ошибки) невалидных записей
+    :return: Список вакансий; невалидные записи пропускаются
+    """
+    if not quiet:
+        print("\nПолучение вакансий с HeadHunter...")
 
     hh_api = HeadHunterAPI()
-    vacancies_data = hh_api.get_vacancies(search_query)
+    try:
+        vacancies_data = hh_api.get_vacancies(search_query)
+    finally:
+        hh_api.close()
 
-    vacancies = []
-    for v in vacancies_data:
-        try:
-            # Пропускаем невалидные данные
-            if not isinstance(v, dict):
-                continue
+    errors = [] if errors is None else errors
+    vacancies = Vacancy.from_hh_data_many(vacancies_data, errors)
+    if not quiet:
+        for _, message in errors:
+            print(f"Ошибка при обработке вакансии: {message}")
+    return vacancies
 
-            # Создаем объект Vacancy
-            vacancy = Vacancy.from_hh_data(v)
-            vacancies.append(vacancy)
-        except Exception as e:
-            print(f"Ошибка при обработке вакансии: {str(e)}")
-            continue
 
-    return vacancies
+def load_exchange_rates() -> Optional[ExchangeRates]:
+    """Загружает курсы валют (из кэша или API); без курсов зарплаты сравниваются как есть"""
+    try:
+        return load_rates()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Курсы валют недоступны, зарплаты сравниваются без пересчёта: {e}")
+        return None
 
 
-def save_vacancies(vacancies: list[Vacancy]) -> None:
-    """Сохраняет вакансии в JSON файл"""
-    print("\nСохранение вакансий...")
+def sync_vacancies(search_query: str, full: bool = False) -> None:
+    """Инкрементально обновляет хранилище по запросу (только изменения с прошлого запуска)"""
+    hh_api = HeadHunterAPI()
+    try:
+        stats = IncrementalSync(hh_api, JSONStorage()).sync(search_query, full=full)
+    finally:
+        hh_api.close()
 
-    storage = JSONStorage()
-    saved_count = 0
+    mode = "полная загрузка" if stats["full"] else "изменения"
+    print(f"Синхронизация '{search_query}' ({mode}): получено {stats['fetched']}, "
+          f"новых {stats['inserted']}, обновлено {stats['updated']}, закрыто {stats['tombstoned']}, "
+          f"удалено из хранилища {stats['deleted']}")
 
-    for vacancy in vacancies:
-        try:
-            storage.add_vacancy(vacancy)
-            saved_count += 1
-        except Exception as e:
-            print(f"Ошибка при сохранении вакансии {vacancy.id}: {str(e)}")
-            continue
 
-    print(f"Сохранено вакансий: {saved_count}")
+def harvest_vacancies(search_query: str) -> None:
+    """Загружает полный результат широкого запроса по шардам (регионы, интервалы дат) и сохраняет его"""
+    hh_api = HeadHunterAPI()
+    try:
+        items, stats = ShardedHarvester(hh_api).harvest(search_query)
+    finally:
+        hh_api.close()
+
+    result = JSONStorage().upsert_vacancies(Vacancy.from_hh_data_many(items))
+    print(f"Выгрузка '{search_query}': шардов {stats['shards']}, получено {stats['fetched']} из {stats['found']}, "
+          f"повторов {stats['duplicates']}, сохранено {result}")
+    if stats["truncated"]:
+        print(f"Шардов с неполным результатом: {stats['truncated']}")
 
 
 def user_interaction():
     """Основная функция взаимодействия с пользователем"""
-    print("\nПрограмма для поиска вакансий с HeadHunter.ru")
-    print("===========================================")
+    # VACANCY_METRICS=<файл> - выгрузить метрики этапов, VACANCY_PROFILE=<префикс> - снять профиль
+    with instrumentation_from_env():
+        print("\nПрограмма для поиска вакансий с HeadHunter.ru")
+        print("===========================================")
 
-    try:
-        # Получаем параметры поиска от пользователя
-        search_query, top_n, filter_words, salary_range = get_user_input()
-
-        # Получаем и обрабатываем вакансии
-        vacancies = process_vacancies(search_query)
-
-        # Сохраняем вакансии
-        save_vacancies(vacancies)
-
-        # Фильтруем и сортируем вакансии
-        print("\nФильтрация вакансий...")
-        filtered_vacancies = filter_vacancies(vacancies, filter_words)
-        ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
-        sorted_vacancies = sort_vacancies(ranged_vacancies)
-        top_vacancies = get_top_vacancies(sorted_vacancies, top_n)
-
-        # Выводим результаты
-        print("\nРезультаты поиска:")
-        print("-----------------")
-        print(f"Всего найдено вакансий: {len(vacancies)}")
-        print(f"После фильтрации по ключевым словам: {len(filtered_vacancies)}")
-        print(f"Соответствует зарплатному диапазону: {len(ranged_vacancies)}")
-
-        # Выводим топ вакансий
-        print(f"\nТоп {len(top_vacancies)} вакансий:")
-        print("---------------------")
-
-        if not top_vacancies:
-            print("Нет вакансий, соответствующих заданным критериям.")
-        else:
-            for i, vacancy in enumerate(top_vacancies, 1):
-                display_vacancy(vacancy, i)
-
-    except ValueError as e:
-        print(f"\nОшибка ввода данных: {e}")
-    except requests.exceptions.RequestException as e:
-        print(f"\nОшибка при подключении к API: {e}")
-    except Exception as e:
-        print(f"\nПроизошла непредвиденная ошибка: {str(e)}")
-    finally:
-        print("\nРабота программы завершена.")
+        try:
+            # Получаем параметры поиска от пользователя
+            search_query, top_n, filter_words, salary_range = get_user_input()
+
+            # Получаем вакансии постранично, сохраняем и фильтруем их потоком
+            print("\nПолучение, сохранение и фильтрация вакансий...")
+            hh_api = HeadHunterAPI()
+            try:
+                top_vacancies, stats = run_pipeline(
+                    hh_api.iter_all_vacancies(search_query),
+                    filter_words,
+                    salary_range,
+                    top_n,
+                    storage=JSONStorage(),
+                    rates=load_exchange_rates(),
+                )
+            finally:
+                hh_api.close()
+            print(f"Сохранено вакансий: {stats['saved']}")
+
+            # Выводим результаты
+            print("\nРезультаты поиска:")
+            print("-----------------")
+            print(f"Всего найдено вакансий: {stats['parsed']}")
+            print(f"После фильтрации по ключевым словам: {stats['filtered']}")
+            print(f"Соответствует зарплатному диапазону: {stats['ranged']}")
+
+            # Выводим топ вакансий
+            print(f"\nТоп {len(top_vacancies)} вакансий:")
+            print("---------------------")
+
+            if not top_vacancies:
+                print("Нет вакансий, соответствующих заданным критериям.")
+            else:
+                for i, vacancy in enumerate(top_vacancies, 1):
+                    display_vacancy(vacancy, i)
+
+        except StorageCorruptedError as e:
+            print(f"\nФайл данных повреждён, восстановите или удалите его: {e}")
+        except ValueError as e:
+            print(f"\nОшибка ввода данных: {e}")
+        except requests.exceptions.RequestException as e:
+            print(f"\nОшибка при подключении к API: {e}")
+        except Exception as e:
+            print(f"\nПроизошла непредвиденная ошибка: {str(e)}")
+        finally:
+            print("\nРабота программы завершена.")
 
 
 if __name__ == "__main__":
-    user_interaction()
+    # python main.py --sync "Python разработчик" [--full] - обновление без диалога
+    # python main.py --harvest "Python разработчик" - полная выгрузка широкого запроса
+    if len(sys.argv) > 2 and sys.argv[1] == "--sync":
+        sync_vacancies(sys.argv[2], full="--full" in sys.argv[3:])
+    elif len(sys.argv) > 2 and sys.argv[1] == "--harvest":
+        harvest_vacancies(sys.argv[2])
+    else:
+        user_interaction()
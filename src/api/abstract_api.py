@@ -13,3 +13,17 @@ class AbstractAPI(ABC):
     def get_vacancies(self, search_query: str, per_page: int = 100) -> list[dict]:
         """Получение вакансий по поисковому запросу"""
         pass
+
+
+class AbstractAsyncAPI(ABC):
+    """Абстрактный класс для асинхронной работы с API вакансий"""
+
+    @abstractmethod
+    async def _connect_to_api(self) -> None:
+        """Подключение к API"""
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, search_query: str, per_page: int = 100) -> list[dict]:
+        """Получение вакансий по поисковому запросу"""
+        pass
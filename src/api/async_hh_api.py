@@ -0,0 +1,168 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from src.api.abstract_api import AbstractAsyncAPI
+from src.api.hh_api import BASE_URL, MAX_RESULTS, HeadHunterAPI
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов по алгоритму token bucket
+
+    Токены пополняются со скоростью rate в секунду до ёмкости capacity,
+    каждый запрос забирает один токен или ждёт его появления.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Дожидается свободного токена и забирает его"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncHeadHunterAPI(AbstractAsyncAPI):
+    """
+    Асинхронный клиент API HeadHunter для одновременной обработки многих запросов
+
+    Запросы выполняются через пул соединений HeadHunterAPI в отдельных потоках,
+    а их планирование идёт в asyncio: общее число одновременных запросов
+    ограничено max_concurrency, частота - ограничителем TokenBucket.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        max_concurrency: int = 10,
+        rate_limit: float = 20.0,
+        timeout: float = 10.0,
+    ):
+        """
+        :param base_url: Адрес метода поиска вакансий
+        :param max_concurrency: Максимальное число одновременных запросов
+        :param rate_limit: Максимальное число запросов в секунду
+        :param timeout: Таймаут одного запроса в секундах
+        """
+        self._api = HeadHunterAPI(base_url=base_url, pool_size=max_concurrency, timeout=timeout)
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._rate_limiter = TokenBucket(rate_limit)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncHeadHunterAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Освобождает пул потоков и HTTP-сессию"""
+        self._executor.shutdown(wait=False)
+        self._api.close()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Возвращает счётчики запросов (см. HeadHunterAPI.get_stats)"""
+        return self._api.get_stats()
+
+    async def _connect_to_api(self) -> None:
+        """Проверяет доступность API"""
+        await self._run(self._api.check_connection)
+
+    async def get_vacancies(self, search_query: str, per_page: int = 100) -> List[Dict]:
+        """
+        Получение первой страницы вакансий по запросу
+
+        :param search_query: Поисковый запрос
+        :param per_page: Количество вакансий
+        :return: Список вакансий
+        """
+        data = await self._fetch_page(self._api._build_params(search_query, per_page), 0)
+        return data.get("items", [])
+
+    async def get_all_vacancies(
+        self,
+        search_query: str,
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict]:
+        """
+        Получение всех страниц результатов по запросу
+
+        :param search_query: Поисковый запрос
+        :param per_page: Количество вакансий на странице
+        :param max_pages: Ограничение на количество загружаемых страниц
+        :param extra_params: Дополнительные параметры запроса к API
+        :return: Список вакансий в порядке страниц
+        """
+        params = self._api._build_params(search_query, per_page, extra_params)
+        first_page = await self._fetch_page(params, 0)
+
+        pages = min(first_page.get("pages", 1), -(-MAX_RESULTS // per_page))
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+
+        rest = await asyncio.gather(*(self._fetch_page(params, page) for page in range(1, pages)))
+
+        items = list(first_page.get("items", []))
+        for data in rest:
+            items.extend(data.get("items", []))
+        return items
+
+    async def get_vacancies_many(
+        self,
+        queries: Iterable[str],
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Одновременное получение вакансий по многим запросам
+
+        Страницы всех запросов загружаются параллельно в рамках общих
+        ограничений на число одновременных запросов и их частоту.
+
+        :param queries: Поисковые запросы
+        :param per_page: Количество вакансий на странице
+        :param max_pages: Ограничение на количество страниц для каждого запроса
+        :param return_exceptions: Вернуть исключение вместо результата для неудачного запроса
+        :return: Словарь "запрос -> список вакансий" (или исключение)
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        results = await asyncio.gather(
+            *(self.get_all_vacancies(query, per_page, max_pages) for query in unique_queries),
+            return_exceptions=return_exceptions,
+        )
+        return dict(zip(unique_queries, results))
+
+    async def _fetch_page(self, params: Dict[str, Any], page: int) -> Dict:
+        """Загружает одну страницу с учётом ограничений параллельности и частоты"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            await self._rate_limiter.acquire()
+            return await self._run(self._api._fetch_page, params, page)
+
+    async def _run(self, func, *args):
+        """Выполняет блокирующий вызов в пуле потоков"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """
+    Дисковый кэш ответов API
+
+    Ключ записи - хэш нормализованных параметров запроса. Записи живут ttl
+    секунд, после чего требуют повторной проверки (по ETag/Last-Modified, если
+    сервер их прислал). Число записей ограничено max_entries, при переполнении
+    удаляются давно не использовавшиеся (LRU).
+    """
+
+    def __init__(self, cache_dir: str = "data/cache", ttl: float = 3600, max_entries: int = 1000):
+        """
+        :param cache_dir: Каталог для файлов кэша
+        :param ttl: Время жизни записи в секундах
+        :param max_entries: Максимальное число записей
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "evictions": 0}
+        self._lru: "OrderedDict[str, None]" = OrderedDict()
+        files = [name for name in os.listdir(cache_dir) if name.endswith(".json")]
+        files.sort(key=lambda name: os.path.getmtime(os.path.join(cache_dir, name)))
+        for name in files:
+            self._lru[name[: -len(".json")]] = None
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Строит ключ по параметрам запроса (порядок и регистр текста не важны)"""
+        normalized = {}
+        for name, value in params.items():
+            if isinstance(value, str):
+                value = " ".join(value.lower().split())
+            elif isinstance(value, bool):
+                value = str(value).lower()
+            normalized[str(name)] = str(value)
+        raw = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Ищет запись и учитывает результат в статистике
+
+        :return: Запись с полями body, etag, last_modified, stored_at и признаком fresh или None
+        """
+        entry = self._read(key)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            entry["fresh"] = time.time() - entry["stored_at"] < self.ttl
+            self._stats["hits" if entry["fresh"] else "stale"] += 1
+            self._touch_lru(key)
+        try:
+            # Время последнего использования сохраняется для порядка LRU между запусками
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, body: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Сохраняет ответ в кэш"""
+        entry = {"body": body, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        self._write(key, entry)
+        with self._lock:
+            self._touch_lru(key)
+            while len(self._lru) > self.max_entries:
+                old_key, _ = self._lru.popitem(last=False)
+                self._remove(old_key)
+                self._stats["evictions"] += 1
+
+    def revalidate(self, key: str, entry: Dict[str, Any]) -> None:
+        """Продлевает запись после ответа сервера 304 Not Modified"""
+        self.put(key, entry["body"], entry.get("etag"), entry.get("last_modified"))
+        with self._lock:
+            self._stats["revalidated"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Возвращает статистику попаданий и промахов"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._lru)
+        lookups = stats["hits"] + stats["misses"] + stats["stale"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша"""
+        with self._lock:
+            for key in list(self._lru):
+                self._remove(key)
+            self._lru.clear()
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу записи"""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _touch_lru(self, key: str) -> None:
+        """Отмечает запись как последнюю использованную"""
+        self._lru[key] = None
+        self._lru.move_to_end(key)
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Читает запись с диска (None, если её нет или файл повреждён)"""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        """Атомарно записывает запись на диск"""
+        tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(entry, file, ensure_ascii=False)
+        os.replace(tmp_path, self._path(key))
+
+    def _remove(self, key: str) -> None:
+        """Удаляет файл записи"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,310 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+import requests
+from src.api.hh_api import MAX_RESULTS
+from src.utils.metrics import metrics
+from src.utils.sync import HH_DATE_FORMAT, SEARCH_PERIOD, parse_hh_date
+
+AREAS_URL = "https://api.hh.ru/areas"
+ROOT_AREA = 113  # Россия
+
+
+@dataclass
+class Shard:
+    """Часть запроса, результат которой помещается в окно выдачи HH"""
+
+    params: Dict[str, Any]
+    found: int
+    truncated: bool = False  # результат больше окна, но делить дальше некуда
+    area: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    parent: Optional["Shard"] = field(default=None, repr=False, compare=False)  # шард, поделённый по регионам
+    # Параметры дочерних регионов для шарда-остатка: их вакансии уже загружаются отдельно
+    covering: Optional[List[Dict[str, Any]]] = field(default=None, repr=False, compare=False)
+    covered: int = field(default=0, compare=False)
+
+
+def fetch_area_tree(area_id: int = ROOT_AREA, url: str = AREAS_URL, timeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Дерево регионов HH: {"id", "name", "areas": [...]} (метод /areas/{id})
+
+    :raises requests.exceptions.RequestException: Если API недоступно
+    """
+    response = requests.get(f"{url}/{area_id}", timeout=timeout, headers={"User-Agent": "vacancy_analyzer/1.0"})
+    response.raise_for_status()
+    return response.json()
+
+
+class ShardedHarvester:
+    """
+    Полная выгрузка широкого запроса в обход ограничения HH в 2000 вакансий
+
+    Запрос делится на шарды по дереву регионов: регион, в котором найдено
+    больше max_results вакансий, заменяется дочерними. Если регион дальше не
+    делится (город), его результат делится пополам по дате публикации
+    (date_from/date_to) до тех пор, пока половина не поместится в окно или
+    интервал не станет короче min_window. Количество вакансий каждого шарда
+    узнаётся запросом с per_page=1 (count_vacancies), шарды одного уровня
+    считаются параллельно.
+
+    Вакансия может быть привязана к самому региону, а не к одному из его
+    дочерних (например, к области без указания города). Если количество в
+    родительском регионе больше суммы по дочерним (больше чем на
+    gap_tolerance), догружается только разница: родительский регион делится
+    по дате публикации на шарды-остатки, для каждого из которых считаются и
+    вакансии дочерних регионов за тот же интервал. Интервалы без расхождения
+    отбрасываются, а интервал с расхождением загружается, когда помещается в
+    окно и повторов (вакансий дочерних регионов) в нём не больше, чем
+    недостающих, иначе делится дальше. Так повторно загружаются только
+    интервалы вокруг недостающих вакансий, а не весь регион.
+
+    Затем шарды загружаются параллельно в пуле потоков, а вакансии
+    объединяются с отбрасыванием повторов по id (границы интервалов дат
+    пересекаются, вакансия может оказаться в нескольких шардах).
+
+    Делить по зарплате надёжно нельзя: параметр salary API отбирает вакансии,
+    вилка которых включает значение, а не диапазон, и вакансии без зарплаты
+    в такие корзины не попадают.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        area_tree: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        page_workers: int = 2,
+        max_results: int = MAX_RESULTS,
+        min_window: timedelta = timedelta(minutes=10),
+        now: Optional[datetime] = None,
+        gap_tolerance: int = 0,
+    ):
+        """
+        :param api: Клиент API с методами count_vacancies и iter_all_vacancies (HeadHunterAPI)
+        :param area_tree: Дерево регионов (по умолчанию загружается fetch_area_tree при первом запуске)
+        :param max_workers: Количество шардов, загружаемых одновременно
+        :param page_workers: Количество одновременно загружаемых страниц одного шарда
+        :param max_results: Окно выдачи API
+        :param min_window: Минимальный интервал дат шарда
+        :param now: Конец интервала дат по умолчанию (для воспроизводимости)
+        :param gap_tolerance: Расхождение счётчиков региона и дочерних регионов, которое не
+            догружается (счётчики HH приблизительны)
+        """
+        self.api = api
+        self.area_tree = area_tree
+        self.max_workers = max_workers
+        self.page_workers = page_workers
+        self.max_results = max_results
+        self.min_window = min_window
+        self.now = now
+        self.gap_tolerance = gap_tolerance
+
+    def plan(
+        self,
+        search_query: str,
+        extra_params: Optional[Dict[str, Any]] = None,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> List[Shard]:
+        """
+        Делит запрос на шарды
+
+        :param search_query: Поисковый запрос
+        :param extra_params: Дополнительные параметры запроса (area задаёт корневой регион)
+        :param stats: Словарь, в который записывается found - количество вакансий всего запроса
+        :return: Непустые шарды
+        """
+        if self.area_tree is None:
+            self.area_tree = fetch_area_tree()
+        params = dict(extra_params or {})
+        root = self.area_tree
+        if "area" in params:
+            root = _find_area(self.area_tree, str(params["area"])) or {"id": params["area"]}
+        params["area"] = root["id"]
+
+        shards: List[Shard] = []
+        root_shard = Shard(params, 0, area=root)
+        level = [root_shard]
+        with metrics.timer("harvest.plan") as timer, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while level:
+                counts = executor.map(lambda shard: self._count(search_query, shard), level)
+                for shard, (found, covered) in zip(level, counts):
+                    shard.found, shard.covered = found, covered
+                next_level = self._uncovered(level, shards)
+                for shard in level:
+                    found = shard.found
+                    if found == 0:
+                        continue
+                    if shard.covering is not None:
+                        self._plan_remainder(shard, shards, next_level)
+                    elif found <= self.max_results:
+                        shards.append(shard)
+                    else:
+                        children = self._split(shard)
+                        if children:
+                            next_level.extend(children)
+                        else:
+                            shard.truncated = True
+                            shards.append(shard)
+                level = next_level
+            timer.records = len(shards)
+        if stats is not None:
+            stats["found"] = root_shard.found
+        return shards
+
+    def iter_harvest(
+        self,
+        search_query: str,
+        extra_params: Optional[Dict[str, Any]] = None,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Загружает все вакансии запроса по шардам
+
+        Вакансии отдаются по мере загрузки шардов (порядок шардов не
+        сохраняется), каждая - один раз.
+
+        :param stats: Словарь для счётчиков shards, truncated, found (по счётчику всего запроса),
+            fetched, duplicates
+        :return: Итератор по данным вакансий
+        """
+        stats = {} if stats is None else stats
+        shards = self.plan(search_query, extra_params, stats)
+        stats.update(
+            shards=len(shards),
+            truncated=sum(shard.truncated for shard in shards),
+            fetched=0,
+            duplicates=0,
+        )
+        if not shards:
+            return
+
+        seen: Set[str] = set()
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(shards))))
+        try:
+            futures = [executor.submit(self._fetch, search_query, shard) for shard in shards]
+            for future in as_completed(futures):
+                for item in future.result():
+                    vacancy_id = item.get("id") if isinstance(item, dict) else None
+                    if vacancy_id is not None:
+                        if vacancy_id in seen:
+                            stats["duplicates"] += 1
+                            continue
+                        seen.add(vacancy_id)
+                    stats["fetched"] += 1
+                    yield item
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def harvest(
+        self, search_query: str, extra_params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict], Dict[str, int]]:
+        """Загружает все вакансии запроса списком (см. iter_harvest)"""
+        stats: Dict[str, int] = {}
+        items = list(self.iter_harvest(search_query, extra_params, stats))
+        return items, stats
+
+    def _fetch(self, search_query: str, shard: Shard) -> List[Dict]:
+        """Загружает все страницы шарда (выполняется в рабочем потоке)"""
+        return list(
+            self.api.iter_all_vacancies(search_query, max_workers=self.page_workers, extra_params=shard.params)
+        )
+
+    def _count(self, search_query: str, shard: Shard) -> Tuple[int, int]:
+        """
+        Считает вакансии шарда (выполняется в рабочем потоке)
+
+        :return: Количество вакансий шарда и, для шарда-остатка, вакансий дочерних
+            регионов за тот же интервал дат
+        """
+        found = self.api.count_vacancies(search_query, shard.params)
+        if not shard.covering or not found:
+            return found, 0
+        dates = {key: shard.params[key] for key in ("date_from", "date_to") if key in shard.params}
+        covered = sum(self.api.count_vacancies(search_query, {**params, **dates}) for params in shard.covering)
+        return found, covered
+
+    def _plan_remainder(self, shard: Shard, shards: List[Shard], next_level: List[Shard]) -> None:
+        """Загружает шард-остаток, делит его дальше по дате или отбрасывает, если расхождения нет"""
+        gap = shard.found - shard.covered
+        if gap <= self.gap_tolerance:
+            return
+        if shard.found <= self.max_results and shard.covered <= gap:
+            shards.append(shard)
+            return
+        halves = self._split_by_date(shard)
+        if halves:
+            next_level.extend(halves)
+        else:
+            shard.truncated = shard.found > self.max_results
+            shards.append(shard)
+
+    def _uncovered(self, level: List[Shard], shards: List[Shard]) -> List[Shard]:
+        """
+        Создаёт шарды-остатки для регионов, вакансии которых не покрыты дочерними регионами
+
+        :param level: Посчитанные шарды уровня
+        :param shards: Итоговые шарды (сюда попадает регион, который нельзя поделить по дате)
+        :return: Шарды следующего уровня
+        """
+        covered: Dict[int, int] = {}
+        parents: Dict[int, Shard] = {}
+        for shard in level:
+            if shard.parent is not None:
+                covered[id(shard.parent)] = covered.get(id(shard.parent), 0) + shard.found
+                parents[id(shard.parent)] = shard.parent
+
+        next_level: List[Shard] = []
+        for key, parent in parents.items():
+            if parent.found - covered[key] <= self.gap_tolerance:
+                continue
+            covering = [{**parent.params, "area": child["id"]} for child in parent.area["areas"]]
+            halves = self._split_by_date(Shard(parent.params, parent.found, covering=covering))
+            if halves:
+                next_level.extend(halves)
+            else:
+                shards.append(Shard(parent.params, parent.found, truncated=True))
+        return next_level
+
+    def _split(self, shard: Shard) -> List[Shard]:
+        """Делит шард по дочерним регионам, а если их нет - пополам по дате публикации"""
+        children = (shard.area or {}).get("areas") or []
+        if children:
+            return [Shard({**shard.params, "area": child["id"]}, 0, area=child, parent=shard) for child in children]
+        return self._split_by_date(shard)
+
+    def _split_by_date(self, shard: Shard) -> List[Shard]:
+        """Делит шард пополам по дате публикации (пустой список, если интервал короче min_window)"""
+        date_from, date_to = self._window(shard.params)
+        if date_to - date_from <= self.min_window:
+            return []
+        middle = date_from + (date_to - date_from) / 2
+        return [
+            Shard(
+                {**shard.params, "date_from": _format_date(start), "date_to": _format_date(end)},
+                0,
+                covering=shard.covering,
+            )
+            for start, end in ((date_from, middle), (middle, date_to))
+        ]
+
+    def _window(self, params: Dict[str, Any]) -> Tuple[datetime, datetime]:
+        """Интервал дат шарда (по умолчанию - период поиска HH до текущего момента)"""
+        date_to = parse_hh_date(params.get("date_to")) or self.now or datetime.now(timezone.utc)
+        date_from = parse_hh_date(params.get("date_from")) or date_to - SEARCH_PERIOD
+        return date_from, date_to
+
+
+def _find_area(node: Dict[str, Any], area_id: str) -> Optional[Dict[str, Any]]:
+    """Ищет регион в дереве по id"""
+    if str(node.get("id")) == area_id:
+        return node
+    for child in node.get("areas") or []:
+        found = _find_area(child, area_id)
+        if found is not None:
+            return found
+    return None
+
+
+def _format_date(value: datetime) -> str:
+    """Дата в формате API HH (с точностью до секунды)"""
+    return value.strftime(HH_DATE_FORMAT)
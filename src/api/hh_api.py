@@ -1,23 +1,83 @@
+import threading
+import time
 import requests
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, List, Optional
 from src.api.abstract_api import AbstractAPI
+from src.api.cache import ResponseCache
+from src.utils.metrics import metrics
+
+BASE_URL = "https://api.hh.ru/vacancies"
+
+# HH отдаёт не более 2000 вакансий на один поисковый запрос (page * per_page)
+MAX_RESULTS = 2000
 
 
 class HeadHunterAPI(AbstractAPI):
     """Класс для работы с API HeadHunter"""
 
-    def __init__(self):
-        self.__base_url = "https://api.hh.ru/vacancies"
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        pool_size: int = 10,
+        timeout: float = 10.0,
+        check_connection: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        :param base_url: Адрес метода поиска вакансий
+        :param pool_size: Размер пула keep-alive соединений сессии
+        :param timeout: Таймаут одного запроса в секундах
+        :param check_connection: Сразу проверить доступность API
+        :param cache: Кэш ответов (по умолчанию запросы не кэшируются)
+        """
+        self.__base_url = base_url
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self.cache = cache
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
         self._connect_to_api()
+        if check_connection:
+            self.check_connection()
 
     def _connect_to_api(self) -> None:
-        """Подключение к API HH.ru"""
-        response = requests.get(self.__base_url)
+        """Подключение к API HH.ru: создаёт HTTP-сессию с пулом соединений (без сетевых запросов)"""
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers["User-Agent"] = "vacancy_analyzer/1.0"
+
+    def check_connection(self) -> None:
+        """Проверяет доступность API минимальным запросом (одна вакансия на странице)"""
+        response = self._get({"per_page": 1})
         if response.status_code != 200:
             raise ConnectionError(
                 f"Ошибка подключения к API HH. Код: {response.status_code}"
             )
 
+    def close(self) -> None:
+        """Закрывает HTTP-сессию"""
+        self._session.close()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Возвращает счётчики запросов к API
+
+        :return: Количество запросов и ошибок, суммарное и среднее время ответа в секундах
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_time"] = stats["total_time"] / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        """Сбрасывает счётчики запросов"""
+        with self._stats_lock:
+            self._stats = {"requests": 0, "errors": 0, "total_time": 0.0}
+
     def get_vacancies(self, search_query: str, per_page: int = 100) -> List[Dict]:
         """
         Получение вакансий с HH.ru
@@ -26,14 +86,139 @@ class HeadHunterAPI(AbstractAPI):
         :param per_page: Количество вакансий
         :return: Список вакансий
         """
+        params = self._build_params(search_query, per_page)
+
+        return self._get_json(params).get("items", [])
+
+    def count_vacancies(self, search_query: str, extra_params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Количество вакансий по запросу (поле "found" без загрузки страниц)
+
+        :param search_query: Поисковый запрос
+        :param extra_params: Дополнительные параметры запроса к API
+        :return: Количество найденных вакансий
+        """
+        params = self._build_params(search_query, 1, extra_params)
+        return int(self._fetch_page(params, 0).get("found", 0))
+
+    def iter_all_vacancies(
+        self,
+        search_query: str,
+        per_page: int = 100,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Постраничное получение всех вакансий по запросу
+
+        Первая страница запрашивается сразу, по её полю "pages" остальные
+        страницы загружаются параллельно в пуле потоков. Вакансии отдаются
+        единым потоком в порядке страниц.
+
+        :param search_query: Поисковый запрос
+        :param per_page: Количество вакансий на странице
+        :param max_workers: Максимальное число одновременных запросов
+        :param max_pages: Ограничение на количество загружаемых страниц
+        :param extra_params: Дополнительные параметры запроса к API
+        :return: Итератор по вакансиям
+        """
+        params = self._build_params(search_query, per_page, extra_params)
+
+        first_page = self._fetch_page(params, 0)
+        yield from first_page.get("items", [])
+
+        pages = min(first_page.get("pages", 1), -(-MAX_RESULTS // per_page))
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+        if pages <= 1:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, pages - 1)))
+        try:
+            for data in executor.map(lambda page: self._fetch_page(params, page), range(1, pages)):
+                yield from data.get("items", [])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_all_vacancies(self, search_query: str, per_page: int = 100, **kwargs: Any) -> List[Dict]:
+        """Получение всех страниц результатов списком (см. iter_all_vacancies)"""
+        return list(self.iter_all_vacancies(search_query, per_page, **kwargs))
+
+    def _build_params(
+        self, search_query: str, per_page: int, extra_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Формирует параметры поискового запроса"""
         params = {
             "text": search_query,
             "per_page": per_page,
             "area": 113,  # Россия
             "only_with_salary": False,  # Разрешаем вакансии без зарплаты
         }
+        if extra_params:
+            params.update(extra_params)
+        return params
+
+    def _fetch_page(self, params: Dict[str, Any], page: int) -> Dict:
+        """Загружает одну страницу результатов"""
+        data = self._get_json({**params, "page": page})
+        metrics.increment("api.items", len(data.get("items", ())))
+        return data
+
+    def _get_json(self, params: Dict[str, Any]) -> Dict:
+        """Выполняет запрос и возвращает разобранный JSON, используя кэш при его наличии"""
+        if self.cache is None:
+            response = self._get(params)
+            response.raise_for_status()
+            return response.json()
+
+        key = self.cache.make_key(params)
+        entry = self.cache.lookup(key)
+        if entry is not None and entry["fresh"]:
+            metrics.increment("api.cache_hits")
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._get(params, headers=headers or None)
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidate(key, entry)
+            metrics.increment("api.cache_revalidated")
+            return entry["body"]
 
-        response = requests.get(self.__base_url, params=params)
         response.raise_for_status()
+        body = response.json()
+        self.cache.put(key, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return body
+
+    def _get(self, params: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Выполняет GET-запрос через сессию и учитывает его в счётчиках"""
+        started = time.perf_counter()
+        try:
+            response = self._session.get(
+                self.__base_url, params=params, headers=headers, timeout=self._timeout
+            )
+        except requests.exceptions.RequestException:
+            self._record(time.perf_counter() - started, error=True)
+            metrics.increment("api.errors")
+            raise
+        elapsed = time.perf_counter() - started
+        self._record(elapsed, error=response.status_code >= 400)
+        if metrics.enabled:
+            metrics.observe("api.request", elapsed, size=len(response.content))
+            if response.status_code >= 400:
+                metrics.increment("api.errors")
+        return response
 
-        return response.json().get("items", [])
+    def _record(self, elapsed: float, error: bool) -> None:
+        """Обновляет счётчики запросов"""
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            self._stats["total_time"] += elapsed
+            if error:
+                self._stats["errors"] += 1
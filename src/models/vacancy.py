@@ -1,8 +1,14 @@
-from dataclasses import dataclass, asdict, field
-from typing import Optional, Dict, Any
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from src.utils.metrics import metrics
 
+# __slots__ для dataclass поддерживаются начиная с Python 3.10
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Salary:
     """Класс для представления информации о зарплате.
 
@@ -10,14 +16,43 @@ class Salary:
         from_ (Optional[int]): Нижняя граница вилки зарплаты. None если не указана.
         to (Optional[int]): Верхняя граница вилки зарплаты. None если не указана.
         currency (Optional[str]): Валюта зарплаты (например, "RUR"). None если не указана.
+        from_base (Optional[float]): Нижняя граница в базовой валюте (см. src.utils.currency).
+            None если зарплата не нормализована или граница не указана.
+        to_base (Optional[float]): Верхняя граница в базовой валюте.
     """
 
     from_: Optional[int] = field(default=None)
     to: Optional[int] = field(default=None)
     currency: Optional[str] = field(default=None)
+    from_base: Optional[float] = field(default=None)
+    to_base: Optional[float] = field(default=None)
+
+    @property
+    def normalized(self) -> bool:
+        """Пересчитана ли зарплата в базовую валюту."""
+        return self.from_base is not None or self.to_base is not None
+
+    @classmethod
+    def shared(
+        cls,
+        from_: Optional[int] = None,
+        to: Optional[int] = None,
+        currency: Optional[str] = None,
+        from_base: Optional[float] = None,
+        to_base: Optional[float] = None,
+    ) -> "Salary":
+        """Возвращает общий объект Salary для одинаковых вилок.
+
+        Объекты неизменяемы, поэтому одинаковые вилки разделяют один экземпляр
+        из кэша модели (как при разборе данных API).
+
+        Returns:
+            Salary: Общий объект зарплаты.
+        """
+        return _shared_salary(from_, to, currency, from_base, to_base)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Employer:
     """Класс для представления информации о работодателе.
 
@@ -28,7 +63,7 @@ class Employer:
     name: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Area:
     """Класс для представления географического региона.
 
@@ -39,7 +74,7 @@ class Area:
     name: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Experience:
     """Класс для представления требуемого опыта работы.
 
@@ -50,7 +85,7 @@ class Experience:
     name: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Employment:
     """Класс для представления типа занятости.
 
@@ -61,7 +96,7 @@ class Employment:
     name: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Snippet:
     """Класс для представления описания вакансии и требований.
 
@@ -74,7 +109,88 @@ class Snippet:
     responsibility: Optional[str] = field(default=None)
 
 
-@dataclass
+# Повторяющиеся значения (вилка зарплаты, регион, работодатель, опыт, занятость)
+# разделяются между вакансиями: неизменяемые объекты берутся из кэша,
+# а их строки интернируются.
+_SHARED_CACHE_SIZE = 65536
+
+
+def _intern(value: Any) -> Any:
+    """Интернирует строку (прочие значения возвращает без изменений)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _shared(maxsize: Optional[int]) -> Any:
+    """
+    Декоратор фабрики общих объектов: lru_cache с откатом на прямое создание
+
+    Кэш различает типы аргументов (typed=True), поэтому вилки 1 и 1.0 не
+    делят один объект. Если в данных API оказалось нехэшируемое значение
+    (например, список вместо кода валюты), объект создаётся без кэша, как
+    до появления разделения объектов.
+    """
+
+    def decorator(factory: Any) -> Any:
+        cached = lru_cache(maxsize=maxsize, typed=True)(factory)
+
+        @wraps(factory)
+        def wrapper(*args: Any) -> Any:
+            try:
+                return cached(*args)
+            except TypeError:
+                return factory(*args)
+
+        wrapper.cache_clear = cached.cache_clear
+        wrapper.cache_info = cached.cache_info
+        return wrapper
+
+    return decorator
+
+
+@_shared(maxsize=_SHARED_CACHE_SIZE)
+def _shared_salary(
+    from_: Optional[int],
+    to: Optional[int],
+    currency: Optional[str],
+    from_base: Optional[float] = None,
+    to_base: Optional[float] = None,
+) -> Salary:
+    """Общий объект Salary для одинаковых вилок"""
+    return Salary(from_=from_, to=to, currency=_intern(currency), from_base=from_base, to_base=to_base)
+
+
+@_shared(maxsize=_SHARED_CACHE_SIZE)
+def _shared_employer(name: str) -> Employer:
+    """Общий объект Employer для одного работодателя"""
+    return Employer(name=_intern(name))
+
+
+@_shared(maxsize=None)
+def _shared_area(name: str) -> Area:
+    """Общий объект Area для одного региона"""
+    return Area(name=_intern(name))
+
+
+@_shared(maxsize=None)
+def _shared_experience(name: str) -> Experience:
+    """Общий объект Experience для одного уровня опыта"""
+    return Experience(name=_intern(name))
+
+
+@_shared(maxsize=None)
+def _shared_employment(name: str) -> Employment:
+    """Общий объект Employment для одного типа занятости"""
+    return Employment(name=_intern(name))
+
+
+def _named(data: Any, factory: Any) -> Any:
+    """Создаёт объект из словаря вида {"name": ...} или возвращает None"""
+    if isinstance(data, dict) and "name" in data:
+        return factory(str(data["name"]))
+    return None
+
+
+@dataclass(**_SLOTS)
 class Vacancy:
     """Основной класс для представления вакансии.
 
@@ -118,6 +234,34 @@ class Vacancy:
         """
         return self.salary.to if self.salary else None
 
+    @property
+    def salary_from_base(self) -> Optional[float]:
+        """Возвращает нижнюю границу зарплаты в базовой валюте.
+
+        Для ненормализованной зарплаты возвращается исходное значение.
+
+        Returns:
+            Optional[float]: Значение зарплаты "от" или None если не указано.
+        """
+        salary = self.salary
+        if salary is None:
+            return None
+        return salary.from_base if salary.normalized else salary.from_
+
+    @property
+    def salary_to_base(self) -> Optional[float]:
+        """Возвращает верхнюю границу зарплаты в базовой валюте.
+
+        Для ненормализованной зарплаты возвращается исходное значение.
+
+        Returns:
+            Optional[float]: Значение зарплаты "до" или None если не указано.
+        """
+        salary = self.salary
+        if salary is None:
+            return None
+        return salary.to_base if salary.normalized else salary.to
+
     @property
     def salary_currency(self) -> Optional[str]:
         """Возвращает валюту зарплаты.
@@ -133,7 +277,91 @@ class Vacancy:
         Returns:
             Dict[str, Any]: Словарь с данными вакансии.
         """
-        return asdict(self)
+        salary, area, employer = self.salary, self.area, self.employer
+        experience, employment, snippet = self.experience, self.employment, self.snippet
+        # Поля перечислены явно: это в разы быстрее dataclasses.asdict, результат тот же
+        return {
+            "id": self.id,
+            "name": self.name,
+            "salary": None
+            if salary is None
+            else {
+                "from_": salary.from_,
+                "to": salary.to,
+                "currency": salary.currency,
+                "from_base": salary.from_base,
+                "to_base": salary.to_base,
+            },
+            "area": None if area is None else {"name": area.name},
+            "employer": None if employer is None else {"name": employer.name},
+            "experience": None if experience is None else {"name": experience.name},
+            "employment": None if employment is None else {"name": employment.name},
+            "snippet": None
+            if snippet is None
+            else {"requirement": snippet.requirement, "responsibility": snippet.responsibility},
+            "alternate_url": self.alternate_url,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Vacancy":
+        """Восстанавливает объект Vacancy из словаря, полученного через to_dict().
+
+        Также принимает словари в формате API HeadHunter (ключ "from" у зарплаты).
+
+        Args:
+            data (Dict[str, Any]): Словарь с данными вакансии.
+
+        Returns:
+            Vacancy: Объект вакансии.
+
+        Raises:
+            ValueError: Если данные не содержат обязательных полей или имеют неверный формат.
+        """
+        return cls.from_hh_data(data)
+
+    @classmethod
+    def from_parts(
+        cls,
+        id: str,
+        name: str,
+        salary: Optional[Salary] = None,
+        area: Optional[str] = None,
+        employer: Optional[str] = None,
+        experience: Optional[str] = None,
+        employment: Optional[str] = None,
+        snippet: Optional[Snippet] = None,
+        alternate_url: Optional[str] = None,
+    ) -> "Vacancy":
+        """Создает объект Vacancy из готовых значений полей.
+
+        Регион, работодатель, опыт и занятость передаются названиями и, как
+        при разборе данных API, разделяются через кэши модели.
+
+        Args:
+            id (str): Идентификатор вакансии.
+            name (str): Название вакансии.
+            salary (Optional[Salary]): Зарплата (например, из Salary.shared).
+            area (Optional[str]): Название региона.
+            employer (Optional[str]): Название работодателя.
+            experience (Optional[str]): Требуемый опыт.
+            employment (Optional[str]): Тип занятости.
+            snippet (Optional[Snippet]): Описание и требования.
+            alternate_url (Optional[str]): Ссылка на вакансию.
+
+        Returns:
+            Vacancy: Объект вакансии.
+        """
+        return cls(
+            id=id,
+            name=name,
+            salary=salary,
+            area=None if area is None else _shared_area(area),
+            employer=None if employer is None else _shared_employer(employer),
+            experience=None if experience is None else _shared_experience(experience),
+            employment=None if employment is None else _shared_employment(employment),
+            snippet=snippet,
+            alternate_url=alternate_url,
+        )
 
     @classmethod
     def from_hh_data(cls, data: Dict[str, Any]) -> "Vacancy":
@@ -155,41 +383,21 @@ class Vacancy:
             raise ValueError("Vacancy must have 'id' and 'name' fields")
 
         salary = None
-        if "salary" in data and isinstance(data["salary"], dict):
-            salary_data = data["salary"]
-            salary = Salary(
-                from_=salary_data.get("from"),
-                to=salary_data.get("to"),
-                currency=salary_data.get("currency"),
+        salary_data = data.get("salary")
+        if isinstance(salary_data, dict):
+            salary = _shared_salary(
+                # "from" - формат API, "from_" - формат to_dict()
+                salary_data["from"] if "from" in salary_data else salary_data.get("from_"),
+                salary_data.get("to"),
+                salary_data.get("currency"),
+                # Нормализованные значения есть только в сохранённых вакансиях
+                salary_data.get("from_base"),
+                salary_data.get("to_base"),
             )
 
-        employer = None
-        if "employer" in data and isinstance(data["employer"], dict):
-            employer_data = data["employer"]
-            if "name" in employer_data:
-                employer = Employer(name=str(employer_data["name"]))
-
-        area = None
-        if "area" in data and isinstance(data["area"], dict):
-            area_data = data["area"]
-            if "name" in area_data:
-                area = Area(name=str(area_data["name"]))
-
-        experience = None
-        if "experience" in data and isinstance(data["experience"], dict):
-            experience_data = data["experience"]
-            if "name" in experience_data:
-                experience = Experience(name=str(experience_data["name"]))
-
-        employment = None
-        if "employment" in data and isinstance(data["employment"], dict):
-            employment_data = data["employment"]
-            if "name" in employment_data:
-                employment = Employment(name=str(employment_data["name"]))
-
         snippet = None
-        if "snippet" in data and isinstance(data["snippet"], dict):
-            snippet_data = data["snippet"]
+        snippet_data = data.get("snippet")
+        if isinstance(snippet_data, dict):
             snippet = Snippet(
                 requirement=snippet_data.get("requirement"),
                 responsibility=snippet_data.get("responsibility"),
@@ -199,14 +407,43 @@ class Vacancy:
             id=str(data["id"]),
             name=str(data["name"]),
             salary=salary,
-            area=area,
-            employer=employer,
-            experience=experience,
-            employment=employment,
+            area=_named(data.get("area"), _shared_area),
+            employer=_named(data.get("employer"), _shared_employer),
+            experience=_named(data.get("experience"), _shared_experience),
+            employment=_named(data.get("employment"), _shared_employment),
             snippet=snippet,
             alternate_url=data.get("alternate_url"),
         )
 
+    @classmethod
+    def from_hh_data_many(
+        cls, items: Iterable[Any], errors: Optional[List[Tuple[int, str]]] = None
+    ) -> List["Vacancy"]:
+        """Пакетно создает объекты Vacancy из данных API HeadHunter.
+
+        Невалидные записи пропускаются.
+
+        Args:
+            items (Iterable[Any]): Данные вакансий от API.
+            errors (Optional[List[Tuple[int, str]]]): Список, в который добавляются
+                пары (номер записи, текст ошибки) для пропущенных записей.
+
+        Returns:
+            List[Vacancy]: Список объектов вакансий.
+        """
+        from_hh_data = cls.from_hh_data
+        vacancies: List[Vacancy] = []
+        append = vacancies.append
+        with metrics.timer("parse") as timer:
+            for position, item in enumerate(items):
+                try:
+                    append(from_hh_data(item))
+                except (ValueError, TypeError) as e:
+                    if errors is not None:
+                        errors.append((position, str(e)))
+            timer.records = len(vacancies)
+        return vacancies
+
     def __str__(self) -> str:
         """Возвращает строковое представление вакансии.
 
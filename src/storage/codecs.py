@@ -0,0 +1,131 @@
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson - необязательная зависимость
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack - необязательная зависимость
+    msgpack = None
+
+
+class JSONCodec:
+    """Кодек на стандартном модуле json"""
+
+    name = "json"
+
+    def dumps(self, data: Any, compact: bool = True) -> bytes:
+        """Кодирует данные в UTF-8 JSON (compact - без отступов и лишних пробелов)"""
+        if compact:
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=4)
+        return text.encode("utf-8")
+
+    def loads(self, raw: bytes) -> Any:
+        """Декодирует JSON"""
+        return json.loads(raw)
+
+    def dumps_records(self, records: Sequence[Any], compact: bool = True) -> Tuple[bytes, List[Tuple[int, int]]]:
+        """
+        Кодирует массив записей так же, как dumps, и возвращает границы каждой записи
+
+        Записи кодируются по отдельности и склеиваются, поэтому смещения
+        известны без повторного разбора результата (см. MappedVacancyReader).
+
+        :return: Закодированный массив и список пар (начало, конец) записей
+        """
+        if not records:
+            return self.dumps([], compact), []
+        if compact:
+            opening, separator, closing = b"[", b",", b"]"
+            parts = [self.dumps(record) for record in records]
+        else:
+            # Отступ вложенной записи на один уровень глубже: переносы строк
+            # встречаются только между токенами, внутри строк JSON они экранированы
+            opening, separator, closing = b"[\n    ", b",\n    ", b"\n]"
+            parts = [self.dumps(record, compact=False).replace(b"\n", b"\n    ") for record in records]
+
+        spans = []
+        position = len(opening)
+        for part in parts:
+            spans.append((position, position + len(part)))
+            position += len(part) + len(separator)
+        return opening + separator.join(parts) + closing, spans
+
+
+class OrjsonCodec(JSONCodec):
+    """Кодек на orjson (используется по умолчанию, если orjson установлен)"""
+
+    name = "orjson"
+
+    def dumps(self, data: Any, compact: bool = True) -> bytes:
+        """Кодирует данные в компактный JSON; для отступов используется стандартный json"""
+        if not compact:
+            # orjson поддерживает только отступ в 2 пробела, а формат файла - 4
+            return super().dumps(data, compact=False)
+        return orjson.dumps(data)
+
+    def loads(self, raw: bytes) -> Any:
+        """Декодирует JSON"""
+        return orjson.loads(raw)
+
+
+class MsgpackCodec:
+    """Двоичный кодек msgpack для снимков (не JSON, только для write/read_snapshot)"""
+
+    name = "msgpack"
+
+    def dumps(self, data: Any, compact: bool = True) -> bytes:
+        """Кодирует данные в msgpack"""
+        return msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, raw: bytes) -> Any:
+        """Декодирует msgpack"""
+        return msgpack.unpackb(raw, raw=False)
+
+
+def available_codecs() -> Dict[str, Any]:
+    """Возвращает установленные кодеки по именам"""
+    codecs: Dict[str, Any] = {"json": JSONCodec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+    if msgpack is not None:
+        codecs["msgpack"] = MsgpackCodec()
+    return codecs
+
+
+def get_codec(name: Optional[str] = None) -> Any:
+    """
+    Возвращает кодек по имени
+
+    :param name: "json", "orjson", "msgpack" или None - самый быстрый JSON-кодек из установленных
+    :raises ValueError: Если кодек неизвестен или его библиотека не установлена
+    """
+    codecs = available_codecs()
+    if name is None:
+        return codecs.get("orjson", codecs["json"])
+    if name not in codecs:
+        raise ValueError(f"Codec '{name}' is not available")
+    return codecs[name]
+
+
+def write_snapshot(path: str, data: Any, codec: Optional[str] = None) -> int:
+    """
+    Записывает снимок данных в файл выбранным кодеком
+
+    :return: Размер файла в байтах
+    """
+    raw = get_codec(codec).dumps(data)
+    with open(path, "wb") as file:
+        file.write(raw)
+    return len(raw)
+
+
+def read_snapshot(path: str, codec: Optional[str] = None) -> Any:
+    """Читает снимок, записанный write_snapshot тем же кодеком"""
+    with open(path, "rb") as file:
+        return get_codec(codec).loads(file.read())
@@ -0,0 +1,82 @@
+from typing import Dict, Optional
+from src.models.vacancy import Vacancy
+
+# Поддерживаемые ключи словаря criteria для AbstractStorage.get_vacancies
+CRITERIA_KEYS = frozenset(
+    {"id", "employer", "area", "currency", "salary_from", "salary_to", "keywords"}
+)
+
+
+def validate_criteria(criteria: Optional[Dict]) -> Dict:
+    """
+    Проверяет словарь критериев и возвращает его (пустой словарь вместо None)
+
+    Поддерживаемые ключи:
+        id - идентификатор вакансии;
+        employer - точное название работодателя;
+        area - точное название региона;
+        currency - код валюты зарплаты;
+        salary_from - минимальная нижняя граница зарплаты (salary_from >= значения);
+        salary_to - максимальная верхняя граница зарплаты (salary_to <= значения);
+        keywords - список слов, каждое из которых должно встречаться в тексте вакансии
+            как подстрока без учёта регистра и различия "ё" и "е".
+
+    :param criteria: Словарь критериев или None
+    :return: Словарь критериев
+    """
+    if criteria is None:
+        return {}
+    if not isinstance(criteria, dict):
+        raise ValueError("Criteria must be a dictionary")
+
+    unknown = set(criteria) - CRITERIA_KEYS
+    if unknown:
+        raise ValueError(f"Unknown criteria: {', '.join(sorted(unknown))}")
+    return criteria
+
+
+def normalize_text(text: str) -> str:
+    """
+    Приводит текст к виду для поиска по ключевым словам: нижний регистр, "ё" -> "е"
+
+    Одно правило для всех хранилищ и индекса слов, поэтому ответ не зависит
+    от того, использовался ли индекс.
+    """
+    return text.lower().replace("ё", "е")
+
+
+def vacancy_text(vacancy: Vacancy) -> str:
+    """Возвращает текст вакансии для поиска по ключевым словам (см. normalize_text)"""
+    snippet = vacancy.snippet
+    return normalize_text(
+        f"{vacancy.name} "
+        f"{(snippet.requirement if snippet else None) or ''} "
+        f"{(snippet.responsibility if snippet else None) or ''}"
+    )
+
+
+def match_criteria(vacancy: Vacancy, criteria: Optional[Dict]) -> bool:
+    """Проверяет, удовлетворяет ли вакансия критериям"""
+    criteria = validate_criteria(criteria)
+
+    if "id" in criteria and vacancy.id != str(criteria["id"]):
+        return False
+    if "employer" in criteria and (
+        not vacancy.employer or vacancy.employer.name != criteria["employer"]
+    ):
+        return False
+    if "area" in criteria and (not vacancy.area or vacancy.area.name != criteria["area"]):
+        return False
+    if "currency" in criteria and vacancy.salary_currency != criteria["currency"]:
+        return False
+    if "salary_from" in criteria and (vacancy.salary_from or 0) < criteria["salary_from"]:
+        return False
+    if "salary_to" in criteria and (
+        vacancy.salary_to is None or vacancy.salary_to > criteria["salary_to"]
+    ):
+        return False
+    if criteria.get("keywords"):
+        text = vacancy_text(vacancy)
+        if not all(normalize_text(word) in text for word in criteria["keywords"]):
+            return False
+    return True
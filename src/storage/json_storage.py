@@ -1,29 +1,367 @@
 import json
 import os
-from typing import List, Dict, Union
+import tempfile
+import time
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Union, Iterable, Optional, Set, Tuple
+from src.models.vacancy import Vacancy
+from src.storage.abstract_storage import AbstractStorage
+from src.storage.codecs import get_codec
+from src.storage.criteria import normalize_text, validate_criteria, vacancy_text
+from src.storage.locking import fsync_directory, locked_file
+from src.storage.mmap_reader import MappedVacancyReader, save_offsets
+from src.utils.metrics import metrics
 
 
-class JSONStorage:
-    """Класс для работы с JSON-хранилищем вакансий"""
+def _read_umask() -> int:
+    """
+    Текущая маска прав процесса
 
-    def __init__(self, file_path: str = "data/vacancies.json"):
+    os.umask позволяет узнать маску, только временно заменив её для всего
+    процесса, поэтому она читается один раз при импорте модуля.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+class StorageCorruptedError(ValueError):
+    """Файл хранилища повреждён (некорректный JSON)"""
+
+
+class _StorageIndex:
+    """
+    Индексы по содержимому файла хранилища для get_vacancies
+
+    Хэш-индексы по id, работодателю, региону и валюте, отсортированные
+    массивы границ зарплаты и (лениво) тексты вакансий в нижнем регистре
+    для поиска по ключевым словам.
+    """
+
+    def __init__(self, records: List[Dict]):
+        self.vacancies: List[Vacancy] = []
+        for record in records:
+            try:
+                self.vacancies.append(Vacancy.from_dict(record))
+            except (ValueError, TypeError):
+                continue
+
+        self.by_id: Dict[str, int] = {}
+        self.by_employer: Dict[str, List[int]] = {}
+        self.by_area: Dict[str, List[int]] = {}
+        self.by_currency: Dict[str, List[int]] = {}
+        from_pairs = []
+        to_pairs = []
+        for position, vacancy in enumerate(self.vacancies):
+            self.by_id.setdefault(vacancy.id, position)
+            if vacancy.employer:
+                self.by_employer.setdefault(vacancy.employer.name, []).append(position)
+            if vacancy.area:
+                self.by_area.setdefault(vacancy.area.name, []).append(position)
+            if vacancy.salary_currency is not None:
+                self.by_currency.setdefault(vacancy.salary_currency, []).append(position)
+            # Семантика границ как в match_criteria: "от" или 0, "до" только указанная
+            from_pairs.append((vacancy.salary_from or 0, position))
+            if vacancy.salary_to is not None:
+                to_pairs.append((vacancy.salary_to, position))
+
+        from_pairs.sort()
+        to_pairs.sort()
+        self.from_values = [value for value, _ in from_pairs]
+        self.from_positions = [position for _, position in from_pairs]
+        self.to_values = [value for value, _ in to_pairs]
+        self.to_positions = [position for _, position in to_pairs]
+        self._texts: Optional[List[str]] = None
+
+    @property
+    def texts(self) -> List[str]:
+        """Тексты вакансий для поиска (строятся при первом запросе по ключевым словам)"""
+        if self._texts is None:
+            self._texts = [vacancy_text(vacancy) for vacancy in self.vacancies]
+        return self._texts
+
+    def query(self, criteria: Dict) -> List[Vacancy]:
+        """Отбирает вакансии по критериям через индексы"""
+        if not criteria:
+            return list(self.vacancies)
+
+        candidates: List[Set[int]] = []
+        if "id" in criteria:
+            position = self.by_id.get(str(criteria["id"]))
+            candidates.append(set() if position is None else {position})
+        for key, index in (
+            ("employer", self.by_employer),
+            ("area", self.by_area),
+            ("currency", self.by_currency),
+        ):
+            if key in criteria:
+                candidates.append(set(index.get(criteria[key], ())))
+        if "salary_from" in criteria:
+            start = bisect_left(self.from_values, criteria["salary_from"])
+            candidates.append(set(self.from_positions[start:]))
+        if "salary_to" in criteria:
+            end = bisect_right(self.to_values, criteria["salary_to"])
+            candidates.append(set(self.to_positions[:end]))
+
+        candidates.sort(key=len)
+        if candidates:
+            positions = candidates[0]
+            for other in candidates[1:]:
+                positions = positions & other
+            positions = sorted(positions)
+        else:
+            positions = range(len(self.vacancies))
+
+        keywords = criteria.get("keywords")
+        if keywords:
+            # Поиск подстроки по уже суженному набору кандидатов
+            words = [normalize_text(word) for word in keywords]
+            texts = self.texts
+            positions = [p for p in positions if all(word in texts[p] for word in words)]
+        return [self.vacancies[position] for position in positions]
+
+
+class JSONStorage(AbstractStorage):
+    """
+    Класс для работы с JSON-хранилищем вакансий
+
+    Запись выполняется через временный файл, fsync и атомарную замену, а
+    чтение-изменение-запись защищено блокировкой <файл>.lock, поэтому с одним
+    хранилищем могут работать несколько процессов. В режиме journal пакеты
+    сначала дописываются в журнал <файл>.journal, а затем тот процесс, который
+    первым получил блокировку, переносит в хранилище все накопившиеся пакеты
+    разом (групповая фиксация).
+    """
+
+    def __init__(
+        self,
+        file_path: str = "data/vacancies.json",
+        compact: bool = False,
+        codec: Optional[str] = None,
+        journal: bool = False,
+    ):
+        """
+        :param file_path: Путь к файлу хранилища
+        :param compact: Записывать JSON без отступов (файл меньше, запись быстрее)
+        :param codec: JSON-кодек ("json" или "orjson"), по умолчанию самый быстрый из установленных
+        :param journal: Групповая фиксация пакетов через журнал (для параллельных процессов)
+        """
+        self._index: Optional[_StorageIndex] = None
+        self._index_signature: Optional[Tuple[int, int, int]] = None
         self.file_path = file_path
+        self.lock_path = f"{file_path}.lock"
+        self.journal_path = f"{file_path}.journal"
+        self.compact = compact
+        self.journal = journal
+        self._codec = get_codec(codec)
+        if self._codec.name not in ("json", "orjson"):
+            raise ValueError("JSONStorage supports only JSON codecs")
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
     def add_vacancy(self, vacancy: Union[Dict, object]) -> None:
-        """Добавляет вакансию в хранилище"""
+        """
+        Добавляет вакансию в хранилище
+
+        :raises ValueError: Если данные вакансии невалидны или файл хранилища повреждён
+            (ошибка повреждения передаётся без изменений)
+        """
         try:
             vacancy_dict = self._convert_to_dict(vacancy)
             self._validate_vacancy(vacancy_dict)
+        except (ValueError, AttributeError) as e:
+            raise ValueError(f"Invalid vacancy data: {str(e)}")
 
+        with locked_file(self.lock_path):
             vacancies = self._read_file()
             if not self._vacancy_exists(vacancies, vacancy_dict):
                 vacancies.append(vacancy_dict)
                 self._write_file(vacancies)
-        except (ValueError, AttributeError) as e:
-            raise ValueError(f"Invalid vacancy data: {str(e)}")
 
-    # ... остальные методы класса ...
+    def add_vacancies(self, vacancies: Iterable[Union[Dict, object]]) -> Dict[str, int]:
+        """
+        Пакетно добавляет вакансии в хранилище
+
+        Файл читается и записывается один раз на весь пакет, дубликаты
+        отсеиваются по множеству id.
+
+        В режиме journal счётчики относятся к групповой фиксации, выполненной
+        этим вызовом: в них могут войти пакеты других процессов, а если пакет
+        уже перенёс в хранилище другой процесс, добавленных будет 0.
+
+        :param vacancies: Вакансии (словари или объекты с to_dict())
+        :return: Словарь с количеством добавленных и пропущенных вакансий
+        """
+        records = []
+        invalid = 0
+        for vacancy in vacancies:
+            try:
+                vacancy_dict = self._convert_to_dict(vacancy)
+                self._validate_vacancy(vacancy_dict)
+            except (ValueError, AttributeError):
+                invalid += 1
+                continue
+            records.append(vacancy_dict)
+
+        if self.journal:
+            self._append_journal(records)
+            inserted, skipped = self.commit_journal()
+            return {"inserted": inserted, "skipped": skipped + invalid}
+
+        with locked_file(self.lock_path):
+            stored = self._read_file()
+            inserted, skipped = self._merge(stored, records)
+            if inserted:
+                self._write_file(stored)
+
+        return {"inserted": inserted, "skipped": skipped + invalid}
+
+    def upsert_vacancy(self, vacancy: Union[Dict, object]) -> None:
+        """Добавляет вакансию или заменяет существующую с тем же id"""
+        self.upsert_vacancies([vacancy])
+
+    def upsert_vacancies(self, vacancies: Iterable[Union[Dict, object]]) -> int:
+        """
+        Пакетно добавляет вакансии или заменяет существующие (одна запись файла)
+
+        Незафиксированный журнал сначала переносится в хранилище, чтобы
+        старые версии из него не перекрыли новые.
+
+        :return: Количество записанных вакансий
+        """
+        records = {}
+        for vacancy in vacancies:
+            vacancy_dict = self._convert_to_dict(vacancy)
+            self._validate_vacancy(vacancy_dict)
+            records[vacancy_dict["id"]] = vacancy_dict
+        if not records:
+            return 0
+        written = len(records)
+
+        if self.journal:
+            self.commit_journal()
+        with locked_file(self.lock_path):
+            stored = self._read_file()
+            for position, stored_vacancy in enumerate(stored):
+                replacement = records.pop(stored_vacancy.get("id"), None)
+                if replacement is not None:
+                    stored[position] = replacement
+            stored.extend(records.values())
+            self._write_file(stored)
+        return written
+
+    def stage_vacancies(self, vacancies: Iterable[Union[Dict, object]]) -> Tuple[int, int]:
+        """
+        Дописывает вакансии в журнал без переноса в хранилище
+
+        Журнал можно пополнять из нескольких процессов; вакансии попадут в
+        хранилище при следующем commit_journal (или add_vacancies в режиме journal).
+
+        :return: Количество записанных в журнал и отброшенных (невалидных) вакансий
+        """
+        records = []
+        invalid = 0
+        for vacancy in vacancies:
+            try:
+                vacancy_dict = self._convert_to_dict(vacancy)
+                self._validate_vacancy(vacancy_dict)
+            except (ValueError, AttributeError):
+                invalid += 1
+                continue
+            records.append(vacancy_dict)
+        self._append_journal(records)
+        return len(records), invalid
+
+    def commit_journal(self) -> Tuple[int, int]:
+        """
+        Переносит накопленные в журнале вакансии в хранилище одной записью
+
+        Строки журнала, которые не удаётся разобрать (оборванная при сбое
+        дозапись), пропускаются и учитываются как пропущенные.
+
+        :return: Количество добавленных и пропущенных (дубликаты и повреждённые строки) вакансий
+        """
+        with locked_file(self.lock_path):
+            if not os.path.exists(self.journal_path):
+                return 0, 0
+
+            with locked_file(self.journal_path) as journal_file:
+                journal_file.seek(0)
+                records = []
+                torn = 0
+                for line in journal_file:
+                    # Недописанная строка (сбой при дозаписи) пропускается
+                    if not line.endswith(b"\n"):
+                        continue
+                    try:
+                        record = self._codec.loads(line)
+                    except ValueError:
+                        record = None
+                    if isinstance(record, dict):
+                        records.append(record)
+                    elif line.strip():
+                        torn += 1
+                if not records and not torn:
+                    return 0, 0
+
+                stored = self._read_file()
+                inserted, skipped = self._merge(stored, records)
+                skipped += torn
+                if inserted:
+                    self._write_file(stored)
+                # Журнал очищается только после надёжной записи хранилища;
+                # повторный перенос после сбоя безопасен благодаря проверке id
+                journal_file.truncate(0)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+        return inserted, skipped
+
+    def open_reader(self) -> MappedVacancyReader:
+        """
+        Открывает хранилище для ленивого чтения через mmap
+
+        Подходит для точечного доступа по id и обхода больших файлов без
+        полного разбора JSON.
+        """
+        return MappedVacancyReader(self.file_path)
+
+    def get_vacancies(self, criteria: dict = None) -> List[Vacancy]:
+        """
+        Возвращает вакансии, удовлетворяющие критериям (см. src.storage.criteria)
+
+        Критерии разрешаются через индексы, которые строятся один раз на
+        экземпляр хранилища и перестраиваются при изменении файла.
+        """
+        return self._get_index().query(validate_criteria(criteria))
+
+    def delete_vacancy(self, vacancy: Union[Dict, Vacancy, str]) -> None:
+        """Удаляет вакансию из хранилища (принимает вакансию или её id)"""
+        if isinstance(vacancy, str):
+            vacancy_id = vacancy
+        else:
+            vacancy_dict = self._convert_to_dict(vacancy)
+            self._validate_vacancy(vacancy_dict)
+            vacancy_id = vacancy_dict["id"]
+        self.delete_vacancies([vacancy_id])
+
+    def delete_vacancies(self, vacancy_ids: Iterable[str]) -> int:
+        """
+        Удаляет вакансии по id одной записью файла
+
+        :return: Количество удалённых вакансий
+        """
+        ids = set(vacancy_ids)
+        if not ids:
+            return 0
+        with locked_file(self.lock_path):
+            stored = self._read_file()
+            remaining = [v for v in stored if v.get("id") not in ids]
+            if len(remaining) != len(stored):
+                self._write_file(remaining)
+        return len(stored) - len(remaining)
 
     def _convert_to_dict(self, vacancy: Union[Dict, object]) -> Dict:
         """Конвертирует объект вакансии в словарь"""
@@ -43,23 +381,114 @@ class JSONStorage:
         if "id" not in vacancy or not isinstance(vacancy["id"], str):
             raise ValueError("Vacancy must have a string 'id' field")
 
+    @staticmethod
+    def _merge(stored: List[Dict], records: List[Dict]) -> Tuple[int, int]:
+        """Добавляет в stored записи с новыми id, возвращает число добавленных и пропущенных"""
+        known_ids = {v.get("id") for v in stored}
+        inserted = 0
+        for record in records:
+            if record["id"] in known_ids:
+                continue
+            known_ids.add(record["id"])
+            stored.append(record)
+            inserted += 1
+        return inserted, len(records) - inserted
+
+    def _append_journal(self, records: List[Dict]) -> None:
+        """Дописывает пакет в журнал под его блокировкой"""
+        if not records:
+            return
+        data = b"".join(self._codec.dumps(record) + b"\n" for record in records)
+        with locked_file(self.journal_path) as journal_file:
+            size = journal_file.seek(0, os.SEEK_END)
+            if size:
+                journal_file.seek(size - 1)
+                if journal_file.read(1) != b"\n":
+                    # Предыдущая дозапись оборвалась: пакет начинается с новой строки,
+                    # чтобы не склеиться с обрывком
+                    data = b"\n" + data
+            journal_file.write(data)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def _get_index(self) -> _StorageIndex:
+        """Возвращает индексы хранилища, перестраивая их после изменения файла"""
+        try:
+            stat = os.stat(self.file_path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            signature = None
+
+        if self._index is None or signature != self._index_signature:
+            self._index = _StorageIndex(self._read_file())
+            self._index_signature = signature
+        return self._index
+
     def _vacancy_exists(self, vacancies: List[Dict], new_vacancy: Dict) -> bool:
         """Проверяет, существует ли уже такая вакансия"""
         return any(v.get("id") == new_vacancy.get("id") for v in vacancies)
 
     def _read_file(self) -> List[Dict]:
-        """Читает вакансии из файла"""
-        if not os.path.exists(self.file_path):
-            return []
+        """
+        Читает вакансии из файла
 
+        Повреждённый файл не подменяется пустым списком, иначе следующая
+        запись уничтожила бы хранилище.
+
+        :raises StorageCorruptedError: Если файл содержит некорректный JSON
+        """
+        started = time.perf_counter()
         try:
-            with open(self.file_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                return data if isinstance(data, list) else []
-        except (json.JSONDecodeError, FileNotFoundError):
+            with open(self.file_path, "rb") as file:
+                raw = file.read()
+        except FileNotFoundError:
+            return []
+
+        if not raw.strip():
             return []
+        try:
+            data = self._codec.loads(raw)
+        except json.JSONDecodeError as e:
+            raise StorageCorruptedError(f"Файл хранилища {self.file_path} повреждён: {e}")
+        data = data if isinstance(data, list) else []
+        metrics.observe("storage.read", time.perf_counter() - started, len(data), len(raw))
+        return data
 
     def _write_file(self, vacancies: List[Dict]) -> None:
-        """Записывает вакансии в файл"""
-        with open(self.file_path, "w", encoding="utf-8") as file:
-            json.dump(vacancies, file, ensure_ascii=False, indent=4)
+        """
+        Записывает вакансии в файл через временный файл, fsync и атомарную замену
+
+        Границы записей известны из кодирования, поэтому кэш смещений для
+        open_reader обновляется сразу, без разметки файла.
+        """
+        directory = os.path.dirname(self.file_path) or "."
+        started = time.perf_counter()
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                raw, spans = self._codec.dumps_records(vacancies, compact=self.compact)
+                file.write(raw)
+                file.flush()
+                os.fsync(file.fileno())
+                written = os.fstat(file.fileno())
+            # mkstemp создаёт файл с правами 0600, возвращаем обычные права
+            os.chmod(tmp_path, self._file_mode())
+            os.replace(tmp_path, self.file_path)
+            fsync_directory(directory)
+            self._index = None
+            positions: Dict[str, int] = {}
+            for position, vacancy in enumerate(vacancies):
+                positions.setdefault(vacancy.get("id"), position)
+            save_offsets(self.file_path, spans, positions.items(), written)
+            metrics.observe("storage.write", time.perf_counter() - started, len(vacancies), len(raw))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _file_mode(self) -> int:
+        """Права файла хранилища: текущие или 0666 с учётом umask"""
+        try:
+            return os.stat(self.file_path).st_mode & 0o777
+        except FileNotFoundError:
+            return 0o666 & ~_UMASK
@@ -0,0 +1,280 @@
+import os
+from typing import Dict, Iterable, List, Optional, Union
+from src.models.vacancy import Vacancy
+from src.storage.abstract_storage import AbstractStorage
+from src.storage.codecs import get_codec
+from src.storage.criteria import match_criteria, validate_criteria
+from src.utils.keyword_index import KeywordIndex, tokenize
+
+DELETED_KEY = "_deleted"
+
+
+class JSONLinesStorage(AbstractStorage):
+    """
+    Хранилище вакансий в формате JSON Lines с дозаписью
+
+    Каждая вакансия записывается отдельной строкой в конец файла, поэтому
+    добавление не требует перезаписи хранилища. Смещения актуальных записей
+    хранятся в памяти и дублируются в файле-индексе (<файл>.idx, строки вида
+    "id<TAB>смещение", для надгробий смещение записывается как -(смещение + 1)).
+    Удаление дописывает запись-надгробие, а устаревшие версии и надгробия
+    убираются методом compact().
+
+    Если передан keyword_index, он обновляется при каждом добавлении и
+    удалении, а критерий keywords разрешается через него. Индекс помнит размер
+    файла хранилища, до которого он актуален (KeywordIndex.generation): новый
+    или отставший индекс (например, записи дописаны без него) перестраивается
+    по хранилищу при открытии.
+    """
+
+    def __init__(self, file_path: str = "data/vacancies.jsonl", keyword_index: Optional[KeywordIndex] = None):
+        self.file_path = file_path
+        self.keyword_index = keyword_index
+        self._codec = get_codec()
+        self.index_path = f"{file_path}.idx"
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._index: Dict[str, int] = {}
+        self._load_index()
+        if keyword_index is not None:
+            self._sync_keyword_index()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, vacancy_id: object) -> bool:
+        return vacancy_id in self._index
+
+    def add_vacancy(self, vacancy: Union[Dict, Vacancy]) -> None:
+        """Добавляет вакансию, если вакансии с таким id ещё нет"""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Union[Dict, Vacancy]]) -> Dict[str, int]:
+        """
+        Пакетно дописывает новые вакансии в хранилище
+
+        :param vacancies: Вакансии (словари или объекты Vacancy)
+        :return: Словарь с количеством добавленных и пропущенных вакансий
+        """
+        records = []
+        seen = set()
+        skipped = 0
+        for vacancy in vacancies:
+            vacancy_dict = self._convert_to_dict(vacancy)
+            vacancy_id = vacancy_dict["id"]
+            if vacancy_id in self._index or vacancy_id in seen:
+                skipped += 1
+                continue
+            seen.add(vacancy_id)
+            records.append(vacancy_dict)
+
+        self._append(records)
+        return {"inserted": len(records), "skipped": skipped}
+
+    def upsert_vacancy(self, vacancy: Union[Dict, Vacancy]) -> None:
+        """Добавляет вакансию или записывает её новую версию поверх старой"""
+        self._append([self._convert_to_dict(vacancy)])
+
+    def upsert_vacancies(self, vacancies: Iterable[Union[Dict, Vacancy]]) -> int:
+        """
+        Пакетно добавляет вакансии или записывает их новые версии
+
+        :return: Количество записанных вакансий
+        """
+        records = [self._convert_to_dict(vacancy) for vacancy in vacancies]
+        self._append(records)
+        return len(records)
+
+    def get_vacancy(self, vacancy_id: str) -> Optional[Vacancy]:
+        """Возвращает вакансию по id или None, если её нет"""
+        offset = self._index.get(vacancy_id)
+        if offset is None:
+            return None
+        with open(self.file_path, "rb") as file:
+            file.seek(offset)
+            return Vacancy.from_dict(self._codec.loads(file.readline()))
+
+    def get_vacancies(self, criteria: dict = None) -> List[Vacancy]:
+        """Возвращает вакансии, удовлетворяющие критериям (см. src.storage.criteria)"""
+        criteria = validate_criteria(criteria)
+        if "id" in criteria:
+            vacancy = self.get_vacancy(str(criteria["id"]))
+            return [vacancy] if vacancy and match_criteria(vacancy, criteria) else []
+
+        keywords = criteria.get("keywords")
+        if keywords and self.keyword_index is not None and all(tokenize(word) for word in keywords):
+            # Слова вакансии, содержащие ключевое слово, дают надмножество ответа;
+            # его уточняет та же подстрочная проверка match_criteria, что и без индекса
+            ids = self.keyword_index.query(all_words=keywords, substring=True)
+            return [v for v in self.iter_vacancies(ids) if match_criteria(v, criteria)]
+
+        return [v for v in self.iter_vacancies() if match_criteria(v, criteria)]
+
+    def iter_vacancies(self, ids: Optional[Iterable[str]] = None):
+        """Последовательно читает актуальные вакансии (все или с заданными id) в порядке их записи"""
+        if ids is None:
+            offsets = sorted(self._index.values())
+        else:
+            offsets = sorted(self._index[i] for i in ids if i in self._index)
+        if not offsets:
+            return
+        with open(self.file_path, "rb") as file:
+            for offset in offsets:
+                file.seek(offset)
+                yield Vacancy.from_dict(self._codec.loads(file.readline()))
+
+    def delete_vacancy(self, vacancy: Union[Dict, Vacancy, str]) -> None:
+        """Удаляет вакансию (принимает вакансию или её id)"""
+        vacancy_id = vacancy if isinstance(vacancy, str) else self._convert_to_dict(vacancy)["id"]
+        if vacancy_id in self._index:
+            self._append([{"id": vacancy_id, DELETED_KEY: True}])
+
+    def compact(self) -> int:
+        """
+        Переписывает хранилище, оставляя только актуальные версии вакансий
+
+        :return: Количество удалённых из файла строк
+        """
+        if not os.path.exists(self.file_path):
+            return 0
+
+        tmp_path = f"{self.file_path}.compact"
+        new_index = {}
+        total_lines = 0
+        live_offsets = set(self._index.values())
+        with open(self.file_path, "rb") as src, open(tmp_path, "wb") as dst:
+            offset = 0
+            for line in src:
+                if offset in live_offsets:
+                    vacancy_id = self._codec.loads(line)["id"]
+                    new_index[vacancy_id] = dst.tell()
+                    dst.write(line)
+                total_lines += 1
+                offset += len(line)
+
+        os.replace(tmp_path, self.file_path)
+        self._index = new_index
+        self._write_index()
+        if self.keyword_index is not None:
+            # Набор вакансий не изменился, изменился только размер файла
+            self.keyword_index.set_generation(os.path.getsize(self.file_path))
+        return total_lines - len(new_index)
+
+    def _sync_keyword_index(self) -> None:
+        """Перестраивает индекс слов по хранилищу, если он не соответствует текущему файлу"""
+        size = os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
+        if self.keyword_index.generation == size and len(self.keyword_index) == len(self._index):
+            return
+        self.keyword_index.clear()
+        with self.keyword_index.batch():
+            for vacancy in self.iter_vacancies():
+                self.keyword_index.add(vacancy)
+            self.keyword_index.set_generation(size)
+        if self.keyword_index.path:
+            self.keyword_index.save()
+
+    def _append(self, records: List[Dict]) -> None:
+        """Дописывает записи в конец файла и в файл-индекс"""
+        if not records:
+            return
+
+        index_lines = []
+        with open(self.file_path, "ab") as file:
+            offset = file.tell()
+            for record in records:
+                line = self._codec.dumps(record) + b"\n"
+                file.write(line)
+                self._apply(record, offset)
+                index_offset = -(offset + 1) if record.get(DELETED_KEY) else offset
+                index_lines.append(f"{record['id']}\t{index_offset}\n")
+                offset += len(line)
+
+        if self.keyword_index is not None:
+            with self.keyword_index.batch():
+                for record in records:
+                    if record.get(DELETED_KEY):
+                        self.keyword_index.remove(record["id"])
+                    else:
+                        self.keyword_index.add(record)
+                self.keyword_index.set_generation(offset)
+
+        with open(self.index_path, "a", encoding="utf-8") as index_file:
+            index_file.writelines(index_lines)
+
+    def _apply(self, record: Dict, offset: int) -> None:
+        """Обновляет индекс в памяти по одной записи"""
+        if record.get(DELETED_KEY):
+            self._index.pop(record["id"], None)
+        else:
+            self._index[record["id"]] = offset
+
+    def _load_index(self) -> None:
+        """Загружает индекс из файла-индекса и доиндексирует хвост хранилища"""
+        self._index = {}
+        if not os.path.exists(self.file_path):
+            return
+
+        last_offset = -1
+        indexed_size = 0
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as index_file:
+                for line in index_file:
+                    vacancy_id, _, offset_text = line.rstrip("\n").rpartition("\t")
+                    if not offset_text:
+                        continue
+                    offset = int(offset_text)
+                    if not vacancy_id:
+                        # Служебная строка с размером проиндексированной части файла
+                        indexed_size = max(indexed_size, offset)
+                        continue
+                    if offset < 0:
+                        self._index.pop(vacancy_id, None)
+                        offset = -offset - 1
+                    else:
+                        self._index[vacancy_id] = offset
+                    last_offset = max(last_offset, offset)
+
+        # Записи, попавшие в хранилище, но не в индекс (например, после сбоя).
+        # Недописанная последняя строка отбрасывается.
+        tail = []
+        with open(self.file_path, "r+b") as file:
+            if last_offset >= 0:
+                file.seek(last_offset)
+                file.readline()
+            offset = max(file.tell(), indexed_size)
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    file.truncate(offset)
+                    break
+                tail.append((self._codec.loads(line), offset))
+                offset += len(line)
+
+        for record, offset in tail:
+            self._apply(record, offset)
+        if tail or not os.path.exists(self.index_path):
+            self._write_index()
+
+    def _write_index(self) -> None:
+        """Полностью перезаписывает файл-индекс по индексу в памяти"""
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as index_file:
+            for vacancy_id, offset in self._index.items():
+                index_file.write(f"{vacancy_id}\t{offset}\n")
+            index_file.write(f"\t{os.path.getsize(self.file_path)}\n")
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def _convert_to_dict(vacancy: Union[Dict, Vacancy]) -> Dict:
+        """Конвертирует вакансию в словарь и проверяет наличие id"""
+        if isinstance(vacancy, dict):
+            vacancy_dict = vacancy
+        elif hasattr(vacancy, "to_dict") and callable(vacancy.to_dict):
+            vacancy_dict = vacancy.to_dict()
+        else:
+            raise ValueError("Vacancy must be a dictionary or have to_dict() method")
+
+        if not isinstance(vacancy_dict.get("id"), str):
+            raise ValueError("Vacancy must have a string 'id' field")
+        return vacancy_dict
@@ -0,0 +1,40 @@
+import os
+from contextlib import contextmanager
+from typing import Iterator, IO
+
+try:
+    import fcntl
+except ImportError:  # Windows: рекомендательные блокировки недоступны
+    fcntl = None
+
+
+@contextmanager
+def locked_file(path: str, shared: bool = False) -> Iterator[IO]:
+    """
+    Рекомендательная блокировка файла через fcntl.flock
+
+    Файл блокировки создаётся при необходимости. На платформах без fcntl
+    блокировка не выполняется.
+
+    :param path: Путь к файлу блокировки
+    :param shared: Разделяемая блокировка (для чтения) вместо исключительной
+    """
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield lock_file
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def fsync_directory(path: str) -> None:
+    """Сбрасывает на диск запись каталога (чтобы переименование файла пережило сбой)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,184 @@
+import json
+import mmap
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.models.vacancy import Vacancy
+from src.storage.codecs import get_codec
+
+# Строки JSON и структурные символы; запятые и скаляры для разметки не нужны
+TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{}:]', re.DOTALL)
+
+
+def _signature(stat: os.stat_result) -> List[int]:
+    """Размер и время изменения файла: кэш смещений действителен, пока они не изменились"""
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def save_offsets(
+    file_path: str, spans: List[Tuple[int, int]], ids: Iterable[Tuple[str, int]], stat: os.stat_result
+) -> None:
+    """
+    Сохраняет кэш смещений записей хранилища (<файл>.offsets)
+
+    Вызывается читателем после разметки файла и JSONStorage после каждой
+    записи, когда границы записей известны из кодирования, поэтому открытие
+    хранилища после записи не требует разметки.
+
+    :param file_path: Путь к файлу хранилища (уже записанному)
+    :param spans: Границы записей (начало, конец) в байтах
+    :param ids: Пары (id, номер записи)
+    :param stat: Сведения о размеченном файле, полученные os.fstat по открытому дескриптору
+        (а не по пути: файл по пути мог быть уже заменён другим процессом)
+    """
+    data = {"signature": _signature(stat), "spans": spans, "ids": list(ids)}
+    offsets_path = f"{file_path}.offsets"
+    tmp_path = f"{offsets_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_path, offsets_path)
+    except OSError:
+        pass
+
+
+class MappedVacancyReader:
+    """
+    Ленивое чтение JSON-хранилища вакансий через mmap
+
+    Файл отображается в память, по нему один раз строится индекс смещений
+    записей верхнего уровня и их id (без декодирования самих записей). Индекс
+    кэшируется в файле <файл>.offsets и пересчитывается при изменении размера
+    или времени изменения хранилища; JSONStorage обновляет кэш при каждой
+    записи, поэтому разметка нужна только для файлов, записанных иначе.
+    Декодируются только те вакансии, к которым действительно обращаются.
+    """
+
+    def __init__(self, file_path: str, use_offsets_cache: bool = True):
+        """
+        :param file_path: Путь к JSON-файлу хранилища (массив вакансий)
+        :param use_offsets_cache: Читать и сохранять индекс смещений в <файл>.offsets
+        """
+        self.file_path = file_path
+        self.offsets_path = f"{file_path}.offsets"
+        self._codec = get_codec()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._spans: List[Tuple[int, int]] = []
+        self._positions: Dict[str, int] = {}
+
+        try:
+            self._file = open(file_path, "rb")
+        except FileNotFoundError:
+            return
+        # Подпись берётся с открытого дескриптора, чтобы кэш и отображение относились к одному файлу
+        stat = os.fstat(self._file.fileno())
+        if stat.st_size == 0:
+            self.close()
+            return
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if not (use_offsets_cache and self._load_offsets(_signature(stat))):
+            self._scan()
+            if use_offsets_cache:
+                save_offsets(file_path, self._spans, self._positions.items(), stat)
+
+    def __enter__(self) -> "MappedVacancyReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает отображение и файл"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, vacancy_id: object) -> bool:
+        return vacancy_id in self._positions
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        return (Vacancy.from_dict(data) for data in self.iter_dicts())
+
+    def ids(self) -> List[str]:
+        """Список id вакансий в порядке хранения (без декодирования записей)"""
+        return list(self._positions)
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Последовательно декодирует записи в словари"""
+        for position in range(len(self._spans)):
+            yield self.get_dict_at(position)
+
+    def get_dict_at(self, position: int) -> Dict[str, Any]:
+        """Декодирует запись по её порядковому номеру"""
+        start, end = self._spans[position]
+        return self._codec.loads(self._map[start:end])
+
+    def get_dict(self, vacancy_id: str) -> Optional[Dict[str, Any]]:
+        """Декодирует запись по id (None, если её нет)"""
+        position = self._positions.get(vacancy_id)
+        return None if position is None else self.get_dict_at(position)
+
+    def get(self, vacancy_id: str) -> Optional[Vacancy]:
+        """Возвращает вакансию по id (None, если её нет)"""
+        data = self.get_dict(vacancy_id)
+        return None if data is None else Vacancy.from_dict(data)
+
+    def _scan(self) -> None:
+        """Размечает границы записей массива верхнего уровня и их id"""
+        spans = []
+        positions: Dict[str, int] = {}
+        depth = 0
+        start = 0
+        previous_end = 0
+        last_string = b""
+        id_key = False
+
+        for match in TOKEN_RE.finditer(self._map):
+            token = match.group()
+            first = token[0]
+            if first == 0x22:  # строка
+                if id_key and not self._map[previous_end:match.start()].strip():
+                    positions.setdefault(json.loads(token), len(spans))
+                id_key = False
+                previous_end = match.end()
+                last_string = token
+                continue
+            if first == 0x3A:  # ":" после ключа
+                # Значение ключа "id" самой записи (не вложенных объектов)
+                id_key = depth == 2 and last_string == b'"id"'
+                previous_end = match.end()
+                continue
+
+            id_key = False
+            if first in (0x5B, 0x7B):  # "[" или "{"
+                if depth == 1:
+                    start = match.start()
+                depth += 1
+            else:  # "]" или "}"
+                depth -= 1
+                if depth == 1:
+                    spans.append((start, match.end()))
+
+        self._spans = spans
+        self._positions = positions
+
+    def _load_offsets(self, signature: List[int]) -> bool:
+        """Загружает кэш смещений, если он соответствует текущему файлу"""
+        try:
+            with open(self.offsets_path, "r", encoding="utf-8") as file:
+                cached = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if cached.get("signature") != signature:
+            return False
+        self._spans = [tuple(span) for span in cached["spans"]]
+        self._positions = {vacancy_id: position for vacancy_id, position in cached["ids"]}
+        return True
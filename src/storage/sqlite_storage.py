@@ -0,0 +1,282 @@
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Tuple, Union
+from src.models.vacancy import (
+    Vacancy,
+    Salary,
+    Employer,
+    Area,
+    Experience,
+    Employment,
+    Snippet,
+)
+from src.storage.abstract_storage import AbstractStorage
+from src.storage.criteria import normalize_text, validate_criteria
+
+COLUMNS = (
+    "id",
+    "name",
+    "salary_from",
+    "salary_to",
+    "currency",
+    "area",
+    "employer",
+    "experience",
+    "employment",
+    "requirement",
+    "responsibility",
+    "alternate_url",
+    "salary_from_base",
+    "salary_to_base",
+)
+
+# Столбцы, добавленные после первой версии схемы: в старых базах они создаются при открытии
+ADDED_COLUMNS = (
+    ("salary_from_base", "REAL"),
+    ("salary_to_base", "REAL"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    salary_from INTEGER,
+    salary_to INTEGER,
+    currency TEXT,
+    area TEXT,
+    employer TEXT,
+    experience TEXT,
+    employment TEXT,
+    requirement TEXT,
+    responsibility TEXT,
+    alternate_url TEXT,
+    salary_from_base REAL,
+    salary_to_base REAL
+);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies (salary_from);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies (salary_to);
+CREATE INDEX IF NOT EXISTS idx_vacancies_area ON vacancies (area, salary_from);
+CREATE INDEX IF NOT EXISTS idx_vacancies_employer ON vacancies (employer);
+"""
+
+
+def _casefold(value: Any) -> str:
+    """Приведение к виду для поиска с поддержкой кириллицы (lower() в SQLite только для ASCII)"""
+    return normalize_text(value) if isinstance(value, str) else ""
+
+
+class SQLiteStorage(AbstractStorage):
+    """
+    Хранилище вакансий в базе SQLite
+
+    Поля вакансии раскладываются по отдельным столбцам, по зарплате, региону
+    и работодателю построены индексы, поэтому выборки по критериям выполняются
+    средствами SQL без загрузки всего хранилища. Границы вилки в базовой
+    валюте (Salary.from_base и Salary.to_base) хранятся в отдельных столбцах
+    и возвращаются вместе с вакансией, как в JSON-хранилищах.
+    """
+
+    def __init__(self, file_path: str = "data/vacancies.db"):
+        self.file_path = file_path
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(file_path)
+        self._connection.create_function("casefold", 1, _casefold, deterministic=True)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Добавляет в таблицу базы, созданной прежней версией, недостающие столбцы"""
+        existing = {row[1] for row in self._connection.execute("PRAGMA table_info(vacancies)")}
+        with self._connection:
+            for column, column_type in ADDED_COLUMNS:
+                if column not in existing:
+                    self._connection.execute(f"ALTER TABLE vacancies ADD COLUMN {column} {column_type}")
+
+    def close(self) -> None:
+        """Закрывает соединение с базой"""
+        self._connection.close()
+
+    def __enter__(self) -> "SQLiteStorage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+    def add_vacancy(self, vacancy: Union[Dict, Vacancy]) -> None:
+        """Добавляет вакансию, если вакансии с таким id ещё нет"""
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Union[Dict, Vacancy]]) -> Dict[str, int]:
+        """
+        Пакетно добавляет вакансии одной транзакцией через executemany
+
+        :param vacancies: Вакансии (словари или объекты Vacancy)
+        :return: Словарь с количеством добавленных и пропущенных вакансий
+        """
+        rows = [self._to_row(vacancy) for vacancy in vacancies]
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                f"INSERT OR IGNORE INTO vacancies ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+            inserted = self._connection.total_changes - before
+        return {"inserted": inserted, "skipped": len(rows) - inserted}
+
+    def upsert_vacancy(self, vacancy: Union[Dict, Vacancy]) -> None:
+        """Добавляет вакансию или заменяет существующую с тем же id"""
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO vacancies ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                self._to_row(vacancy),
+            )
+
+    def upsert_vacancies(self, vacancies: Iterable[Union[Dict, Vacancy]]) -> int:
+        """
+        Пакетно добавляет вакансии или заменяет существующие одной транзакцией
+
+        :return: Количество записанных вакансий
+        """
+        rows = [self._to_row(vacancy) for vacancy in vacancies]
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO vacancies ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+        return len(rows)
+
+    def get_vacancies(self, criteria: dict = None) -> List[Vacancy]:
+        """Возвращает вакансии, удовлетворяющие критериям (см. src.storage.criteria)"""
+        where, params = self._build_where(validate_criteria(criteria))
+        query = f"SELECT {', '.join(COLUMNS)} FROM vacancies"
+        if where:
+            query += f" WHERE {where}"
+        query += " ORDER BY rowid"
+        return [self._from_row(row) for row in self._connection.execute(query, params)]
+
+    def delete_vacancy(self, vacancy: Union[Dict, Vacancy, str]) -> None:
+        """Удаляет вакансию (принимает вакансию или её id)"""
+        vacancy_id = vacancy if isinstance(vacancy, str) else self._to_row(vacancy)[0]
+        with self._connection:
+            self._connection.execute("DELETE FROM vacancies WHERE id = ?", (vacancy_id,))
+
+    def explain(self, criteria: dict = None) -> List[str]:
+        """Возвращает план выполнения запроса для критериев (для отладки индексов)"""
+        where, params = self._build_where(validate_criteria(criteria))
+        query = "SELECT id FROM vacancies" + (f" WHERE {where}" if where else "")
+        return [row[-1] for row in self._connection.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+    @staticmethod
+    def _build_where(criteria: Dict) -> Tuple[str, List[Any]]:
+        """Преобразует словарь критериев в условие WHERE и список параметров"""
+        clauses = []
+        params: List[Any] = []
+
+        for key, column in (
+            ("id", "id"),
+            ("employer", "employer"),
+            ("area", "area"),
+            ("currency", "currency"),
+        ):
+            if key in criteria:
+                clauses.append(f"{column} = ?")
+                params.append(str(criteria[key]) if key == "id" else criteria[key])
+
+        if "salary_from" in criteria:
+            if criteria["salary_from"] > 0:
+                clauses.append("salary_from >= ?")
+            else:
+                clauses.append("COALESCE(salary_from, 0) >= ?")
+            params.append(criteria["salary_from"])
+        if "salary_to" in criteria:
+            clauses.append("salary_to <= ?")
+            params.append(criteria["salary_to"])
+
+        for word in criteria.get("keywords") or []:
+            clauses.append(
+                "instr(casefold(name || ' ' || COALESCE(requirement, '') || ' ' "
+                "|| COALESCE(responsibility, '')), ?) > 0"
+            )
+            params.append(normalize_text(word))
+
+        return " AND ".join(clauses), params
+
+    @staticmethod
+    def _to_row(vacancy: Union[Dict, Vacancy]) -> Tuple:
+        """Раскладывает вакансию по столбцам таблицы"""
+        if isinstance(vacancy, dict):
+            vacancy = Vacancy.from_dict(vacancy)
+        elif not isinstance(vacancy, Vacancy):
+            raise ValueError("Vacancy must be a dictionary or a Vacancy object")
+
+        return (
+            vacancy.id,
+            vacancy.name,
+            vacancy.salary_from,
+            vacancy.salary_to,
+            vacancy.salary_currency,
+            vacancy.area.name if vacancy.area else None,
+            vacancy.employer.name if vacancy.employer else None,
+            vacancy.experience.name if vacancy.experience else None,
+            vacancy.employment.name if vacancy.employment else None,
+            vacancy.snippet.requirement if vacancy.snippet else None,
+            vacancy.snippet.responsibility if vacancy.snippet else None,
+            vacancy.alternate_url,
+            vacancy.salary.from_base if vacancy.salary else None,
+            vacancy.salary.to_base if vacancy.salary else None,
+        )
+
+    @staticmethod
+    def _from_row(row: Tuple) -> Vacancy:
+        """Собирает объект Vacancy из строки таблицы"""
+        (
+            id_,
+            name,
+            salary_from,
+            salary_to,
+            currency,
+            area,
+            employer,
+            experience,
+            employment,
+            requirement,
+            responsibility,
+            alternate_url,
+            salary_from_base,
+            salary_to_base,
+        ) = row
+
+        has_salary = salary_from is not None or salary_to is not None or currency is not None
+        has_snippet = requirement is not None or responsibility is not None
+        return Vacancy(
+            id=id_,
+            name=name,
+            salary=(
+                Salary(
+                    from_=salary_from,
+                    to=salary_to,
+                    currency=currency,
+                    from_base=salary_from_base,
+                    to_base=salary_to_base,
+                )
+                if has_salary
+                else None
+            ),
+            area=Area(name=area) if area is not None else None,
+            employer=Employer(name=employer) if employer is not None else None,
+            experience=Experience(name=experience) if experience is not None else None,
+            employment=Employment(name=employment) if employment is not None else None,
+            snippet=Snippet(requirement=requirement, responsibility=responsibility) if has_snippet else None,
+            alternate_url=alternate_url,
+        )
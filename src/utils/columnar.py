@@ -0,0 +1,170 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from src.models.vacancy import Vacancy
+from src.utils.filters import parse_salary_range_or_warn
+
+try:
+    import numpy as np
+except ImportError:  # numpy - необязательная зависимость
+    np = None
+
+
+def _require_numpy() -> None:
+    """Проверяет, что numpy установлен"""
+    if np is None:
+        raise ImportError(
+            "Для колоночного представления нужен numpy: pip install numpy"
+        )
+
+
+def _categorize(values: Sequence[Optional[str]]) -> Tuple[Any, List[str]]:
+    """Кодирует строки целыми кодами (-1 для None) и возвращает коды и список категорий"""
+    categories: Dict[str, int] = {}
+    codes = np.fromiter(
+        (-1 if value is None else categories.setdefault(value, len(categories)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return codes, list(categories)
+
+
+class VacancyColumns:
+    """
+    Колоночный снимок вакансий для векторных фильтров и статистики (требует numpy)
+
+    Столбцы:
+        salary_from, salary_to - float64, NaN для неуказанной границы
+            (в базовой валюте, если зарплата нормализована, см. src.utils.currency);
+        has_salary - bool, указана ли зарплата вообще;
+        currency_codes, area_codes - int32 коды категорий (-1 если не указано),
+        названия категорий - в currencies и areas.
+
+    Фильтры и сортировки дают тот же результат, что функции из src.utils.filters.
+    """
+
+    def __init__(self, vacancies: Sequence[Vacancy]):
+        _require_numpy()
+        self.vacancies: List[Vacancy] = list(vacancies)
+        count = len(self.vacancies)
+        nan = float("nan")
+
+        self.has_salary = np.fromiter((bool(v.salary) for v in self.vacancies), dtype=bool, count=count)
+        self.salary_from = np.fromiter(
+            (nan if v.salary_from_base is None else v.salary_from_base for v in self.vacancies),
+            dtype=np.float64,
+            count=count,
+        )
+        self.salary_to = np.fromiter(
+            (nan if v.salary_to_base is None else v.salary_to_base for v in self.vacancies),
+            dtype=np.float64,
+            count=count,
+        )
+        self.currency_codes, self.currencies = _categorize([v.salary_currency for v in self.vacancies])
+        self.area_codes, self.areas = _categorize([v.area.name if v.area else None for v in self.vacancies])
+
+    @classmethod
+    def from_storage(cls, storage: Any, criteria: Optional[dict] = None) -> "VacancyColumns":
+        """Строит снимок по вакансиям хранилища (AbstractStorage.get_vacancies)"""
+        return cls(storage.get_vacancies(criteria))
+
+    def __len__(self) -> int:
+        return len(self.vacancies)
+
+    @property
+    def salary_midpoint(self) -> Any:
+        """Середина вилки (одна граница, если вторая не указана; NaN без зарплаты)"""
+        both = (self.salary_from + self.salary_to) / 2
+        single = np.where(np.isnan(self.salary_from), self.salary_to, self.salary_from)
+        return np.where(np.isnan(both), single, both)
+
+    def salary_mask(self, salary_range: str) -> Any:
+        """
+        Булева маска вакансий, попадающих в диапазон зарплат
+
+        Семантика совпадает с get_vacancies_by_salary; для пустого или
+        некорректного диапазона подходят все вакансии.
+        """
+        parsed = parse_salary_range_or_warn(salary_range)
+
+        if parsed is None:
+            return np.ones(len(self), dtype=bool)
+
+        check_type, min_salary, max_salary = parsed
+        # Как в get_vacancies_by_salary: "от" или 0, "до" или бесконечность
+        salary_from = np.nan_to_num(self.salary_from, nan=0.0)
+        salary_to = np.where(np.isnan(self.salary_to) | (self.salary_to == 0), np.inf, self.salary_to)
+
+        mask = self.has_salary.copy()
+        if check_type in ("min", "range"):
+            mask &= salary_from >= min_salary
+        if check_type in ("max", "range"):
+            mask &= salary_to <= max_salary
+        return mask
+
+    def filter_by_salary(self, salary_range: str) -> List[Vacancy]:
+        """Вакансии, попадающие в диапазон зарплат, в исходном порядке"""
+        return self.take(np.flatnonzero(self.salary_mask(salary_range)))
+
+    def sort_order(self, mask: Optional[Any] = None) -> Any:
+        """
+        Индексы вакансий по убыванию зарплаты, как в sort_vacancies
+
+        :param mask: Булева маска отбора (по умолчанию все вакансии)
+        """
+        positions = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        salary_from = np.nan_to_num(self.salary_from[positions], nan=0.0)
+        salary_to = np.nan_to_num(self.salary_to[positions], nan=0.0)
+        # lexsort устойчива: при равных ключах сохраняется исходный порядок
+        return positions[np.lexsort((-salary_to, -salary_from))]
+
+    def top(self, n: int, mask: Optional[Any] = None) -> List[Vacancy]:
+        """Топ N вакансий по зарплате (с учётом маски)"""
+        if n <= 0:
+            return []
+        return self.take(self.sort_order(mask)[:n])
+
+    def take(self, positions: Any) -> List[Vacancy]:
+        """Вакансии по массиву индексов"""
+        return [self.vacancies[i] for i in positions]
+
+    def aggregate_by(
+        self, column: str = "area", func: str = "median", values: Optional[Any] = None
+    ) -> Dict[str, Union[float, int]]:
+        """
+        Статистика зарплаты по группам
+
+        :param column: Столбец группировки: "area" или "currency"
+        :param func: "median", "mean" или "count" (по вакансиям с известной зарплатой)
+        :param values: Массив значений (по умолчанию середина вилки)
+        :return: Словарь "название группы -> значение" (для "count" - целое число)
+        """
+        if column == "area":
+            codes, names = self.area_codes, self.areas
+        elif column == "currency":
+            codes, names = self.currency_codes, self.currencies
+        else:
+            raise ValueError(f"Unknown column: {column}")
+
+        reducers: Dict[str, Callable[[Any], Union[float, int]]] = {
+            "median": lambda group: float(np.median(group)),
+            "mean": lambda group: float(np.mean(group)),
+            "count": len,
+        }
+        if func not in reducers:
+            raise ValueError(f"Unknown aggregate: {func}")
+
+        values = self.salary_midpoint if values is None else values
+        valid = (codes >= 0) & ~np.isnan(values)
+        codes, values = codes[valid], values[valid]
+
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        return {
+            names[group_codes[0]]: reducers[func](group_values)
+            for group_codes, group_values in zip(np.split(codes, boundaries), np.split(values, boundaries))
+            if len(group_codes)
+        }
+
+    def median_salary_by_area(self) -> Dict[str, float]:
+        """Медиана середины зарплатной вилки по регионам"""
+        return self.aggregate_by("area", "median")
@@ -0,0 +1,173 @@
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import requests
+from src.models.vacancy import Salary, Vacancy
+
+DICTIONARIES_URL = "https://api.hh.ru/dictionaries"
+BASE_CURRENCY = "RUR"
+
+
+class ExchangeRates:
+    """
+    Таблица курсов валют для пересчёта зарплат в базовую валюту
+
+    Курс - стоимость единицы валюты в базовой валюте (USD -> 90.0 при базе RUR).
+    Пересчитанные границы вилки сохраняются в Salary.from_base и Salary.to_base,
+    после чего фильтры и сортировки сравнивают готовые числа без обращения к
+    таблице курсов.
+    """
+
+    def __init__(self, rates: Dict[str, float], base: str = BASE_CURRENCY, fetched_at: Optional[float] = None):
+        """
+        :param rates: Код валюты -> стоимость единицы в базовой валюте
+        :param base: Код базовой валюты
+        :param fetched_at: Время получения курсов (unix time), по умолчанию - текущее
+        """
+        self.base = base
+        self.rates = {**rates, base: 1.0}
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    @classmethod
+    def from_hh_dictionaries(cls, payload: Dict[str, Any]) -> "ExchangeRates":
+        """
+        Курсы из ответа метода /dictionaries API HH
+
+        В справочнике HH rate - количество единиц валюты за единицу базовой
+        (базовая отмечена default), поэтому курс пересчитывается как 1 / rate.
+
+        :raises ValueError: Если в ответе нет справочника валют
+        """
+        currencies = payload.get("currency") if isinstance(payload, dict) else None
+        if not currencies:
+            raise ValueError("Dictionaries payload has no currency list")
+
+        base = next((c["code"] for c in currencies if c.get("default")), BASE_CURRENCY)
+        rates = {c["code"]: 1 / c["rate"] for c in currencies if c.get("rate")}
+        return cls(rates, base=base)
+
+    @classmethod
+    def from_file(cls, path: str) -> "ExchangeRates":
+        """
+        Загружает курсы из JSON-файла
+
+        Поддерживается формат save() ({"base", "rates", "fetched_at"}) и
+        сохранённый ответ /dictionaries API HH.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if "currency" in data:
+            rates = cls.from_hh_dictionaries(data)
+            rates.fetched_at = os.path.getmtime(path)
+            return rates
+        return cls(data["rates"], base=data.get("base", BASE_CURRENCY), fetched_at=data.get("fetched_at"))
+
+    def save(self, path: str) -> None:
+        """Сохраняет курсы в JSON-файл"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"base": self.base, "rates": self.rates, "fetched_at": self.fetched_at}, file, indent=4)
+        os.replace(tmp_path, path)
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Не устарели ли курсы (ttl в секундах)"""
+        return time.time() - self.fetched_at < ttl
+
+    def rate(self, currency: Optional[str]) -> Optional[float]:
+        """Курс валюты (None - базовая валюта; неизвестная валюта - None)"""
+        return self.rates.get(currency or self.base)
+
+    def convert(self, amount: Optional[float], currency: Optional[str]) -> Optional[float]:
+        """Пересчитывает сумму в базовую валюту (None, если сумма или курс неизвестны)"""
+        rate = self.rate(currency)
+        if amount is None or rate is None:
+            return None
+        return amount * rate
+
+    def normalize_salary(self, salary: Optional[Salary]) -> Optional[Salary]:
+        """
+        Зарплата с пересчитанными в базовую валюту границами
+
+        Зарплата в валюте без курса возвращается без изменений. Объекты
+        Salary с одинаковыми вилками и курсом переиспользуются.
+        """
+        if salary is None:
+            return None
+        rate = self.rate(salary.currency)
+        if rate is None:
+            return salary
+        return _normalized_salary(salary, rate)
+
+    def normalize(self, vacancy: Vacancy) -> Vacancy:
+        """Записывает в вакансию зарплату в базовой валюте и возвращает вакансию"""
+        vacancy.salary = self.normalize_salary(vacancy.salary)
+        return vacancy
+
+    def iter_normalize(self, vacancies: Iterable[Vacancy]) -> Iterator[Vacancy]:
+        """Лениво нормализует вакансии (для конвейера)"""
+        normalize = self.normalize
+        for vacancy in vacancies:
+            yield normalize(vacancy)
+
+    def normalize_many(self, vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+        """Нормализует вакансии списком"""
+        return list(self.iter_normalize(vacancies))
+
+
+@lru_cache(maxsize=65536)
+def _normalized_salary(salary: Salary, rate: float) -> Salary:
+    """Общий объект Salary с границами в базовой валюте"""
+    return Salary.shared(
+        salary.from_,
+        salary.to,
+        salary.currency,
+        None if salary.from_ is None else salary.from_ * rate,
+        None if salary.to is None else salary.to * rate,
+    )
+
+
+def load_rates(
+    cache_path: Optional[str] = "data/exchange_rates.json",
+    ttl: float = 24 * 60 * 60,
+    url: str = DICTIONARIES_URL,
+    timeout: float = 10.0,
+) -> ExchangeRates:
+    """
+    Курсы валют с кэшированием в файле
+
+    Свежий кэш (моложе ttl) используется без запроса к API; иначе курсы
+    загружаются из /dictionaries API HH и сохраняются в кэш. Если API
+    недоступно, используется устаревший кэш.
+
+    :param cache_path: Путь к файлу кэша (None - без кэша)
+    :param ttl: Время жизни кэша в секундах
+    :param url: Адрес справочников API HH
+    :param timeout: Таймаут запроса
+    :raises requests.exceptions.RequestException: Если API недоступно и кэша нет
+    """
+    cached = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            cached = ExchangeRates.from_file(cache_path)
+        except (OSError, ValueError, KeyError):
+            cached = None
+        if cached is not None and cached.is_fresh(ttl):
+            return cached
+
+    try:
+        response = requests.get(url, timeout=timeout, headers={"User-Agent": "vacancy_analyzer/1.0"})
+        response.raise_for_status()
+        rates = ExchangeRates.from_hh_dictionaries(response.json())
+    except (requests.exceptions.RequestException, ValueError):
+        if cached is not None:
+            return cached
+        raise
+
+    if cache_path:
+        rates.save(cache_path)
+    return rates
@@ -0,0 +1,222 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.models.vacancy import Vacancy
+from src.utils.keyword_index import TOKEN_RE
+
+FINGERPRINT_BITS = 64
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Веса признаков отпечатка: совпадение работодателя и вилки важнее совпадения отдельных слов
+WEIGHTS = {"name": 2, "employer": 4, "area": 2, "salary": 3, "text": 1}
+
+# Шаг округления зарплаты: вилки, отличающиеся меньше чем на шаг, считаются одинаковыми
+SALARY_STEP = 5000
+
+
+def _normalize(text: Optional[str]) -> List[str]:
+    """Слова текста в нижнем регистре без HTML-разметки (подсветка в сниппетах HH)"""
+    if not text:
+        return []
+    return TOKEN_RE.findall(HTML_TAG_RE.sub(" ", text).lower().replace("ё", "е"))
+
+
+@lru_cache(maxsize=262144)
+def _feature_signs(feature: str) -> Tuple[int, ...]:
+    """
+    Биты стабильного 64-битного хэша признака как +1/-1
+
+    hash() строк различается между процессами, поэтому используется blake2b.
+    Слова, работодатели и регионы повторяются, так что разложение кэшируется.
+    """
+    value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return tuple(1 if value >> bit & 1 else -1 for bit in range(FINGERPRINT_BITS))
+
+
+def vacancy_features(vacancy: Vacancy) -> Dict[str, int]:
+    """
+    Признаки вакансии для отпечатка с их весами
+
+    Название, требования и обязанности дают слова, работодатель, регион и
+    округлённая вилка зарплаты - по одному признаку целиком.
+    """
+    features: Dict[str, int] = {}
+    for word in _normalize(vacancy.name):
+        features[f"n:{word}"] = WEIGHTS["name"]
+    snippet = vacancy.snippet
+    if snippet:
+        for word in _normalize(f"{snippet.requirement or ''} {snippet.responsibility or ''}"):
+            features.setdefault(f"t:{word}", WEIGHTS["text"])
+    if vacancy.employer:
+        features[f"e:{' '.join(_normalize(vacancy.employer.name))}"] = WEIGHTS["employer"]
+    if vacancy.area:
+        features[f"a:{' '.join(_normalize(vacancy.area.name))}"] = WEIGHTS["area"]
+    if vacancy.salary:
+        salary_from = vacancy.salary_from_base
+        salary_to = vacancy.salary_to_base
+        features[
+            f"s:{None if salary_from is None else int(salary_from // SALARY_STEP)}"
+            f"-{None if salary_to is None else int(salary_to // SALARY_STEP)}"
+        ] = WEIGHTS["salary"]
+    return features
+
+
+def simhash(features: Dict[str, int]) -> int:
+    """64-битный SimHash взвешенных признаков: близкие наборы дают близкие по Хэммингу отпечатки"""
+    totals = [0] * FINGERPRINT_BITS
+    for feature, weight in features.items():
+        for bit, sign in enumerate(_feature_signs(feature)):
+            totals[bit] += weight * sign
+
+    fingerprint = 0
+    for bit, total in enumerate(totals):
+        if total > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def vacancy_fingerprint(vacancy: Vacancy) -> int:
+    """Отпечаток вакансии (см. vacancy_features)"""
+    return simhash(vacancy_features(vacancy))
+
+
+class NearDuplicateIndex:
+    """
+    Индекс отпечатков для поиска почти одинаковых вакансий
+
+    Отпечаток делится на max_distance + 1 полос: у отпечатков, отличающихся
+    не больше чем в max_distance битах, хотя бы одна полоса совпадает целиком
+    (принцип Дирихле). Поэтому кандидаты ищутся по корзинам полос, а
+    расстояние Хэмминга проверяется только для них, а не для всех вакансий.
+
+    Первая добавленная вакансия группы становится канонической, последующие
+    почти-дубликаты привязываются к ней.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        """
+        :param max_distance: Максимальное расстояние Хэмминга между отпечатками дубликатов
+        """
+        if not 0 <= max_distance < FINGERPRINT_BITS // 2:
+            raise ValueError("max_distance must be between 0 and 31")
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = FINGERPRINT_BITS // bands
+        self._bands: List[Tuple[int, int]] = [
+            # Последняя полоса забирает оставшиеся биты
+            (i * width, (FINGERPRINT_BITS - i * width) if i == bands - 1 else width)
+            for i in range(bands)
+        ]
+        self._buckets: Dict[Tuple[int, int], List[str]] = {}
+        self._fingerprints: Dict[str, int] = {}
+        self.canonical: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, vacancy_id: object) -> bool:
+        return vacancy_id in self._fingerprints
+
+    def find(self, vacancy: Vacancy, fingerprint: Optional[int] = None) -> Optional[str]:
+        """
+        Ищет каноническую вакансию, дубликатом которой является данная
+
+        :return: id канонической вакансии или None
+        """
+        if fingerprint is None:
+            fingerprint = vacancy_fingerprint(vacancy)
+        best_id, best_distance = None, self.max_distance + 1
+        for key in self._band_keys(fingerprint):
+            for candidate_id in self._buckets.get(key, ()):
+                if candidate_id == vacancy.id:
+                    continue
+                distance = bin(self._fingerprints[candidate_id] ^ fingerprint).count("1")
+                if distance < best_distance:
+                    best_id, best_distance = candidate_id, distance
+        return best_id
+
+    def add(self, vacancy: Vacancy) -> Optional[str]:
+        """
+        Добавляет вакансию: новую - как каноническую, дубликат - как ссылку на каноническую
+
+        :return: id канонической вакансии, если добавленная - дубликат, иначе None
+        """
+        if vacancy.id in self.canonical:
+            return self.canonical[vacancy.id]
+        if vacancy.id in self._fingerprints:
+            return None
+
+        fingerprint = vacancy_fingerprint(vacancy)
+        canonical_id = self.find(vacancy, fingerprint)
+        if canonical_id is not None:
+            self.canonical[vacancy.id] = canonical_id
+            return canonical_id
+
+        self._fingerprints[vacancy.id] = fingerprint
+        for key in self._band_keys(fingerprint):
+            self._buckets.setdefault(key, []).append(vacancy.id)
+        return None
+
+    def groups(self) -> Dict[str, List[str]]:
+        """Группы дубликатов: id канонической вакансии -> id её дубликатов"""
+        result: Dict[str, List[str]] = {}
+        for duplicate_id, canonical_id in self.canonical.items():
+            result.setdefault(canonical_id, []).append(duplicate_id)
+        return result
+
+    def _band_keys(self, fingerprint: int) -> Iterator[Tuple[int, int]]:
+        """Ключи корзин полос отпечатка"""
+        for number, (shift, width) in enumerate(self._bands):
+            yield number, fingerprint >> shift & ((1 << width) - 1)
+
+
+def iter_unique(
+    vacancies: Iterable[Vacancy], index: NearDuplicateIndex, stats: Optional[Dict[str, int]] = None
+) -> Iterator[Vacancy]:
+    """
+    Пропускает только канонические вакансии (для конвейера и загрузки)
+
+    Почти-дубликаты отбрасываются, их количество учитывается в stats["duplicates"].
+    """
+    for vacancy in vacancies:
+        if index.add(vacancy) is None:
+            yield vacancy
+        elif stats is not None:
+            stats["duplicates"] = stats.get("duplicates", 0) + 1
+
+
+def dedup_storage(
+    storage: Any, index: Optional[NearDuplicateIndex] = None, dry_run: bool = False
+) -> Dict[str, List[str]]:
+    """
+    Потоковый проход по хранилищу: находит почти-дубликаты и удаляет их
+
+    В хранилище остаётся каноническая (первая по порядку хранения) вакансия
+    каждой группы. JSONStorage читается лениво через open_reader, прочие
+    хранилища - через get_vacancies.
+
+    :param storage: Хранилище вакансий
+    :param index: Индекс отпечатков (например, уже заполненный при загрузке)
+    :param dry_run: Только найти дубликаты, не удаляя их
+    :return: Группы дубликатов: id канонической вакансии -> id удалённых дубликатов
+    """
+    if index is None:
+        index = NearDuplicateIndex()
+    if hasattr(storage, "open_reader"):
+        with storage.open_reader() as reader:
+            for vacancy in reader:
+                index.add(vacancy)
+    else:
+        for vacancy in storage.get_vacancies():
+            index.add(vacancy)
+
+    groups = index.groups()
+    duplicates = [vacancy_id for ids in groups.values() for vacancy_id in ids]
+    if duplicates and not dry_run:
+        if hasattr(storage, "delete_vacancies"):
+            storage.delete_vacancies(duplicates)
+        else:
+            for vacancy_id in duplicates:
+                storage.delete_vacancy(vacancy_id)
+    return groups
@@ -1,7 +1,27 @@
-from typing import List
+import heapq
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from src.models.vacancy import Vacancy
+from src.storage.criteria import normalize_text, vacancy_text
+from src.utils.metrics import metrics
 
 
+def iter_filter_vacancies(
+    vacancies: Iterable[Vacancy], filter_words: List[str]
+) -> Iterator[Vacancy]:
+    """Ленивая фильтрация вакансий по ключевым словам"""
+    if not filter_words:
+        yield from vacancies
+        return
+
+    # То же правило, что и у критерия keywords хранилищ (src.storage.criteria)
+    words = [normalize_text(word) for word in filter_words]
+    for vacancy in vacancies:
+        text = vacancy_text(vacancy)
+        if all(word in text for word in words):
+            yield vacancy
+
+
+@metrics.instrument("filter.keywords")
 def filter_vacancies(
     vacancies: List[Vacancy], filter_words: List[str]
 ) -> List[Vacancy]:
@@ -9,77 +29,195 @@ def filter_vacancies(
     if not filter_words:
         return vacancies
 
-    filtered = []
-    for vacancy in vacancies:
-        vacancy_text = (
-            f"{vacancy.name} "
-            f"{vacancy.snippet.requirement or ''} "
-            f"{vacancy.snippet.responsibility or ''}"
-        ).lower()
+    return list(iter_filter_vacancies(vacancies, filter_words))
 
-        if all(word.lower() in vacancy_text for word in filter_words):
-            filtered.append(vacancy)
-    return filtered
 
+def parse_salary_range(salary_range: str) -> Optional[Tuple[str, float, float]]:
+    """
+    Разбирает строку диапазона зарплат
 
-def get_vacancies_by_salary(
-    vacancies: List[Vacancy], salary_range: str
-) -> List[Vacancy]:
-    """Фильтрация вакансий по диапазону зарплат"""
-    if not salary_range.strip():
-        return vacancies
+    Форматы: "140000" - минимальная зарплата, "-150000" - максимальная,
+    "100000-150000" - полный диапазон.
+
+    :param salary_range: Строка диапазона
+    :return: Кортеж (тип проверки, минимум, максимум) или None для пустой строки
+    :raises ValueError: Если формат строки некорректен
+    """
+    salary_range = salary_range.strip()
+    if not salary_range:
+        return None
+
+    if salary_range.startswith("-"):
+        # Формат "-150000" - максимальная зарплата (проверяем salary_to <= MAX)
+        return "max", 0, int(salary_range[1:])
+    if "-" in salary_range:
+        # Формат "100000-150000" - полный диапазон (должны полностью попадать)
+        min_salary, max_salary = map(int, salary_range.split("-"))
+        return "range", min_salary, max_salary
+    # Формат "140000" - минимальная зарплата (проверяем salary_from >= MIN)
+    return "min", int(salary_range), float("inf")
 
+
+def parse_salary_range_or_warn(salary_range: str) -> Optional[Tuple[str, float, float]]:
+    """
+    Разбирает строку диапазона зарплат, сообщая о некорректном формате
+
+    Общий разбор для фильтров по зарплате (filters, SalaryIndex, VacancyColumns):
+    некорректная строка, как и пустая, означает отсутствие фильтра.
+
+    :return: Результат parse_salary_range или None
+    """
     try:
-        if salary_range.startswith("-"):
-            # Формат "-150000" - максимальная зарплата (проверяем salary_to <= MAX)
-            max_salary = int(salary_range[1:])
-            min_salary = 0
-            check_type = "max"
-        elif "-" in salary_range:
-            # Формат "100000-150000" - полный диапазон (должны полностью попадать)
-            min_salary, max_salary = map(int, salary_range.split("-"))
-            check_type = "range"
-        else:
-            # Формат "140000" - минимальная зарплата (проверяем salary_from >= MIN)
-            min_salary = int(salary_range)
-            max_salary = float("inf")
-            check_type = "min"
+        return parse_salary_range(salary_range)
     except ValueError:
         print(
             "Некорректный формат зарплаты. Используйте формат: 100000 или 100000-150000"
         )
-        return vacancies
+        return None
+
+
+def iter_vacancies_by_salary(
+    vacancies: Iterable[Vacancy], salary_range: str
+) -> Iterator[Vacancy]:
+    """Ленивая фильтрация вакансий по диапазону зарплат (формат разбирается сразу)"""
+    parsed = parse_salary_range_or_warn(salary_range)
 
-    filtered = []
+    if parsed is None:
+        return iter(vacancies)
+    return _iter_salary_matches(vacancies, *parsed)
+
+
+def _iter_salary_matches(
+    vacancies: Iterable[Vacancy], check_type: str, min_salary: float, max_salary: float
+) -> Iterator[Vacancy]:
+    """
+    Отбирает вакансии, зарплата которых удовлетворяет разобранному диапазону
+
+    Для нормализованных зарплат (см. src.utils.currency) сравниваются
+    границы в базовой валюте.
+    """
     for v in vacancies:
-        if not v.salary:
+        salary = v.salary
+        if not salary:
             continue
 
-        salary_from = v.salary.from_ or 0
-        salary_to = v.salary.to or float("inf")
+        if salary.normalized:
+            salary_from = salary.from_base or 0
+            salary_to = salary.to_base or float("inf")
+        else:
+            salary_from = salary.from_ or 0
+            salary_to = salary.to or float("inf")
 
         if check_type == "max":
             # Для "-MAX" - проверяем конечную зарплату <= MAX
             if salary_to <= max_salary:
-                filtered.append(v)
+                yield v
         elif check_type == "min":
             # Для "MIN" - проверяем начальную зарплату >= MIN
             if salary_from >= min_salary:
-                filtered.append(v)
+                yield v
         else:
             # Для "MIN-MAX" - проверяем полное вхождение диапазона
             if salary_from >= min_salary and salary_to <= max_salary:
-                filtered.append(v)
-    return filtered
+                yield v
 
 
+@metrics.instrument("filter.salary")
+def get_vacancies_by_salary(
+    vacancies: List[Vacancy], salary_range: str
+) -> List[Vacancy]:
+    """Фильтрация вакансий по диапазону зарплат"""
+    if not salary_range.strip():
+        return vacancies
+
+    return list(iter_vacancies_by_salary(vacancies, salary_range))
+
+
+def salary_sort_key(v: Vacancy) -> Tuple[float, float]:
+    """Ключ сортировки вакансий по зарплате (в базовой валюте, если она нормализована)"""
+    return v.salary_from_base or 0, v.salary_to_base or 0
+
+
+@metrics.instrument("sort")
 def sort_vacancies(vacancies: List[Vacancy]) -> List[Vacancy]:
     """Сортировка вакансий по зарплате (по убыванию)"""
-    return sorted(
-        vacancies, key=lambda v: (v.salary_from or 0, v.salary_to or 0), reverse=True
-    )
+    return sorted(vacancies, key=salary_sort_key, reverse=True)
 
 
 def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
     """Получение топ N вакансий"""
     return vacancies[:top_n] if top_n > 0 else []
+
+
+def salary_midpoint(v: Vacancy) -> float:
+    """Середина зарплатной вилки (одна граница, если вторая не указана, или 0)"""
+    return _midpoint(v.salary_from_base, v.salary_to_base)
+
+
+def _midpoint(salary_from: Optional[float], salary_to: Optional[float]) -> float:
+    """Середина вилки по её границам"""
+    if salary_from is not None and salary_to is not None:
+        return (salary_from + salary_to) / 2
+    if salary_from is not None:
+        return salary_from
+    return salary_to or 0
+
+
+SORT_KEYS: Dict[str, Callable[[Vacancy], object]] = {
+    "salary": salary_sort_key,
+    "midpoint": salary_midpoint,
+    "salary_to": lambda v: v.salary_to_base or 0,
+}
+
+
+def top_vacancies(
+    vacancies: Iterable[Vacancy],
+    n: int,
+    key: Union[str, Callable[[Vacancy], object]] = "salary",
+    rates: Optional[Dict[str, float]] = None,
+) -> List[Vacancy]:
+    """
+    Выбор топ N вакансий по убыванию ключа без полной сортировки
+
+    Работает за O(N log n) и принимает любой итератор. При равенстве ключей
+    раньше идёт вакансия, встретившаяся раньше, поэтому результат совпадает с
+    get_top_vacancies(sorted(vacancies, key=key, reverse=True), n).
+
+    :param vacancies: Вакансии
+    :param n: Количество вакансий
+    :param key: "salary" (как sort_vacancies), "midpoint", "salary_to",
+        "normalized" (середина вилки в рублях по курсам rates) или функция;
+        ключи кроме "normalized" используют заранее нормализованные зарплаты, если они есть.
+        Вакансии в валютах без курса в rates не участвуют в выборе по ключу "normalized":
+        их зарплаты несравнимы с остальными
+    :param rates: Курсы для ключа "normalized": код валюты -> стоимость единицы в рублях
+        (словарь или src.utils.currency.ExchangeRates)
+    :return: Список из не более чем n вакансий
+    """
+    if n <= 0:
+        return []
+
+    if key == "normalized":
+        if rates is None:
+            raise ValueError("Rates are required for the 'normalized' sort key")
+        rates = getattr(rates, "rates", rates)
+        vacancies = (v for v in vacancies if (v.salary_currency or "RUR") in rates)
+        key_func = _normalized_key(rates)
+    elif callable(key):
+        key_func = key
+    elif key in SORT_KEYS:
+        key_func = SORT_KEYS[key]
+    else:
+        raise ValueError(f"Unknown sort key: {key}")
+
+    return heapq.nlargest(n, vacancies, key=key_func)
+
+
+def _normalized_key(rates: Dict[str, float]) -> Callable[[Vacancy], float]:
+    """Ключ сортировки по середине вилки в рублях (валюта вакансии должна быть в rates)"""
+
+    def key(v: Vacancy) -> float:
+        # Исходные границы: нормализованные уже пересчитаны по другой таблице курсов
+        return _midpoint(v.salary_from, v.salary_to) * rates[v.salary_currency or "RUR"]
+
+    return key
@@ -0,0 +1,373 @@
+import bisect
+import json
+import os
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+from src.models.vacancy import Vacancy
+from src.storage.criteria import normalize_text
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Длина n-грамм словаря для поиска по части слова
+GRAM_SIZE = 3
+
+
+def tokenize(text: str) -> Set[str]:
+    """Разбивает текст на множество слов (нормализованных как в criteria.normalize_text)"""
+    return set(TOKEN_RE.findall(normalize_text(text)))
+
+
+def token_grams(token: str) -> Set[str]:
+    """N-граммы слова для поиска по подстроке: все части длиной до GRAM_SIZE символов"""
+    return {
+        token[start:start + size]
+        for size in range(1, GRAM_SIZE + 1)
+        for start in range(len(token) - size + 1)
+    }
+
+
+def vacancy_tokens(vacancy: Union[Vacancy, Dict]) -> Set[str]:
+    """Слова вакансии из тех же полей, что и в filter_vacancies (название, требования, обязанности)"""
+    if isinstance(vacancy, dict):
+        vacancy = Vacancy.from_dict(vacancy)
+    snippet = vacancy.snippet
+    return tokenize(
+        f"{vacancy.name} "
+        f"{(snippet.requirement if snippet else None) or ''} "
+        f"{(snippet.responsibility if snippet else None) or ''}"
+    )
+
+
+class KeywordIndex:
+    """
+    Инвертированный индекс слов вакансий
+
+    Для каждого слова хранится множество id вакансий (posting list). Запросы
+    AND/OR/NOT выполняются пересечением, объединением и вычитанием множеств,
+    начиная с самого короткого списка, поэтому время ответа зависит от числа
+    совпадений, а не от размера корпуса.
+
+    Если задан path, индекс сохраняется на диск: изменения дописываются в
+    журнал (<path>.log) по одной строке, save() записывает полный снимок.
+
+    generation - метка состояния индексируемого хранилища (для JSONLinesStorage -
+    размер файла), до которого индекс актуален; сохраняется вместе с индексом,
+    чтобы хранилище могло обнаружить устаревший индекс.
+
+    Для поиска по части слова (substring) словарь индексируется по n-граммам
+    (token_grams): кандидаты - пересечение слов с n-граммами запроса, поэтому
+    перебираются только слова, содержащие эти n-граммы, а не весь словарь.
+    Индекс n-грамм строится при первом таком запросе и далее обновляется
+    вместе со словарём.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.generation: Optional[int] = None
+        self._postings: Dict[str, Set[str]] = {}
+        self._documents: Dict[str, Set[str]] = {}
+        # Отсортированный словарь для поиска по префиксу; None - нужно перестроить
+        self._sorted_tokens: Optional[List[str]] = []
+        # n-грамма -> слова словаря, которые её содержат; None - построить при первом запросе
+        self._grams: Optional[Dict[str, Set[str]]] = None
+        # Строки журнала, накопленные внутри batch(); None - писать сразу
+        self._pending_log: Optional[List[str]] = None
+        if path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, vacancy_id: object) -> bool:
+        return vacancy_id in self._documents
+
+    @classmethod
+    def build(cls, vacancies: Iterable[Union[Vacancy, Dict]], path: Optional[str] = None) -> "KeywordIndex":
+        """Строит индекс по вакансиям (например, storage.get_vacancies()) и сохраняет снимок"""
+        index = cls()
+        index.path = path
+        index._sorted_tokens = None
+        for vacancy in vacancies:
+            index._add_tokens(cls._vacancy_id(vacancy), vacancy_tokens(vacancy))
+        if path:
+            index.save()
+        return index
+
+    def add(self, vacancy: Union[Vacancy, Dict]) -> None:
+        """Добавляет вакансию в индекс (повторное добавление заменяет старую версию)"""
+        vacancy_id = self._vacancy_id(vacancy)
+        tokens = vacancy_tokens(vacancy)
+        self._add_tokens(vacancy_id, tokens)
+        self._log(f"+{vacancy_id}\t{' '.join(sorted(tokens))}\n")
+
+    def remove(self, vacancy_id: str) -> None:
+        """Удаляет вакансию из индекса"""
+        if vacancy_id in self._documents:
+            self._remove_tokens(vacancy_id)
+            self._log(f"-{vacancy_id}\n")
+
+    def clear(self) -> None:
+        """Удаляет из индекса все вакансии (сохранённый индекс перезаписывается пустым снимком)"""
+        self._postings = {}
+        self._documents = {}
+        self._sorted_tokens = None
+        self._grams = None
+        self.generation = None
+        if self.path:
+            self.save()
+
+    def set_generation(self, generation: int) -> None:
+        """Запоминает метку состояния хранилища, до которого индекс актуален"""
+        self.generation = generation
+        self._log(f"={generation}\n")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Изменения внутри блока записываются в журнал одной операцией"""
+        if self._pending_log is not None:
+            yield
+            return
+        self._pending_log = []
+        try:
+            yield
+        finally:
+            lines, self._pending_log = self._pending_log, None
+            self._write_log(lines)
+
+    def query(
+        self,
+        all_words: Iterable[str] = (),
+        any_words: Iterable[str] = (),
+        not_words: Iterable[str] = (),
+        prefix: bool = False,
+        substring: bool = False,
+    ) -> Set[str]:
+        """
+        Поиск id вакансий по словам
+
+        :param all_words: Слова, которые должны встречаться все (AND)
+        :param any_words: Слова, из которых должно встречаться хотя бы одно (OR)
+        :param not_words: Слова, которые не должны встречаться (NOT)
+        :param prefix: Считать слово совпавшим, если оно является началом слова вакансии
+        :param substring: Считать слово совпавшим, если оно входит в слово вакансии
+            (кандидаты из индекса n-грамм словаря; для критерия keywords хранилищ)
+        :return: Множество id вакансий
+        """
+        required = [self._lookup(word, prefix, substring) for word in all_words]
+        if any_words:
+            alternatives: Set[str] = set()
+            for word in any_words:
+                alternatives |= self._lookup(word, prefix, substring)
+            required.append(alternatives)
+
+        if required:
+            required.sort(key=len)
+            result = set(required[0])
+            for postings in required[1:]:
+                if not result:
+                    break
+                result &= postings
+        else:
+            result = set(self._documents)
+
+        for word in not_words:
+            if not result:
+                break
+            result -= self._lookup(word, prefix, substring)
+        return result
+
+    def search(self, expression: str, prefix: bool = False) -> Set[str]:
+        """
+        Поиск по строке запроса
+
+        Слова через пробел объединяются по AND, варианты через "|" - по OR
+        (каждая группа должна совпасть), слово с "-" в начале исключается.
+        Пример: "python django|flask -стажер".
+        """
+        groups: List[Set[str]] = []
+        not_words = []
+        for term in expression.split():
+            if term.startswith("-") and len(term) > 1:
+                not_words.append(term[1:])
+            elif "|" in term:
+                group: Set[str] = set()
+                for word in filter(None, term.split("|")):
+                    group |= self._lookup(word, prefix)
+                groups.append(group)
+            else:
+                groups.append(self._lookup(term, prefix))
+
+        if not groups:
+            return self.query(not_words=not_words, prefix=prefix)
+
+        groups.sort(key=len)
+        result = set(groups[0])
+        for group in groups[1:]:
+            result &= group
+        for word in not_words:
+            result -= self._lookup(word, prefix)
+        return result
+
+    def save(self) -> None:
+        """Записывает полный снимок индекса и очищает журнал"""
+        if not self.path:
+            raise ValueError("Index path is not set")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "generation": self.generation,
+                    "documents": {vacancy_id: sorted(tokens) for vacancy_id, tokens in self._documents.items()},
+                },
+                file,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+        if os.path.exists(self._log_path):
+            os.remove(self._log_path)
+
+    @property
+    def _log_path(self) -> str:
+        """Путь к журналу изменений"""
+        return f"{self.path}.log"
+
+    def _lookup(self, word: str, prefix: bool, substring: bool = False) -> Set[str]:
+        """Возвращает posting list слова (или объединение списков слов с таким началом или частью)"""
+        tokens = tokenize(word)
+        if not tokens:
+            return set()
+        if len(tokens) > 1:
+            # Составное слово ("back-end", "1С:Предприятие") требует всех своих частей
+            parts = sorted((self._lookup(token, prefix, substring) for token in tokens), key=len)
+            return set.intersection(*parts)
+
+        token = tokens.pop()
+        if substring:
+            result: Set[str] = set()
+            for candidate in self._substring_tokens(token):
+                result |= self._postings[candidate]
+            return result
+        if not prefix:
+            return self._postings.get(token, set())
+
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+
+        result = set()
+        position = bisect.bisect_left(self._sorted_tokens, token)
+        while position < len(self._sorted_tokens) and self._sorted_tokens[position].startswith(token):
+            result |= self._postings[self._sorted_tokens[position]]
+            position += 1
+        return result
+
+    def _substring_tokens(self, token: str) -> Set[str]:
+        """Слова словаря, содержащие token (по индексу n-грамм)"""
+        if self._grams is None:
+            self._grams = {}
+            for candidate in self._postings:
+                self._add_grams(candidate)
+        if len(token) <= GRAM_SIZE:
+            return self._grams.get(token, set())
+
+        grams = sorted(
+            (self._grams.get(token[start:start + GRAM_SIZE], set()) for start in range(len(token) - GRAM_SIZE + 1)),
+            key=len,
+        )
+        candidates = set(grams[0])
+        for gram_tokens in grams[1:]:
+            if not candidates:
+                break
+            candidates &= gram_tokens
+        return {candidate for candidate in candidates if token in candidate}
+
+    def _add_grams(self, token: str) -> None:
+        """Добавляет слово словаря в индекс n-грамм"""
+        for gram in token_grams(token):
+            self._grams.setdefault(gram, set()).add(token)
+
+    def _remove_grams(self, token: str) -> None:
+        """Удаляет слово словаря из индекса n-грамм"""
+        for gram in token_grams(token):
+            gram_tokens = self._grams[gram]
+            gram_tokens.discard(token)
+            if not gram_tokens:
+                del self._grams[gram]
+
+    def _add_tokens(self, vacancy_id: str, tokens: Set[str]) -> None:
+        """Добавляет слова документа в posting lists"""
+        if vacancy_id in self._documents:
+            self._remove_tokens(vacancy_id)
+        self._documents[vacancy_id] = tokens
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                if self._sorted_tokens is not None:
+                    bisect.insort(self._sorted_tokens, token)
+                if self._grams is not None:
+                    self._add_grams(token)
+            postings.add(vacancy_id)
+
+    def _remove_tokens(self, vacancy_id: str) -> None:
+        """Удаляет документ из posting lists"""
+        for token in self._documents.pop(vacancy_id):
+            postings = self._postings[token]
+            postings.discard(vacancy_id)
+            if not postings:
+                del self._postings[token]
+                if self._sorted_tokens is not None:
+                    del self._sorted_tokens[bisect.bisect_left(self._sorted_tokens, token)]
+                if self._grams is not None:
+                    self._remove_grams(token)
+
+    def _log(self, line: str) -> None:
+        """Дописывает изменение в журнал (внутри batch() - откладывает до конца блока)"""
+        if self._pending_log is not None:
+            self._pending_log.append(line)
+        else:
+            self._write_log([line])
+
+    def _write_log(self, lines: List[str]) -> None:
+        """Дописывает строки в журнал одним открытием файла"""
+        if self.path and lines:
+            with open(self._log_path, "a", encoding="utf-8") as file:
+                file.writelines(lines)
+
+    def _load(self) -> None:
+        """Загружает снимок и применяет журнал изменений"""
+        self._sorted_tokens = None
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if "documents" in data:
+                self.generation = data.get("generation")
+                data = data["documents"]
+            for vacancy_id, tokens in data.items():
+                self._add_tokens(vacancy_id, set(tokens))
+
+        if os.path.exists(self._log_path):
+            with open(self._log_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if not line.endswith("\n"):
+                        break
+                    line = line[:-1]
+                    if line.startswith("+"):
+                        vacancy_id, _, tokens = line[1:].partition("\t")
+                        self._add_tokens(vacancy_id, set(tokens.split()))
+                    elif line.startswith("-") and line[1:] in self._documents:
+                        self._remove_tokens(line[1:])
+                    elif line.startswith("="):
+                        self.generation = int(line[1:])
+
+    @staticmethod
+    def _vacancy_id(vacancy: Union[Vacancy, Dict]) -> str:
+        """Возвращает id вакансии"""
+        vacancy_id = vacancy.get("id") if isinstance(vacancy, dict) else vacancy.id
+        if not isinstance(vacancy_id, str):
+            raise ValueError("Vacancy must have a string 'id' field")
+        return vacancy_id
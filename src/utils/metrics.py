@@ -0,0 +1,260 @@
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+# Переменные окружения для main.user_interaction
+METRICS_ENV = "VACANCY_METRICS"  # путь для выгрузки метрик (.prom - формат Prometheus, иначе JSON)
+PROFILE_ENV = "VACANCY_PROFILE"  # префикс файлов профиля (<префикс>.prof и <префикс>.memory.txt)
+
+PROMETHEUS_PREFIX = "vacancy"
+
+
+class _NullTimer:
+    """Таймер-заглушка для выключенных метрик (общий, ничего не измеряет)"""
+
+    records = 0
+    bytes = 0
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Таймер этапа; records и bytes можно задать внутри блока with"""
+
+    def __init__(self, metrics: "Metrics", stage: str):
+        self._metrics = metrics
+        self._stage = stage
+        self.records = 0
+        self.bytes = 0
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._metrics.observe(self._stage, time.perf_counter() - self._started, self.records, self.bytes)
+
+
+class TimedIterator:
+    """Итератор, считающий элементы и время их получения из исходного итератора"""
+
+    def __init__(self, iterable: Iterable[Any]):
+        self._iterator = iter(iterable)
+        self.seconds = 0.0
+        self.count = 0
+
+    def __iter__(self) -> "TimedIterator":
+        return self
+
+    def __next__(self) -> Any:
+        started = time.perf_counter()
+        try:
+            item = next(self._iterator)
+        finally:
+            self.seconds += time.perf_counter() - started
+        self.count += 1
+        return item
+
+
+class Metrics:
+    """
+    Счётчики и таймеры этапов (загрузка, разбор, фильтры, сохранение)
+
+    Для каждого этапа накапливаются количество вызовов, время в секундах,
+    количество записей и байт. Пока метрики выключены, таймеры возвращают
+    общую заглушку, а observe и increment сразу выходят, поэтому
+    инструментирование горячих участков почти ничего не стоит.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self) -> None:
+        """Включает сбор метрик"""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Выключает сбор метрик (накопленные значения сохраняются)"""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Сбрасывает накопленные значения"""
+        with self._lock:
+            self._stages: Dict[str, Dict[str, float]] = {}
+            self._counters: Dict[str, int] = {}
+
+    def observe(self, stage: str, seconds: float, records: int = 0, size: int = 0) -> None:
+        """
+        Учитывает один вызов этапа
+
+        :param stage: Имя этапа, например "api.request" или "storage.write"
+        :param seconds: Время выполнения
+        :param records: Количество обработанных записей
+        :param size: Количество байт
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            values = self._stages.get(stage)
+            if values is None:
+                values = self._stages[stage] = {"calls": 0, "seconds": 0.0, "records": 0, "bytes": 0}
+            values["calls"] += 1
+            values["seconds"] += seconds
+            values["records"] += records
+            values["bytes"] += size
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Увеличивает счётчик события"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def timer(self, stage: str) -> Any:
+        """Контекстный менеджер, измеряющий время блока как один вызов этапа"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    def instrument(self, stage: str) -> Callable[[Callable], Callable]:
+        """
+        Декоратор: время вызова функции как этап (записи - длина возвращённого списка)
+
+        Включённость проверяется при каждом вызове, поэтому декоратор можно
+        применять при импорте модуля.
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                result = func(*args, **kwargs)
+                records = len(result) if isinstance(result, list) else 0
+                self.observe(stage, time.perf_counter() - started, records)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Копия накопленных значений: {"stages": {...}, "counters": {...}}"""
+        with self._lock:
+            return {
+                "stages": {stage: dict(values) for stage, values in self._stages.items()},
+                "counters": dict(self._counters),
+            }
+
+    def to_json(self) -> str:
+        """Метрики в JSON"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=4)
+
+    def to_prometheus(self) -> str:
+        """Метрики в текстовом формате Prometheus"""
+        snapshot = self.snapshot()
+        lines = []
+        for field, suffix in (("calls", "calls_total"), ("seconds", "seconds_total"),
+                              ("records", "records_total"), ("bytes", "bytes_total")):
+            name = f"{PROMETHEUS_PREFIX}_stage_{suffix}"
+            lines.append(f"# TYPE {name} counter")
+            for stage, values in sorted(snapshot["stages"].items()):
+                lines.append(f'{name}{{stage="{_escape_label(stage)}"}} {values[field]}')
+        name = f"{PROMETHEUS_PREFIX}_events_total"
+        lines.append(f"# TYPE {name} counter")
+        for event, value in sorted(snapshot["counters"].items()):
+            lines.append(f'{name}{{event="{_escape_label(event)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        """Сохраняет метрики в файл: .prom - в формате Prometheus, иначе JSON"""
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+
+def _escape_label(value: str) -> str:
+    """Экранирует значение метки Prometheus"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Общий экземпляр, которым пользуются API, хранилища, фильтры и конвейер
+metrics = Metrics()
+
+
+@contextmanager
+def profile(path_prefix: str, memory: bool = True, top: int = 30) -> Iterator[None]:
+    """
+    Снимает профиль cProfile (и распределение памяти tracemalloc) для блока
+
+    Результаты: <префикс>.prof (для pstats или snakeviz) и <префикс>.memory.txt
+    с top строками кода, выделившими больше всего памяти.
+
+    :param path_prefix: Префикс путей файлов профиля
+    :param memory: Снимать также профиль памяти
+    :param top: Количество строк в отчёте по памяти
+    """
+    directory = os.path.dirname(path_prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(f"{path_prefix}.prof")
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            with open(f"{path_prefix}.memory.txt", "w", encoding="utf-8") as file:
+                for stat in snapshot.statistics("lineno")[:top]:
+                    file.write(f"{stat}\n")
+
+
+@contextmanager
+def instrumentation_from_env() -> Iterator[None]:
+    """
+    Включает метрики и профилирование по переменным окружения
+
+    VACANCY_METRICS=<путь> - собрать метрики и сохранить их по окончании блока;
+    VACANCY_PROFILE=<префикс> - снять профиль cProfile и tracemalloc.
+    Без переменных блок выполняется без накладных расходов.
+    """
+    metrics_path = os.environ.get(METRICS_ENV)
+    profile_prefix = os.environ.get(PROFILE_ENV)
+
+    if metrics_path:
+        metrics.reset()
+        metrics.enable()
+    try:
+        if profile_prefix:
+            with profile(profile_prefix):
+                yield
+        else:
+            yield
+    finally:
+        if metrics_path:
+            metrics.disable()
+            metrics.export(metrics_path)
@@ -0,0 +1,231 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.models.vacancy import Salary, Snippet, Vacancy
+from src.storage.json_storage import JSONStorage
+from src.utils.metrics import metrics
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Результат задачи: упакованные вакансии (или количество записанных в журнал) и ошибки
+ChunkResult = Tuple[Any, List[Tuple[Any, str]]]
+
+
+def _pack(vacancy: Vacancy) -> Tuple:
+    """
+    Упаковывает вакансию в кортеж простых значений
+
+    Кортежи строк и чисел сериализуются pickle в несколько раз быстрее
+    dataclass-объектов, а вложенные объекты при распаковке снова
+    разделяются через кэши модели.
+    """
+    salary, snippet = vacancy.salary, vacancy.snippet
+    area, employer = vacancy.area, vacancy.employer
+    experience, employment = vacancy.experience, vacancy.employment
+    return (
+        vacancy.id,
+        vacancy.name,
+        None if salary is None else (salary.from_, salary.to, salary.currency, salary.from_base, salary.to_base),
+        None if area is None else area.name,
+        None if employer is None else employer.name,
+        None if experience is None else experience.name,
+        None if employment is None else employment.name,
+        None if snippet is None else (snippet.requirement, snippet.responsibility),
+        vacancy.alternate_url,
+    )
+
+
+def _unpack(row: Tuple) -> Vacancy:
+    """Восстанавливает вакансию из кортежа _pack"""
+    vacancy_id, name, salary, area, employer, experience, employment, snippet, alternate_url = row
+    return Vacancy.from_parts(
+        vacancy_id,
+        name,
+        salary=None if salary is None else Salary.shared(*salary),
+        area=area,
+        employer=employer,
+        experience=experience,
+        employment=employment,
+        snippet=None if snippet is None else Snippet(*snippet),
+        alternate_url=alternate_url,
+    )
+
+
+def _parse_items(items: List[Any], offset: int, journal_path: Optional[str]) -> ChunkResult:
+    """
+    Разбирает пачку данных API (выполняется в рабочем процессе)
+
+    :param journal_path: Хранилище JSONStorage, в журнал которого пишутся вакансии;
+        None - вакансии возвращаются упакованными
+    """
+    errors: List[Tuple[int, str]] = []
+    vacancies = Vacancy.from_hh_data_many(items, errors)
+    errors = [(offset + position, message) for position, message in errors]
+    if journal_path is None:
+        return [_pack(vacancy) for vacancy in vacancies], errors
+    staged, _ = JSONStorage(file_path=journal_path).stage_vacancies(vacancies)
+    return staged, errors
+
+
+def _parse_file(path: str, journal_path: Optional[str]) -> ChunkResult:
+    """
+    Читает и разбирает сохранённый ответ API (выполняется в рабочем процессе)
+
+    Файл - страница выдачи ({"items": [...]}) или список вакансий.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = json.loads(file.read())
+    except (OSError, ValueError) as e:
+        return ([] if journal_path is None else 0), [(path, f"Не удалось прочитать файл: {e}")]
+
+    items = data.get("items", []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return ([] if journal_path is None else 0), [(path, "Файл не содержит списка вакансий")]
+    result, errors = _parse_items(items, 0, journal_path)
+    return result, [(f"{path}:{position}", message) for position, message in errors]
+
+
+def _chunks(items: Iterable[Any], chunk_size: int) -> Iterator[Tuple[List[Any], int]]:
+    """Нарезает поток данных на пачки вместе с номером первой записи"""
+    iterator = iter(items)
+    offset = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk, offset
+        offset += len(chunk)
+
+
+def _run(
+    tasks: Iterable[Tuple[Any, ...]],
+    worker: Callable[..., ChunkResult],
+    max_workers: Optional[int],
+) -> Iterator[ChunkResult]:
+    """
+    Выполняет задачи в пуле процессов и отдаёт результаты в порядке задач
+
+    Одновременно в работе держится не больше 2 * max_workers задач, поэтому
+    входной поток не вычитывается в память целиком.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers <= 1:
+        for args in tasks:
+            yield worker(*args)
+        return
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for args in tasks:
+            pending.append(pool.submit(worker, *args))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _collect(results: Iterator[ChunkResult], errors: Optional[List[Tuple[Any, str]]]) -> List[Vacancy]:
+    """Распаковывает вакансии из результатов задач"""
+    vacancies: List[Vacancy] = []
+    with metrics.timer("parse.parallel") as timer:
+        for rows, chunk_errors in results:
+            vacancies.extend(map(_unpack, rows))
+            if errors is not None:
+                errors.extend(chunk_errors)
+        timer.records = len(vacancies)
+    return vacancies
+
+
+def _ingest(
+    results: Iterator[ChunkResult], storage: JSONStorage, errors: Optional[List[Tuple[Any, str]]]
+) -> Dict[str, int]:
+    """Дожидается записи всех пачек в журнал и переносит журнал в хранилище"""
+    stats = {"parsed": 0, "errors": 0, "inserted": 0, "skipped": 0}
+    with metrics.timer("parse.parallel") as timer:
+        for staged, chunk_errors in results:
+            stats["parsed"] += staged
+            stats["errors"] += len(chunk_errors)
+            if errors is not None:
+                errors.extend(chunk_errors)
+        stats["inserted"], stats["skipped"] = storage.commit_journal()
+        timer.records = stats["parsed"]
+    return stats
+
+
+def parse_parallel(
+    raw_vacancies: Iterable[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    errors: Optional[List[Tuple[Any, str]]] = None,
+) -> List[Vacancy]:
+    """
+    Разбирает данные API в объекты Vacancy в пуле процессов
+
+    Данные нарезаются на пачки по chunk_size записей: каждая пачка - одна
+    задача, поэтому накладные расходы на передачу между процессами делятся
+    на всю пачку, а вакансии возвращаются компактными кортежами. Ошибки
+    собираются в рабочих процессах и приходят вместе с результатом пачки.
+    Порядок вакансий совпадает с порядком данных.
+
+    :param raw_vacancies: Данные вакансий от API (любой итератор)
+    :param chunk_size: Размер пачки
+    :param max_workers: Количество процессов (по умолчанию - число ядер; 1 - без пула)
+    :param errors: Список, в который добавляются пары (номер записи, текст ошибки)
+    :return: Список вакансий
+    """
+    tasks = ((chunk, offset, None) for chunk, offset in _chunks(raw_vacancies, chunk_size))
+    return _collect(_run(tasks, _parse_items, max_workers), errors)
+
+
+def ingest_parallel(
+    raw_vacancies: Iterable[Any],
+    storage: JSONStorage,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    errors: Optional[List[Tuple[Any, str]]] = None,
+) -> Dict[str, int]:
+    """
+    Разбирает данные API в пуле процессов и сохраняет вакансии в хранилище
+
+    Рабочие процессы сами дописывают разобранные пачки в журнал хранилища
+    (см. JSONStorage.stage_vacancies) и возвращают только счётчики и ошибки;
+    в конце журнал переносится в хранилище одной записью файла.
+
+    :return: Счётчики parsed, errors, inserted, skipped
+    """
+    tasks = ((chunk, offset, storage.file_path) for chunk, offset in _chunks(raw_vacancies, chunk_size))
+    return _ingest(_run(tasks, _parse_items, max_workers), storage, errors)
+
+
+def parse_files(
+    paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    errors: Optional[List[Tuple[Any, str]]] = None,
+) -> List[Vacancy]:
+    """
+    Разбирает сохранённые ответы API (по странице выдачи в файле) в пуле процессов
+
+    Файлы читаются в рабочих процессах, между процессами передаются только
+    пути и результаты. Ошибки записей указываются как "путь:номер".
+    """
+    return _collect(_run(((path, None) for path in paths), _parse_file, max_workers), errors)
+
+
+def ingest_files(
+    paths: Iterable[str],
+    storage: JSONStorage,
+    max_workers: Optional[int] = None,
+    errors: Optional[List[Tuple[Any, str]]] = None,
+) -> Dict[str, int]:
+    """
+    Разбирает сохранённые ответы API и сохраняет вакансии в хранилище
+
+    Данные вакансий не передаются между процессами вовсе: рабочие процессы
+    читают файлы и пишут результат в журнал хранилища.
+    """
+    tasks = ((path, storage.file_path) for path in paths)
+    return _ingest(_run(tasks, _parse_file, max_workers), storage, errors)
@@ -0,0 +1,150 @@
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.models.vacancy import Vacancy
+from src.utils.filters import (
+    iter_filter_vacancies,
+    iter_vacancies_by_salary,
+    top_vacancies,
+)
+from src.utils.dedup import iter_unique
+from src.utils.metrics import TimedIterator, metrics
+
+
+def parse_vacancies(
+    raw_vacancies: Iterable[Any], stats: Optional[Dict[str, int]] = None
+) -> Iterator[Vacancy]:
+    """
+    Лениво преобразует данные API в объекты Vacancy
+
+    Невалидные записи пропускаются, их количество учитывается в stats["errors"].
+    """
+    for raw in raw_vacancies:
+        # Пропускаем невалидные данные
+        if not isinstance(raw, dict):
+            _increment(stats, "errors")
+            continue
+        try:
+            vacancy = Vacancy.from_hh_data(raw)
+        except Exception as e:
+            print(f"Ошибка при обработке вакансии: {str(e)}")
+            _increment(stats, "errors")
+            continue
+        _increment(stats, "parsed")
+        yield vacancy
+
+
+def save_stream(
+    vacancies: Iterable[Vacancy],
+    storage: Any,
+    batch_size: int = 1000,
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[Vacancy]:
+    """
+    Сохраняет вакансии в хранилище пачками и передаёт их дальше по конвейеру
+
+    Хранилище должно поддерживать add_vacancies(iterable) с отчётом о количестве
+    добавленных и пропущенных вакансий (JSONStorage, JSONLinesStorage, SQLiteStorage).
+    """
+    batch: List[Vacancy] = []
+
+    def flush() -> None:
+        if batch:
+            result = storage.add_vacancies(batch)
+            _increment(stats, "saved", result["inserted"])
+            _increment(stats, "skipped", result["skipped"])
+            batch.clear()
+
+    try:
+        for vacancy in vacancies:
+            batch.append(vacancy)
+            if len(batch) >= batch_size:
+                flush()
+            yield vacancy
+    finally:
+        flush()
+
+
+def count_stream(iterable: Iterable[Any], stats: Dict[str, int], key: str) -> Iterator[Any]:
+    """Пропускает элементы без изменений, подсчитывая их в stats[key]"""
+    stats.setdefault(key, 0)
+    for item in iterable:
+        stats[key] += 1
+        yield item
+
+
+def run_pipeline(
+    raw_vacancies: Iterable[Any],
+    filter_words: List[str],
+    salary_range: str,
+    top_n: int,
+    storage: Any = None,
+    batch_size: int = 1000,
+    rates: Any = None,
+    dedup: Any = None,
+) -> Tuple[List[Vacancy], Dict[str, int]]:
+    """
+    Потоковый конвейер: разбор -> сохранение -> фильтры -> топ N
+
+    Вакансии проходят по этапам по одной, в памяти держатся только текущая
+    пачка для сохранения и куча из top_n лучших вакансий, поэтому расход памяти
+    не зависит от числа загруженных страниц.
+
+    :param raw_vacancies: Данные вакансий от API (например, HeadHunterAPI.iter_all_vacancies)
+    :param filter_words: Ключевые слова для фильтрации
+    :param salary_range: Диапазон зарплат (см. filters.parse_salary_range)
+    :param top_n: Количество лучших вакансий
+    :param storage: Хранилище для сохранения всех разобранных вакансий (необязательно)
+    :param batch_size: Размер пачки при сохранении
+    :param rates: Курсы валют (src.utils.currency.ExchangeRates): зарплаты пересчитываются
+        в базовую валюту до сохранения, фильтров и выбора топа
+    :param dedup: Индекс почти-дубликатов (src.utils.dedup.NearDuplicateIndex): повторно
+        опубликованные вакансии не сохраняются и не попадают в топ (stats["duplicates"])
+    :return: Топ N вакансий по зарплате и счётчики этапов
+    """
+    stats = {"parsed": 0, "errors": 0, "saved": 0, "skipped": 0, "filtered": 0, "ranged": 0}
+    # Этапы выполняются вперемешку, поэтому при включённых метриках время
+    # каждого этапа считается как разность накопленного времени на его входе и выходе
+    timed: List[Tuple[str, TimedIterator]] = []
+
+    def stage(name: str, iterable: Iterable[Any]) -> Iterable[Any]:
+        if not metrics.enabled:
+            return iterable
+        timed.append((name, TimedIterator(iterable)))
+        return timed[-1][1]
+
+    started = time.perf_counter()
+    stream: Iterable[Vacancy] = parse_vacancies(stage("pipeline.fetch", raw_vacancies), stats)
+    if rates is not None:
+        stream = rates.iter_normalize(stream)
+    if dedup is not None:
+        stats["duplicates"] = 0
+        stream = iter_unique(stream, dedup, stats)
+    if storage is not None:
+        stream = save_stream(stage("pipeline.parse", stream), storage, batch_size, stats)
+        stream = stage("pipeline.save", stream)
+    else:
+        stream = stage("pipeline.parse", stream)
+    stream = count_stream(stage("filter.keywords", iter_filter_vacancies(stream, filter_words)), stats, "filtered")
+    stream = count_stream(stage("filter.salary", iter_vacancies_by_salary(stream, salary_range)), stats, "ranged")
+
+    if top_n <= 0:
+        # Конвейер всё равно прогоняется до конца, чтобы сохранить вакансии
+        for _ in stream:
+            pass
+        top: List[Vacancy] = []
+    else:
+        top = top_vacancies(stream, top_n)
+
+    if timed:
+        previous = 0.0
+        for name, iterator in timed:
+            metrics.observe(name, iterator.seconds - previous, iterator.count)
+            previous = iterator.seconds
+        metrics.observe("pipeline.top", time.perf_counter() - started - previous, len(top))
+    return top, stats
+
+
+def _increment(stats: Optional[Dict[str, int]], key: str, value: int = 1) -> None:
+    """Увеличивает счётчик, если словарь счётчиков передан"""
+    if stats is not None:
+        stats[key] = stats.get(key, 0) + value
@@ -0,0 +1,93 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional
+from src.models.vacancy import Vacancy
+from src.utils.filters import parse_salary_range_or_warn
+
+INFINITY = float("inf")
+
+
+class SalaryIndex:
+    """
+    Индекс зарплатных вилок для повторных запросов по диапазону зарплат
+
+    Строится один раз: для вакансий с зарплатой хранятся два отсортированных
+    массива границ - "от" (неуказанная считается 0) и "до" (неуказанная
+    считается бесконечностью), открытые вилки приводятся к числам при
+    построении. Запросы "MIN", "-MAX" и "MIN-MAX" находят границы бинарным
+    поиском и дают тот же результат, что get_vacancies_by_salary.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy]):
+        self._vacancies: List[Vacancy] = list(vacancies)
+
+        with_salary = [i for i, v in enumerate(self._vacancies) if v.salary]
+        from_pairs = sorted((self._vacancies[i].salary_from_base or 0, i) for i in with_salary)
+        to_pairs = sorted((self._vacancies[i].salary_to_base or INFINITY, i) for i in with_salary)
+
+        self._from_values = [value for value, _ in from_pairs]
+        self._from_positions = [i for _, i in from_pairs]
+        self._to_values = [value for value, _ in to_pairs]
+        self._to_positions = [i for _, i in to_pairs]
+
+    def __len__(self) -> int:
+        return len(self._vacancies)
+
+    def query(self, salary_range: str) -> List[Vacancy]:
+        """
+        Фильтрация по строке диапазона (см. filters.parse_salary_range)
+
+        :param salary_range: "140000", "-150000" или "100000-150000"
+        :return: Вакансии в исходном порядке
+        """
+        parsed = parse_salary_range_or_warn(salary_range)
+
+        if parsed is None:
+            return list(self._vacancies)
+
+        check_type, min_salary, max_salary = parsed
+        if check_type == "max":
+            return self.query_bounds(max_salary=max_salary)
+        if check_type == "min":
+            return self.query_bounds(min_salary=min_salary)
+        return self.query_bounds(min_salary=min_salary, max_salary=max_salary)
+
+    def query_bounds(
+        self, min_salary: Optional[float] = None, max_salary: Optional[float] = None
+    ) -> List[Vacancy]:
+        """
+        Вакансии с зарплатой, у которых "от" >= min_salary и "до" <= max_salary
+
+        :param min_salary: Минимальная нижняя граница (None - без ограничения)
+        :param max_salary: Максимальная верхняя граница (None - без ограничения)
+        :return: Вакансии в исходном порядке
+        """
+        candidates = []
+        if min_salary is not None:
+            start = bisect_left(self._from_values, min_salary)
+            candidates.append(self._from_positions[start:])
+        if max_salary is not None:
+            end = bisect_right(self._to_values, max_salary)
+            candidates.append(self._to_positions[:end])
+
+        if not candidates:
+            positions = self._from_positions
+        elif len(candidates) == 1:
+            positions = candidates[0]
+        else:
+            smaller, larger = sorted(candidates, key=len)
+            allowed = set(smaller)
+            positions = [i for i in larger if i in allowed]
+
+        return [self._vacancies[i] for i in sorted(positions)]
+
+    def count_bounds(
+        self, min_salary: Optional[float] = None, max_salary: Optional[float] = None
+    ) -> int:
+        """Количество вакансий для одной границы за O(log N) (для двух - через query_bounds)"""
+        if min_salary is not None and max_salary is not None:
+            return len(self.query_bounds(min_salary, max_salary))
+        if min_salary is not None:
+            return len(self._from_values) - bisect_left(self._from_values, min_salary)
+        if max_salary is not None:
+            return bisect_right(self._to_values, max_salary)
+        return len(self._from_values)
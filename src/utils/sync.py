@@ -0,0 +1,298 @@
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+from src.api.hh_api import MAX_RESULTS
+from src.models.vacancy import Vacancy
+
+# Формат дат API HH: 2024-01-15T10:30:00+0300
+HH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# HH ищет вакансии не старше 30 дней
+SEARCH_PERIOD = timedelta(days=30)
+
+
+def parse_hh_date(value: Optional[str]) -> Optional[datetime]:
+    """Разбирает дату из ответа API HH (None для пустого или некорректного значения)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, HH_DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+class IncrementalSync:
+    """
+    Инкрементальная синхронизация хранилища с результатами поискового запроса
+
+    Для каждого запроса в файле состояния хранится водяной знак - самая
+    поздняя дата публикации среди полученных вакансий - и множество id
+    вакансий запроса. Первый запуск загружает результаты целиком, следующие
+    запрашивают только вакансии, опубликованные (или обновлённые) после
+    водяного знака (параметр date_from API), и записывают их в хранилище
+    через upsert_vacancies.
+
+    Выдача API ограничена max_results вакансиями. Если изменений больше,
+    интервал date_from..сейчас делится пополам по дате публикации (как в
+    ShardedHarvester), пока половина не поместится в окно. Интервал короче
+    min_window, который всё равно не помещается, загружается частично, и
+    водяной знак сдвигается не дальше его начала, чтобы следующий запуск
+    запросил его снова.
+
+    Исчезнувшие вакансии обнаруживаются по полю "found": если запрос находит
+    меньше вакансий, чем известно, выполняется сверка id по полному
+    результату. Сверка загружает результат целиком, поэтому выполняется не
+    чаще раза в sweep_interval (счётчик found проверяется при каждом
+    запуске одним запросом) и только пока результат не превышает max_results.
+
+    Хранилище общее для всех запросов, поэтому пропавшие из результата
+    вакансии не удаляются сразу: они записываются в надгробия запроса
+    (tombstones в файле состояния, id -> время исчезновения) и исключаются из
+    его id. Из хранилища вакансия удаляется, только когда на неё не
+    ссылается ни один запрос, одним пакетом через delete_vacancies (или
+    delete_vacancy, если пакетного удаления нет). Надгробия старше
+    tombstone_ttl забываются.
+
+    Хранилище должно поддерживать upsert_vacancies и delete_vacancies или delete_vacancy.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        storage: Any,
+        state_path: str = "data/sync_state.json",
+        overlap: timedelta = timedelta(minutes=5),
+        sweep_interval: timedelta = timedelta(hours=24),
+        tombstone_ttl: timedelta = timedelta(days=30),
+        max_results: int = MAX_RESULTS,
+        min_window: timedelta = timedelta(minutes=10),
+    ):
+        """
+        :param api: Клиент API с методами iter_all_vacancies и count_vacancies (HeadHunterAPI)
+        :param storage: Хранилище вакансий
+        :param state_path: Путь к файлу состояния синхронизации
+        :param overlap: Запас по времени при запросе изменений (на задержку индексации HH)
+        :param sweep_interval: Минимальный интервал между сверками id по полному результату
+        :param tombstone_ttl: Время хранения надгробий исчезнувших вакансий
+        :param max_results: Окно выдачи API
+        :param min_window: Минимальный интервал дат при делении загрузки
+        """
+        self.api = api
+        self.storage = storage
+        self.state_path = state_path
+        self.overlap = overlap
+        self.sweep_interval = sweep_interval
+        self.tombstone_ttl = tombstone_ttl
+        self.max_results = max_results
+        self.min_window = min_window
+
+    def sync(
+        self,
+        search_query: str,
+        extra_params: Optional[Dict[str, Any]] = None,
+        full: bool = False,
+        sweep: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Синхронизирует хранилище с результатами запроса
+
+        :param search_query: Поисковый запрос
+        :param extra_params: Дополнительные параметры запроса к API
+        :param full: Загрузить результаты целиком, игнорируя водяной знак
+        :param sweep: Проверять исчезнувшие вакансии (не чаще раза в sweep_interval)
+        :return: Статистика: fetched, inserted, updated, tombstoned (исчезли из результата),
+            deleted (удалены из хранилища), errors, full, swept, truncated (интервалы,
+            загруженные не полностью), watermark
+        """
+        now = datetime.now(timezone.utc)
+        state = self.load_state()
+        key = self._state_key(search_query, extra_params)
+        entry = state.get(key, {})
+        known: Set[str] = set(entry.get("ids", []))
+        tombstones: Dict[str, str] = dict(entry.get("tombstones", {}))
+        watermark = parse_hh_date(entry.get("watermark"))
+        swept_at = parse_hh_date(entry.get("swept_at"))
+        full = full or watermark is None
+
+        params = dict(extra_params or {})
+        if not full:
+            params["date_from"] = (watermark - self.overlap).strftime(HH_DATE_FORMAT)
+            params["order_by"] = "publication_time"
+
+        raw = list(self.api.iter_all_vacancies(search_query, extra_params=params))
+        truncated: List[datetime] = []
+        if len(raw) >= self.max_results:
+            # Результат не поместился в окно выдачи: загружаем по интервалам дат
+            start = watermark - self.overlap if not full else now - SEARCH_PERIOD
+            raw = self._fetch_window(search_query, params, start, now, truncated)
+        errors: List = []
+        vacancies = Vacancy.from_hh_data_many(raw, errors)
+        fetched_ids = {vacancy.id for vacancy in vacancies}
+        self.storage.upsert_vacancies(vacancies)
+
+        stats: Dict[str, Any] = {
+            "fetched": len(vacancies),
+            "inserted": len(fetched_ids - known),
+            "updated": len(fetched_ids & known),
+            "tombstoned": 0,
+            "deleted": 0,
+            "errors": len(errors),
+            "full": full,
+            "swept": False,
+            "truncated": len(truncated),
+        }
+
+        newest = watermark
+        for item in raw:
+            published = parse_hh_date(item.get("published_at")) if isinstance(item, dict) else None
+            if published is not None and (newest is None or published > newest):
+                newest = published
+        if truncated:
+            # Часть вакансий интервала не получена: следующий запуск начнёт с него
+            newest = min(newest, min(truncated)) if newest else min(truncated)
+            if watermark is not None:
+                newest = max(newest, watermark)
+        watermark = newest
+
+        ids = known | fetched_ids
+        # Вакансия вернулась в результат - надгробие снимается
+        for vacancy_id in fetched_ids:
+            tombstones.pop(vacancy_id, None)
+
+        removed: Set[str] = set()
+        if sweep:
+            current = None
+            if full:
+                # Полный результат уже получен: сверка не требует запросов
+                current = fetched_ids if not truncated else None
+            elif swept_at is None or now - swept_at >= self.sweep_interval:
+                current = self._current_ids(search_query, extra_params, len(ids))
+            if current is not None:
+                removed = ids - current
+                ids = current
+                swept_at = now
+                stats["swept"] = True
+
+        removed_at = now.strftime(HH_DATE_FORMAT)
+        for vacancy_id in removed:
+            tombstones[vacancy_id] = removed_at
+        tombstones = {
+            vacancy_id: moment
+            for vacancy_id, moment in tombstones.items()
+            if now - (parse_hh_date(moment) or now) < self.tombstone_ttl
+        }
+
+        state[key] = {
+            "watermark": watermark.strftime(HH_DATE_FORMAT) if watermark else None,
+            "ids": sorted(ids),
+            "tombstones": tombstones,
+            "synced_at": now.strftime(HH_DATE_FORMAT),
+            "swept_at": swept_at.strftime(HH_DATE_FORMAT) if swept_at else None,
+        }
+        stats["tombstoned"] = len(removed)
+        stats["deleted"] = self._delete_unreferenced(state, removed)
+        self.save_state(state)
+        stats["watermark"] = state[key]["watermark"]
+        return stats
+
+    def load_state(self) -> Dict[str, Dict]:
+        """Загружает состояние синхронизации (пустое, если файла нет или он повреждён)"""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            # Повреждённое состояние равносильно его отсутствию: запросы загрузятся целиком
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def save_state(self, state: Dict[str, Dict]) -> None:
+        """Атомарно сохраняет состояние синхронизации"""
+        directory = os.path.dirname(self.state_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".sync-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(state, file, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _fetch_window(
+        self,
+        search_query: str,
+        params: Dict[str, Any],
+        date_from: datetime,
+        date_to: datetime,
+        truncated: List[datetime],
+    ) -> List[Dict]:
+        """
+        Загружает вакансии интервала дат, деля его пополам, пока результат не поместится в окно
+
+        :param truncated: Список, куда добавляются начала интервалов, загруженных не полностью
+        :return: Сырые данные вакансий
+        """
+        window = {
+            **params,
+            "date_from": date_from.strftime(HH_DATE_FORMAT),
+            "date_to": date_to.strftime(HH_DATE_FORMAT),
+        }
+        found = self.api.count_vacancies(search_query, extra_params=window)
+        if found > self.max_results:
+            if date_to - date_from > self.min_window:
+                middle = date_from + (date_to - date_from) / 2
+                older = self._fetch_window(search_query, params, date_from, middle, truncated)
+                return older + self._fetch_window(search_query, params, middle, date_to, truncated)
+            truncated.append(date_from)
+        if found == 0:
+            return []
+        return list(self.api.iter_all_vacancies(search_query, extra_params=window))
+
+    def _current_ids(
+        self, search_query: str, extra_params: Optional[Dict[str, Any]], known_count: int
+    ) -> Optional[Set[str]]:
+        """
+        Возвращает актуальные id вакансий запроса, если часть известных исчезла
+
+        :return: Множество id или None, если сверка не нужна или невозможна
+        """
+        found = self.api.count_vacancies(search_query, extra_params=extra_params)
+        if found >= known_count or found > self.max_results:
+            return None
+        return self._collect_ids(self.api.iter_all_vacancies(search_query, extra_params=extra_params))
+
+    def _delete_unreferenced(self, state: Dict[str, Dict], candidates: Set[str]) -> int:
+        """
+        Удаляет из хранилища вакансии, на которые не ссылается ни один запрос
+
+        :return: Количество удалённых вакансий
+        """
+        referenced: Set[str] = set()
+        for entry in state.values():
+            referenced.update(entry.get("ids", ()))
+        orphans = candidates - referenced
+        if not orphans:
+            return 0
+        if hasattr(self.storage, "delete_vacancies"):
+            return self.storage.delete_vacancies(orphans)
+        else:
+            for vacancy_id in orphans:
+                self.storage.delete_vacancy(vacancy_id)
+        return len(orphans)
+
+    @staticmethod
+    def _collect_ids(items: Iterable[Dict]) -> Set[str]:
+        """Собирает id из сырых данных вакансий"""
+        return {str(item["id"]) for item in items if isinstance(item, dict) and item.get("id") is not None}
+
+    @staticmethod
+    def _state_key(search_query: str, extra_params: Optional[Dict[str, Any]]) -> str:
+        """Ключ запроса в файле состояния"""
+        if not extra_params:
+            return search_query
+        return f"{search_query} {json.dumps(extra_params, sort_keys=True, ensure_ascii=False)}"
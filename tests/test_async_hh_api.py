@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+from src.api.async_hh_api import AsyncHeadHunterAPI, TokenBucket
+
+PAGES = 3
+PER_PAGE = 2
+
+
+class StubHHHandler(BaseHTTPRequestHandler):
+    """Заглушка метода /vacancies: по PER_PAGE вакансий на каждой из PAGES страниц"""
+
+    requests_log = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        text = query.get("text", [""])[0]
+        page = int(query.get("page", ["0"])[0])
+        self.requests_log.append((text, page))
+
+        if text == "error":
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        body = json.dumps(
+            {
+                "items": [{"id": f"{text}-{page}-{i}", "name": text} for i in range(PER_PAGE)],
+                "page": page,
+                "pages": PAGES,
+                "found": PAGES * PER_PAGE,
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncHeadHunterAPI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHHHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/vacancies"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHHHandler.requests_log = []
+        self.api = AsyncHeadHunterAPI(base_url=self.base_url, max_concurrency=4, rate_limit=1000)
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_get_vacancies(self):
+        """Тест получения первой страницы"""
+        vacancies = asyncio.run(self.api.get_vacancies("python", per_page=PER_PAGE))
+        self.assertEqual([v["id"] for v in vacancies], ["python-0-0", "python-0-1"])
+
+    def test_get_all_vacancies(self):
+        """Тест получения всех страниц в порядке следования"""
+        vacancies = asyncio.run(self.api.get_all_vacancies("python", per_page=PER_PAGE))
+        self.assertEqual(len(vacancies), PAGES * PER_PAGE)
+        self.assertEqual(vacancies[-1]["id"], f"python-{PAGES - 1}-{PER_PAGE - 1}")
+
+    def test_get_vacancies_many(self):
+        """Тест одновременной обработки нескольких запросов"""
+        results = asyncio.run(
+            self.api.get_vacancies_many(["python", "java", "python"], per_page=PER_PAGE)
+        )
+        self.assertEqual(sorted(results), ["java", "python"])
+        self.assertEqual(len(results["java"]), PAGES * PER_PAGE)
+        self.assertEqual(len(StubHHHandler.requests_log), 2 * PAGES)
+        self.assertEqual(self.api.get_stats()["requests"], 2 * PAGES)
+
+    def test_get_vacancies_many_return_exceptions(self):
+        """Тест возврата ошибки отдельного запроса"""
+        results = asyncio.run(
+            self.api.get_vacancies_many(["python", "error"], per_page=PER_PAGE, return_exceptions=True)
+        )
+        self.assertEqual(len(results["python"]), PAGES * PER_PAGE)
+        self.assertIsInstance(results["error"], Exception)
+
+
+class FakeClock:
+    """Часы для TokenBucket: sleep не ждёт, а сдвигает monotonic"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_rate_limit(self):
+        """Тест ограничения частоты: после исчерпания ёмкости токены выдаются со скоростью rate"""
+        clock = FakeClock()
+        with patch("src.api.async_hh_api.time", clock), patch("asyncio.sleep", clock.sleep):
+            bucket = TokenBucket(rate=20, capacity=1)
+
+            async def acquire_many():
+                for _ in range(4):
+                    await bucket.acquire()
+
+            asyncio.run(acquire_many())
+        # Первый токен есть сразу, остальные три - по одному за 1/20 с
+        self.assertAlmostEqual(clock.now, 3 / 20)
+
+    def test_invalid_rate(self):
+        """Тест ошибки при неположительной частоте"""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import csv
+import io
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+from batch import load_queries, main, run_batch
+from src.storage.json_storage import JSONStorage
+
+
+def fake_get(url, params, **kwargs):
+    """Ответ API: по три вакансии на запрос с зарплатами 100-300 тысяч"""
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "items": [
+            {
+                "id": f"{params['text']}-{i}",
+                "name": f"{params['text']} developer",
+                "salary": {"from": 100000 * i, "to": None, "currency": "RUR"},
+            }
+            for i in range(1, 4)
+        ]
+    }
+    return response
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.json"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_load_queries(self):
+        """Тест разбора файла запросов"""
+        queries = load_queries(
+            io.StringIO(
+                '# комментарий\n{"query": "python", "filter_words": "django api"}\n\n{"query": "java", "top_n": 3}\n'
+            )
+        )
+        self.assertEqual(
+            queries,
+            [
+                {"query": "python", "filter_words": ["django", "api"], "salary_range": "", "top_n": 10},
+                {"query": "java", "filter_words": [], "salary_range": "", "top_n": 3},
+            ],
+        )
+
+    def test_load_queries_invalid(self):
+        """Тест ошибок в файле запросов"""
+        lines = ('{"top_n": 3}', "not json", '{"query": "a", "salary_range": "abc"}', '{"query": "a", "top_n": 0}')
+        for line in lines:
+            with self.assertRaises(ValueError):
+                load_queries(io.StringIO(line))
+
+    @patch("requests.Session.get", side_effect=fake_get)
+    def test_run_batch_jsonl(self, mock_get):
+        """Тест параллельного выполнения запросов с общим хранилищем"""
+        queries = load_queries(
+            io.StringIO('{"query": "python", "salary_range": "200000", "top_n": 1}\n{"query": "java"}\n')
+        )
+        output = io.StringIO()
+        summaries = run_batch(queries, output, storage=self.storage, workers=2)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([(r["query"], r["id"]) for r in records if r["query"] == "python"], [("python", "python-3")])
+        self.assertEqual(len([r for r in records if r["query"] == "java"]), 3)
+        self.assertEqual(sorted(s["saved"] for s in summaries), [3, 3])
+        self.assertEqual(len(self.storage._read_file()), 6)
+
+    @patch("requests.Session.close")
+    @patch("requests.Session.get", side_effect=fake_get)
+    def test_save_error_is_per_query(self, mock_get, mock_close):
+        """Тест: ошибка сохранения одного запроса не прерывает пакет, клиенты API закрываются"""
+        storage = MagicMock()
+        storage.add_vacancies.side_effect = [OSError("disk full"), {"inserted": 3, "skipped": 0}]
+        queries = load_queries(io.StringIO('{"query": "python"}\n{"query": "java"}\n'))
+        output = io.StringIO()
+        summaries = run_batch(queries, output, storage=storage, workers=1)
+
+        self.assertEqual(len(summaries), 2)
+        self.assertIn("disk full", summaries[0]["error"])
+        self.assertEqual(summaries[1]["saved"], 3)
+        self.assertEqual(len(output.getvalue().splitlines()), 6)
+        self.assertEqual(mock_close.call_count, 2)
+
+    @patch("requests.Session.get", side_effect=fake_get)
+    def test_main_csv(self, mock_get):
+        """Тест запуска из командной строки с выводом в CSV"""
+        queries_path = os.path.join(self.temp_dir.name, "queries.jsonl")
+        output_path = os.path.join(self.temp_dir.name, "result.csv")
+        with open(queries_path, "w", encoding="utf-8") as file:
+            file.write('{"query": "python", "top_n": 2}\n')
+
+        with patch("sys.stdout", new_callable=io.StringIO):
+            code = main([queries_path, "-o", output_path, "--storage", self.storage.file_path])
+        self.assertEqual(code, 0)
+        with open(output_path, encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([row["id"] for row in rows], ["python-3", "python-2"])
+        self.assertEqual(rows[0]["rank"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import tempfile
+from benchmarks.fake_api import FakeHHServer
+from benchmarks.generator import make_hh_items
+from benchmarks.run import compare, run_size
+from src.api.hh_api import HeadHunterAPI
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_generator_is_reproducible(self):
+        """Тест: генератор выдаёт одинаковые данные для одинакового seed"""
+        self.assertEqual(make_hh_items(20, seed=1), make_hh_items(20, seed=1))
+        self.assertNotEqual(make_hh_items(20, seed=1), make_hh_items(20, seed=2))
+
+    def test_fake_api_pagination(self):
+        """Тест постраничной выдачи локального сервера API"""
+        items = make_hh_items(250)
+        with FakeHHServer(items) as server:
+            api = HeadHunterAPI(base_url=server.url)
+            try:
+                fetched = api.get_all_vacancies("python", per_page=100)
+                self.assertEqual(api.count_vacancies("python"), 250)
+            finally:
+                api.close()
+        self.assertEqual([item["id"] for item in fetched], [item["id"] for item in items])
+
+    def test_run_size_and_compare(self):
+        """Тест: все замеры выполняются и сравниваются с базовыми"""
+        with tempfile.TemporaryDirectory() as work_dir:
+            results = run_size(30, 1, work_dir)
+        self.assertEqual(
+            [r["name"] for r in results],
+            [
+                "from_hh_data", "from_hh_data_many", "to_dict", "filter_vacancies",
+                "get_vacancies_by_salary", "sort_vacancies", "add_vacancies", "add_vacancy",
+                "open_reader", "read_file", "pipeline",
+            ],
+        )
+
+        baseline = {"results": [dict(results[0], seconds=results[0]["seconds"] / 2)]}
+        comparisons = compare(baseline, {"results": results}, threshold=0.1)
+        self.assertEqual(len(comparisons), 1)
+        self.assertTrue(comparisons[0]["regression"])
+
+
+if __name__ == "__main__":
+    unittest.main()
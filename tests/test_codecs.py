@@ -0,0 +1,38 @@
+import unittest
+import os
+import tempfile
+from src.storage.codecs import available_codecs, get_codec, read_snapshot, write_snapshot
+
+
+class TestCodecs(unittest.TestCase):
+    def setUp(self):
+        self.data = [{"id": "1", "name": "Вакансия", "salary": {"from_": 100, "to": None}}]
+
+    def test_roundtrip_all_codecs(self):
+        """Тест кодирования и декодирования всеми установленными кодеками"""
+        for name, codec in available_codecs().items():
+            self.assertEqual(codec.loads(codec.dumps(self.data)), self.data, name)
+
+    def test_compact_json_is_smaller(self):
+        """Тест: компактный JSON меньше форматированного"""
+        codec = get_codec("json")
+        self.assertLess(len(codec.dumps(self.data)), len(codec.dumps(self.data, compact=False)))
+        self.assertIn(b"\n    ", codec.dumps(self.data, compact=False))
+
+    def test_default_codec(self):
+        """Тест выбора кодека по умолчанию"""
+        self.assertIn(get_codec().name, ("json", "orjson"))
+        with self.assertRaises(ValueError):
+            get_codec("unknown")
+
+    def test_snapshot(self):
+        """Тест записи и чтения снимка"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "snapshot.bin")
+            size = write_snapshot(path, self.data)
+            self.assertEqual(size, os.path.getsize(path))
+            self.assertEqual(read_snapshot(path), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
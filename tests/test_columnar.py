@@ -0,0 +1,68 @@
+import random
+import unittest
+from src.models.vacancy import Vacancy, Salary, Area
+from src.utils.columnar import VacancyColumns, np
+from src.utils.filters import get_vacancies_by_salary, sort_vacancies, get_top_vacancies
+
+
+@unittest.skipIf(np is None, "numpy не установлен")
+class TestVacancyColumns(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.vacancies = []
+        for i in range(200):
+            salary = None
+            if i % 5:
+                from_ = rng.choice([None, 0, rng.randrange(0, 300000, 10000)])
+                to = rng.choice([None, (from_ or 0) + rng.randrange(0, 200000, 10000)])
+                salary = Salary(from_=from_, to=to, currency=rng.choice(["RUR", "USD"]))
+            area = Area(name=rng.choice(["Москва", "Казань"])) if i % 11 else None
+            self.vacancies.append(Vacancy(id=str(i), name=f"Vacancy {i}", salary=salary, area=area))
+        self.columns = VacancyColumns(self.vacancies)
+
+    def test_columns(self):
+        """Тест построения столбцов"""
+        self.assertEqual(len(self.columns), 200)
+        self.assertEqual(int(self.columns.has_salary.sum()), 160)
+        self.assertTrue(np.isnan(self.columns.salary_from[0]))
+        self.assertEqual(sorted(self.columns.areas), ["Казань", "Москва"])
+        self.assertEqual(self.columns.area_codes[0], -1)
+
+    def test_salary_filter_matches_filters(self):
+        """Тест: векторный фильтр совпадает с get_vacancies_by_salary"""
+        for salary_range in ["", "100000", "-150000", "100000-200000", "0", "bad"]:
+            self.assertEqual(
+                [v.id for v in self.columns.filter_by_salary(salary_range)],
+                [v.id for v in get_vacancies_by_salary(self.vacancies, salary_range)],
+                salary_range,
+            )
+
+    def test_sort_and_top_match_filters(self):
+        """Тест: сортировка совпадает с sort_vacancies"""
+        self.assertEqual(self.columns.take(self.columns.sort_order()), sort_vacancies(self.vacancies))
+
+        mask = self.columns.salary_mask("50000")
+        expected = get_top_vacancies(sort_vacancies(get_vacancies_by_salary(self.vacancies, "50000")), 10)
+        self.assertEqual(self.columns.top(10, mask), expected)
+
+    def test_median_by_area(self):
+        """Тест медианы зарплаты по регионам"""
+        columns = VacancyColumns(
+            [
+                Vacancy(id="1", name="a", salary=Salary(from_=100, to=200), area=Area(name="Москва")),
+                Vacancy(id="2", name="b", salary=Salary(from_=300), area=Area(name="Москва")),
+                Vacancy(id="3", name="c", salary=Salary(to=50), area=Area(name="Казань")),
+                Vacancy(id="4", name="d", area=Area(name="Казань")),
+            ]
+        )
+        self.assertEqual(columns.median_salary_by_area(), {"Москва": 225.0, "Казань": 50.0})
+        counts = columns.aggregate_by("area", "count")
+        self.assertEqual(counts, {"Москва": 2, "Казань": 1})
+        self.assertTrue(all(isinstance(count, int) for count in counts.values()))
+
+        with self.assertRaises(ValueError):
+            columns.aggregate_by("employer")
+
+
+if __name__ == "__main__":
+    unittest.main()
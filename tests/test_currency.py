@@ -0,0 +1,125 @@
+import unittest
+import json
+import os
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+import requests
+from src.models.vacancy import Vacancy
+from src.utils.currency import ExchangeRates, load_rates
+from src.utils.filters import get_vacancies_by_salary, sort_vacancies, top_vacancies
+from src.utils.pipeline import run_pipeline
+
+DICTIONARIES = {
+    "currency": [
+        {"code": "RUR", "abbr": "₽", "name": "Рубли", "default": True, "rate": 1.0},
+        {"code": "USD", "abbr": "$", "name": "Доллары", "default": False, "rate": 0.01},
+        {"code": "EUR", "abbr": "€", "name": "Евро", "default": False, "rate": 0.008},
+    ]
+}
+
+
+def make_vacancy(vacancy_id, salary_from, salary_to, currency):
+    return Vacancy.from_hh_data(
+        {
+            "id": vacancy_id,
+            "name": "Python Developer",
+            "salary": {"from": salary_from, "to": salary_to, "currency": currency},
+            "snippet": {"requirement": None, "responsibility": None},
+        }
+    )
+
+
+class TestExchangeRates(unittest.TestCase):
+    def setUp(self):
+        self.rates = ExchangeRates.from_hh_dictionaries(DICTIONARIES)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, "rates.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_rates_from_hh_dictionaries(self):
+        """Тест разбора справочника валют HH"""
+        self.assertEqual(self.rates.base, "RUR")
+        self.assertAlmostEqual(self.rates.rate("USD"), 100)
+        self.assertAlmostEqual(self.rates.convert(1000, "EUR"), 125000)
+        self.assertEqual(self.rates.convert(1000, None), 1000)
+        self.assertIsNone(self.rates.convert(1000, "KZT"))
+        with self.assertRaises(ValueError):
+            ExchangeRates.from_hh_dictionaries({})
+
+    def test_normalize_vacancy(self):
+        """Тест: нормализованные границы сохраняются в зарплате вакансии"""
+        vacancy = self.rates.normalize(make_vacancy("1", 1000, None, "USD"))
+        self.assertEqual(vacancy.salary_from, 1000)
+        self.assertAlmostEqual(vacancy.salary_from_base, 100000)
+        self.assertIsNone(vacancy.salary_to_base)
+
+        # Одинаковые вилки разделяют один объект Salary
+        other = self.rates.normalize(make_vacancy("2", 1000, None, "USD"))
+        self.assertIs(vacancy.salary, other.salary)
+
+        # Валюта без курса остаётся без пересчёта
+        unknown = self.rates.normalize(make_vacancy("3", 1000, None, "KZT"))
+        self.assertFalse(unknown.salary.normalized)
+        self.assertEqual(unknown.salary_from_base, 1000)
+
+    def test_normalized_values_survive_roundtrip(self):
+        """Тест: нормализованная зарплата сохраняется в to_dict и восстанавливается"""
+        vacancy = self.rates.normalize(make_vacancy("1", 1000, 2000, "USD"))
+        restored = Vacancy.from_dict(vacancy.to_dict())
+        self.assertEqual(restored.salary, vacancy.salary)
+
+    def test_filters_use_normalized_salary(self):
+        """Тест: фильтр и сортировка сравнивают зарплаты в базовой валюте"""
+        vacancies = self.rates.normalize_many(
+            [
+                make_vacancy("rub", 150000, None, "RUR"),
+                make_vacancy("usd", 2000, None, "USD"),
+                make_vacancy("eur", 1000, None, "EUR"),
+            ]
+        )
+        self.assertEqual([v.id for v in sort_vacancies(vacancies)], ["usd", "rub", "eur"])
+        self.assertEqual([v.id for v in get_vacancies_by_salary(vacancies, "140000")], ["rub", "usd"])
+        self.assertEqual([v.id for v in top_vacancies(vacancies, 1, key="midpoint")], ["usd"])
+        self.assertEqual([v.id for v in top_vacancies(vacancies, 1, key="normalized", rates=self.rates)], ["usd"])
+
+    def test_pipeline_normalizes_salaries(self):
+        """Тест: конвейер пересчитывает зарплаты до фильтров"""
+        raw = [
+            {"id": "rub", "name": "Python", "salary": {"from": 150000, "currency": "RUR"}, "snippet": {}},
+            {"id": "usd", "name": "Python", "salary": {"from": 2000, "currency": "USD"}, "snippet": {}},
+        ]
+        top, stats = run_pipeline(raw, [], "160000", 5, rates=self.rates)
+        self.assertEqual([v.id for v in top], ["usd"])
+
+    @patch("src.utils.currency.requests.get")
+    def test_load_rates_uses_fresh_cache(self, mock_get):
+        """Тест: свежий кэш используется без запроса к API"""
+        mock_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value=DICTIONARIES))
+
+        self.assertAlmostEqual(load_rates(self.cache_path).rate("USD"), 100)
+        self.assertAlmostEqual(load_rates(self.cache_path).rate("USD"), 100)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("src.utils.currency.requests.get", side_effect=requests.exceptions.ConnectionError("offline"))
+    def test_load_rates_falls_back_to_stale_cache(self, mock_get):
+        """Тест: при недоступном API используется устаревший кэш"""
+        ExchangeRates({"USD": 90.0}, fetched_at=time.time() - 10 * 24 * 3600).save(self.cache_path)
+        self.assertEqual(load_rates(self.cache_path).rate("USD"), 90.0)
+        self.assertEqual(mock_get.call_count, 1)
+
+        os.remove(self.cache_path)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            load_rates(self.cache_path)
+
+    def test_rates_from_saved_dictionaries_file(self):
+        """Тест загрузки курсов из сохранённого ответа /dictionaries"""
+        with open(self.cache_path, "w", encoding="utf-8") as file:
+            json.dump(DICTIONARIES, file)
+        self.assertAlmostEqual(ExchangeRates.from_file(self.cache_path).rate("EUR"), 125)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import os
+import tempfile
+from src.models.vacancy import Vacancy
+from src.storage.json_storage import JSONStorage
+from src.utils.dedup import NearDuplicateIndex, dedup_storage, vacancy_fingerprint
+from src.utils.pipeline import run_pipeline
+
+
+def make_raw(vacancy_id, employer="ООО Ромашка", name="Python разработчик", salary_from=150000, responsibility=None):
+    """Данные API вакансии; повторная публикация отличается id и мелкими правками"""
+    return {
+        "id": vacancy_id,
+        "name": name,
+        "salary": {"from": salary_from, "to": 200000, "currency": "RUR"},
+        "area": {"name": "Москва"},
+        "employer": {"name": employer},
+        "snippet": {
+            "requirement": (
+                "Опыт разработки на <highlighttext>Python</highlighttext> от 3 лет, знание Django и PostgreSQL"
+            ),
+            "responsibility": responsibility or "Разработка и поддержка backend сервисов, участие в code review",
+        },
+    }
+
+
+class TestNearDuplicates(unittest.TestCase):
+    def test_fingerprint_is_stable_for_minor_edits(self):
+        """Тест: мелкие правки почти не меняют отпечаток, другой работодатель - меняет"""
+        original = vacancy_fingerprint(Vacancy.from_hh_data(make_raw("1")))
+        repost = vacancy_fingerprint(Vacancy.from_hh_data(make_raw("2", salary_from=151000)))
+        other = vacancy_fingerprint(Vacancy.from_hh_data(make_raw("3", employer="АО Лютик")))
+        self.assertLessEqual(bin(original ^ repost).count("1"), 3)
+        self.assertGreater(bin(original ^ other).count("1"), 3)
+
+    def test_index_groups_reposts(self):
+        """Тест: повторные публикации привязываются к первой вакансии"""
+        index = NearDuplicateIndex()
+        # Та же вакансия, найденная другим запросом: иная подсветка, пунктуация и регистр
+        edited = "Разработка и поддержка <highlighttext>backend</highlighttext> сервисов; участие в Code Review"
+        vacancies = Vacancy.from_hh_data_many([
+            make_raw("1"),
+            make_raw("2", salary_from=152000, responsibility=edited),
+            make_raw("3", employer="АО Лютик"),
+            make_raw("4", name="Java разработчик", salary_from=250000),
+        ])
+        self.assertEqual([index.add(v) for v in vacancies], [None, "1", None, None])
+        self.assertEqual(index.add(vacancies[1]), "1")
+        self.assertEqual(index.groups(), {"1": ["2"]})
+        self.assertEqual(len(index), 3)
+        self.assertIn("3", index)
+
+    def test_invalid_distance(self):
+        """Тест: недопустимое расстояние"""
+        with self.assertRaises(ValueError):
+            NearDuplicateIndex(max_distance=32)
+
+    def test_dedup_storage(self):
+        """Тест удаления дубликатов из хранилища"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = JSONStorage(file_path=os.path.join(temp_dir, "vacancies.json"))
+            storage.add_vacancies(
+                Vacancy.from_hh_data_many([make_raw("1"), make_raw("2"), make_raw("3", employer="АО Лютик")])
+            )
+            self.assertEqual(dedup_storage(storage, dry_run=True), {"1": ["2"]})
+            self.assertEqual(len(storage.get_vacancies()), 3)
+
+            self.assertEqual(dedup_storage(storage), {"1": ["2"]})
+            self.assertEqual([v.id for v in storage.get_vacancies()], ["1", "3"])
+
+    def test_dedup_storage_uses_passed_index(self):
+        """Тест: переданный пустой индекс используется, а не заменяется индексом по умолчанию"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = JSONStorage(file_path=os.path.join(temp_dir, "vacancies.json"))
+            storage.add_vacancies(Vacancy.from_hh_data_many([make_raw("1"), make_raw("2", salary_from=160000)]))
+            # Отпечатки отличаются сильнее порога по умолчанию, но в пределах заданного
+            self.assertEqual(dedup_storage(storage, dry_run=True), {})
+            index = NearDuplicateIndex(max_distance=20)
+            self.assertEqual(dedup_storage(storage, index=index, dry_run=True), {"1": ["2"]})
+            self.assertEqual(len(index), 1)  # в индексе остаётся каноническая вакансия группы
+
+    def test_pipeline_skips_duplicates(self):
+        """Тест: конвейер не пропускает дубликаты в топ"""
+        raw = [make_raw("1"), make_raw("2"), make_raw("3", employer="АО Лютик")]
+        top, stats = run_pipeline(raw, [], "", 10, dedup=NearDuplicateIndex())
+        self.assertEqual([v.id for v in top], ["1", "3"])
+        self.assertEqual(stats["duplicates"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from src.models.vacancy import Vacancy, Salary, Snippet
+from src.utils.filters import (
+    filter_vacancies,
+    get_top_vacancies,
+    salary_midpoint,
+    sort_vacancies,
+    top_vacancies,
+)
+
+
+def make_vacancy(id_, from_=None, to=None, currency="RUR"):
+    """Создаёт вакансию с заданной зарплатой"""
+    return Vacancy(id=id_, name=f"Vacancy {id_}", salary=Salary(from_=from_, to=to, currency=currency))
+
+
+class TestTopVacancies(unittest.TestCase):
+    def setUp(self):
+        self.vacancies = [
+            make_vacancy("1", 100, 200),
+            make_vacancy("2", 150, None),
+            make_vacancy("3", None, 400),
+            make_vacancy("4", 100, 200),
+            make_vacancy("5", 50, 60, currency="USD"),
+        ]
+
+    def test_matches_full_sort(self):
+        """Тест: результат совпадает с полной сортировкой и срезом"""
+        for n in range(7):
+            expected = get_top_vacancies(sort_vacancies(self.vacancies), n)
+            self.assertEqual(top_vacancies(self.vacancies, n), expected)
+
+    def test_works_on_iterator(self):
+        """Тест работы с итератором"""
+        result = top_vacancies(iter(self.vacancies), 2)
+        self.assertEqual([v.id for v in result], ["2", "1"])
+
+    def test_stable_tie_break(self):
+        """Тест: при равных ключах сохраняется исходный порядок"""
+        result = top_vacancies(self.vacancies, 3, key="salary")
+        self.assertEqual([v.id for v in result], ["2", "1", "4"])
+
+    def test_other_keys(self):
+        """Тест ключей midpoint и salary_to"""
+        self.assertEqual([v.id for v in top_vacancies(self.vacancies, 2, key="midpoint")], ["3", "1"])
+        self.assertEqual([v.id for v in top_vacancies(self.vacancies, 1, key="salary_to")], ["3"])
+        self.assertEqual(salary_midpoint(self.vacancies[0]), 150)
+
+    def test_normalized_key(self):
+        """Тест сортировки по зарплате в рублях"""
+        result = top_vacancies(self.vacancies, 1, key="normalized", rates={"RUR": 1, "USD": 100})
+        self.assertEqual(result[0].id, "5")
+
+        # Вакансия в валюте без курса не участвует в выборе
+        result = top_vacancies(self.vacancies, 10, key="normalized", rates={"RUR": 1})
+        self.assertEqual([v.id for v in result], ["3", "1", "2", "4"])
+
+        with self.assertRaises(ValueError):
+            top_vacancies(self.vacancies, 1, key="normalized")
+
+    def test_callable_and_invalid_key(self):
+        """Тест пользовательского и неизвестного ключа"""
+        result = top_vacancies(self.vacancies, 1, key=lambda v: -int(v.id))
+        self.assertEqual(result[0].id, "1")
+
+        with self.assertRaises(ValueError):
+            top_vacancies(self.vacancies, 1, key="unknown")
+
+
+class TestFilterVacancies(unittest.TestCase):
+    def test_same_rule_as_storage_criteria(self):
+        """Тест: фильтр по словам использует то же правило, что и критерий keywords (регистр, ё)"""
+        vacancies = [
+            Vacancy(id="1", name="Ёлочный дизайнер"),
+            Vacancy(id="2", name="Python developer", snippet=Snippet(requirement="Django", responsibility=None)),
+            Vacancy(id="3", name="Java developer"),
+        ]
+        self.assertEqual([v.id for v in filter_vacancies(vacancies, ["елочный"])], ["1"])
+        self.assertEqual([v.id for v in filter_vacancies(vacancies, ["DJANGO"])], ["2"])
+        self.assertEqual([v.id for v in filter_vacancies(vacancies, ["developer"])], ["2", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import threading
+from datetime import datetime, timedelta, timezone
+from src.api.harvester import ShardedHarvester
+from src.utils.sync import HH_DATE_FORMAT, parse_hh_date
+
+NOW = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+AREA_TREE = {
+    "id": "113",
+    "name": "Россия",
+    "areas": [
+        {"id": "1", "name": "Москва", "areas": []},
+        {"id": "2", "name": "Санкт-Петербург", "areas": []},
+        {"id": "1620", "name": "Республика Марий Эл", "areas": [{"id": "1624", "name": "Йошкар-Ола", "areas": []}]},
+    ],
+}
+
+# Регион -> путь от корня дерева (вакансия региона находится и по его предкам)
+AREA_PATHS = {"1": ["113", "1"], "2": ["113", "2"], "1620": ["113", "1620"], "1624": ["113", "1620", "1624"]}
+
+
+def make_items():
+    """
+    25 вакансий в Москве, 8 в Петербурге, 3 в Йошкар-Оле и 9 в Марий Эл без указания города
+    с разными датами публикации
+    """
+    items = []
+    for area, count in (("1", 25), ("2", 8), ("1624", 3), ("1620", 9)):
+        for i in range(count):
+            items.append({
+                "id": f"{area}-{i}",
+                "name": "Python developer",
+                "area": {"id": area},
+                "published_at": (NOW - timedelta(hours=20 * i + 1)).strftime(HH_DATE_FORMAT),
+            })
+    return items
+
+
+class FakeAPI:
+    """API с окном выдачи max_results и фильтрами area, date_from, date_to"""
+
+    def __init__(self, items, max_results):
+        self.items = items
+        self.max_results = max_results
+        self.counts = 0
+        self._lock = threading.Lock()
+
+    def _search(self, params):
+        date_from = parse_hh_date(params.get("date_from"))
+        date_to = parse_hh_date(params.get("date_to"))
+        for item in self.items:
+            published = parse_hh_date(item["published_at"])
+            if str(params["area"]) not in AREA_PATHS[item["area"]["id"]]:
+                continue
+            if (date_from and published < date_from) or (date_to and published > date_to):
+                continue
+            yield item
+
+    def count_vacancies(self, search_query, extra_params=None):
+        with self._lock:
+            self.counts += 1
+        return sum(1 for _ in self._search(extra_params))
+
+    def iter_all_vacancies(self, search_query, max_workers=4, extra_params=None):
+        return list(self._search(extra_params))[:self.max_results]
+
+
+class TestShardedHarvester(unittest.TestCase):
+    def setUp(self):
+        self.items = make_items()
+        self.api = FakeAPI(self.items, max_results=10)
+        self.harvester = ShardedHarvester(self.api, area_tree=AREA_TREE, max_results=10, now=NOW)
+
+    def test_plan_splits_by_area_and_date(self):
+        """Тест: большие регионы делятся на дочерние, города - по датам"""
+        shards = self.harvester.plan("python")
+        self.assertTrue(all(shard.found <= 10 and not shard.truncated for shard in shards))
+        areas = {shard.params["area"] for shard in shards}
+        self.assertEqual(areas, {"1", "2", "1620", "1624"})
+        # Вакансии Марий Эл без города не покрыты Йошкар-Олой, поэтому регион делится по датам
+        self.assertTrue(all("date_from" in shard.params for shard in shards if shard.params["area"] in ("1", "1620")))
+        self.assertGreaterEqual(sum(shard.found for shard in shards), len(self.items))
+
+    def test_harvest_is_complete_without_duplicates(self):
+        """Тест: выгружаются все вакансии, повторы на границах шардов отбрасываются"""
+        items, stats = self.harvester.harvest("python")
+        ids = [item["id"] for item in items]
+        self.assertEqual(sorted(ids), sorted(item["id"] for item in self.items))
+        self.assertEqual(stats["fetched"], len(self.items))
+        self.assertEqual(stats["found"], len(self.items))
+        self.assertEqual(stats["truncated"], 0)
+        # Повторно загружаются только вакансии Йошкар-Олы из интервала с вакансиями Марий Эл без города
+        self.assertEqual(stats["duplicates"], 3)
+
+    def test_gap_within_tolerance_is_skipped(self):
+        """Тест: расхождение счётчиков в пределах gap_tolerance не догружается"""
+        harvester = ShardedHarvester(self.api, area_tree=AREA_TREE, max_results=10, now=NOW, gap_tolerance=9)
+        items, stats = harvester.harvest("python")
+        self.assertEqual(len(items), len(self.items) - 9)
+        self.assertEqual((stats["found"], stats["duplicates"]), (len(self.items), 0))
+
+    def test_single_api_call_would_truncate(self):
+        """Тест: без шардов результат обрезается окном выдачи"""
+        self.assertEqual(len(self.api.iter_all_vacancies("python", extra_params={"area": "113"})), 10)
+
+    def test_truncated_shard(self):
+        """Тест: шард, который нельзя поделить, загружается с пометкой"""
+        harvester = ShardedHarvester(
+            self.api, area_tree=AREA_TREE, max_results=10, min_window=timedelta(days=60), now=NOW
+        )
+        items, stats = harvester.harvest("python", {"area": "1"})
+        self.assertEqual(stats["truncated"], 1)
+        self.assertEqual(len(items), 10)
+
+    def test_empty_result(self):
+        """Тест: пустой запрос не загружает шарды"""
+        items, stats = self.harvester.harvest("python", {"area": "1", "date_to": "2023-01-01T00:00:00+0000"})
+        self.assertEqual(items, [])
+        self.assertEqual(stats["shards"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
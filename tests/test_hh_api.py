@@ -7,7 +7,7 @@ class TestHeadHunterAPI(unittest.TestCase):
     def setUp(self):
         self.api = HeadHunterAPI()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_connect_to_api_success(self, mock_get):
         """Тест успешного подключения к API"""
         mock_response = MagicMock()
@@ -15,9 +15,10 @@ class TestHeadHunterAPI(unittest.TestCase):
         mock_get.return_value = mock_response
 
         # Не должно быть исключения
-        self.api._connect_to_api()
+        self.api.check_connection()
+        self.assertEqual(mock_get.call_args.kwargs["params"], {"per_page": 1})
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_connect_to_api_failure(self, mock_get):
         """Тест неудачного подключения к API"""
         mock_response = MagicMock()
@@ -25,9 +26,31 @@ class TestHeadHunterAPI(unittest.TestCase):
         mock_get.return_value = mock_response
 
         with self.assertRaises(ConnectionError):
-            self.api._connect_to_api()
+            self.api.check_connection()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_init_makes_no_requests(self, mock_get):
+        """Тест: создание клиента не делает сетевых запросов"""
+        HeadHunterAPI()
+        mock_get.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_stats(self, mock_get):
+        """Тест счётчиков запросов"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"items": []}
+        mock_get.return_value = mock_response
+
+        self.api.get_vacancies("python")
+        self.api.get_vacancies("java")
+
+        stats = self.api.get_stats()
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["errors"], 0)
+        self.assertGreaterEqual(stats["avg_time"], 0.0)
+
+    @patch("requests.Session.get")
     def test_get_vacancies_success(self, mock_get):
         """Тест успешного получения вакансий"""
         mock_response = MagicMock()
@@ -44,7 +67,7 @@ class TestHeadHunterAPI(unittest.TestCase):
         self.assertEqual(len(vacancies), 2)
         self.assertEqual(vacancies[0]["name"], "Python Developer")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vacancies_empty(self, mock_get):
         """Тест получения пустого списка вакансий"""
         mock_response = MagicMock()
@@ -55,7 +78,7 @@ class TestHeadHunterAPI(unittest.TestCase):
         vacancies = self.api.get_vacancies("nonexistent")
         self.assertEqual(len(vacancies), 0)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vacancies_params(self, mock_get):
         """Тест передачи параметров в запрос"""
         mock_response = MagicMock()
@@ -72,7 +95,7 @@ class TestHeadHunterAPI(unittest.TestCase):
         self.assertEqual(kwargs["params"]["per_page"], 50)
         self.assertEqual(kwargs["params"]["area"], 113)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vacancies_error(self, mock_get):
         """Тест обработки ошибки запроса"""
         mock_response = MagicMock()
@@ -84,5 +107,63 @@ class TestHeadHunterAPI(unittest.TestCase):
             self.api.get_vacancies("python")
 
 
+class TestHeadHunterAPIPagination(unittest.TestCase):
+    def setUp(self):
+        self.api = HeadHunterAPI()
+
+    @staticmethod
+    def _page_response(params, pages=3, found=5):
+        page = params["page"]
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "items": [{"id": f"{page}-{i}", "name": "Vacancy"} for i in range(2)],
+            "page": page,
+            "pages": pages,
+            "found": found,
+        }
+        return mock_response
+
+    @patch("requests.Session.get")
+    def test_iter_all_vacancies(self, mock_get):
+        """Тест загрузки всех страниц в порядке следования"""
+        mock_get.side_effect = lambda url, params, **kwargs: self._page_response(params)
+
+        vacancies = list(self.api.iter_all_vacancies("python", per_page=2))
+
+        self.assertEqual(
+            [v["id"] for v in vacancies], ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+        )
+        self.assertEqual(mock_get.call_count, 3)
+        requested_pages = sorted(call.kwargs["params"]["page"] for call in mock_get.call_args_list)
+        self.assertEqual(requested_pages, [0, 1, 2])
+
+    @patch("requests.Session.get")
+    def test_pages_limited_by_result_cap(self, mock_get):
+        """Тест ограничения числа страниц лимитом HH в 2000 вакансий"""
+        mock_get.side_effect = lambda url, params, **kwargs: self._page_response(params, pages=500)
+
+        self.api.get_all_vacancies("python", per_page=100)
+        self.assertEqual(mock_get.call_count, 20)
+
+    @patch("requests.Session.get")
+    def test_max_pages_and_extra_params(self, mock_get):
+        """Тест ограничения страниц и дополнительных параметров"""
+        mock_get.side_effect = lambda url, params, **kwargs: self._page_response(params, pages=10)
+
+        self.api.get_all_vacancies("python", max_pages=2, extra_params={"area": 1})
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["area"], 1)
+
+    @patch("requests.Session.get")
+    def test_count_vacancies(self, mock_get):
+        """Тест получения количества вакансий одним запросом"""
+        mock_get.side_effect = lambda url, params, **kwargs: self._page_response(params, found=1234)
+
+        self.assertEqual(self.api.count_vacancies("python", extra_params={"area": 1}), 1234)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["per_page"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,20 @@
 import unittest
+import multiprocessing
 import os
 import tempfile
 from typing import Dict
-from src.storage.json_storage import JSONStorage  # Или ваш путь к модулю
+from unittest.mock import patch
+from src.storage.json_storage import JSONStorage, StorageCorruptedError  # Или ваш путь к модулю
+from src.storage.codecs import available_codecs
+
+
+def add_batch(file_path, worker, journal):
+    """Добавляет пакет вакансий из отдельного процесса"""
+    storage = JSONStorage(file_path=file_path, journal=journal)
+    for batch in range(5):
+        storage.add_vacancies(
+            {"id": f"{worker}-{batch}-{i}", "name": "Vacancy"} for i in range(10)
+        )
 
 
 class TestJSONStorage(unittest.TestCase):
@@ -79,6 +91,191 @@ class TestJSONStorage(unittest.TestCase):
         self.assertEqual(vacancies[0]["name"], "Vacancy 1")
         self.assertEqual(vacancies[1]["name"], "Vacancy 2")
 
+    def test_add_vacancies_batch(self):
+        """Тест пакетного добавления вакансий"""
+        self.storage.add_vacancy({"id": "1", "name": "Existing"})
+        batch = [
+            {"id": "1", "name": "Duplicate of stored"},
+            {"id": "2", "name": "New 1"},
+            {"id": "3", "name": "New 2"},
+            {"id": "2", "name": "Duplicate in batch"},
+            {"name": "No ID"},
+        ]
+
+        result = self.storage.add_vacancies(batch)
+        self.assertEqual(result, {"inserted": 2, "skipped": 3})
+
+        vacancies = self.storage._read_file()
+        self.assertEqual([v["id"] for v in vacancies], ["1", "2", "3"])
+        self.assertEqual(vacancies[1]["name"], "New 1")
+
+    def test_add_vacancies_generator(self):
+        """Тест пакетного добавления из генератора"""
+        result = self.storage.add_vacancies(
+            {"id": str(i), "name": f"Vacancy {i}"} for i in range(5)
+        )
+        self.assertEqual(result["inserted"], 5)
+        self.assertEqual(len(self.storage._read_file()), 5)
+
+    def test_write_file_leaves_no_temp_files(self):
+        """Тест атомарной записи: временные файлы не остаются"""
+        self.storage._write_file([{"id": "1", "name": "Vacancy 1"}])
+        # Кроме хранилища остаётся только кэш смещений для open_reader
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir.name)), ["test_vacancies.json", "test_vacancies.json.offsets"]
+        )
+
+    def test_compact_storage(self):
+        """Тест компактной записи без отступов"""
+        storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "compact.json"), compact=True)
+        storage.add_vacancies([{"id": "1", "name": "Вакансия"}, {"id": "2", "name": "Vacancy 2"}])
+
+        with open(storage.file_path, "r", encoding="utf-8") as file:
+            content = file.read()
+        self.assertNotIn("\n", content)
+        self.assertIn("Вакансия", content)
+        self.assertEqual(len(JSONStorage(file_path=storage.file_path)._read_file()), 2)
+
+    def test_codecs_are_interchangeable(self):
+        """Тест: файл, записанный одним кодеком, читается другим"""
+        self.storage.add_vacancy({"id": "1", "name": "Vacancy 1"})
+        for codec in available_codecs():
+            if codec != "msgpack":
+                storage = JSONStorage(file_path=self.test_file, codec=codec)
+                self.assertEqual(storage._read_file()[0]["id"], "1")
+
+        with self.assertRaises(ValueError):
+            JSONStorage(file_path=self.test_file, codec="unknown")
+
+    def test_corrupted_file_is_not_overwritten(self):
+        """Тест: повреждённый файл вызывает ошибку, а не подменяется пустым списком"""
+        with open(self.test_file, "w", encoding="utf-8") as file:
+            file.write('[{"id": "1", "na')
+
+        with self.assertRaises(StorageCorruptedError):
+            self.storage._read_file()
+        with self.assertRaises(StorageCorruptedError):
+            self.storage.add_vacancies([{"id": "2", "name": "Vacancy 2"}])
+        with self.assertRaisesRegex(StorageCorruptedError, "повреждён"):
+            self.storage.add_vacancy({"id": "2", "name": "Vacancy 2"})
+        with open(self.test_file, "r", encoding="utf-8") as file:
+            self.assertEqual(file.read(), '[{"id": "1", "na')
+
+    def test_write_keeps_file_mode(self):
+        """Тест: атомарная запись сохраняет права файла"""
+        self.storage._write_file([])
+        os.chmod(self.test_file, 0o640)
+        self.storage._write_file([{"id": "1", "name": "Vacancy 1"}])
+        self.assertEqual(os.stat(self.test_file).st_mode & 0o777, 0o640)
+
+    def test_write_does_not_touch_umask(self):
+        """Тест: запись нового файла не меняет маску прав процесса (она общая для всех потоков)"""
+        with patch("os.umask") as umask:
+            self.storage._write_file([{"id": "1", "name": "Vacancy 1"}])
+        umask.assert_not_called()
+        current = os.umask(0)
+        os.umask(current)
+        self.assertEqual(os.stat(self.test_file).st_mode & 0o777, 0o666 & ~current)
+
+    def test_journal_commit(self):
+        """Тест групповой фиксации через журнал"""
+        storage = JSONStorage(file_path=self.test_file, journal=True)
+        storage._append_journal([{"id": "1", "name": "Pending"}])
+
+        result = storage.add_vacancies([{"id": "2", "name": "New"}, {"id": "1", "name": "Dup"}])
+        self.assertEqual(result, {"inserted": 2, "skipped": 1})
+        self.assertEqual([v["id"] for v in storage._read_file()], ["1", "2"])
+        self.assertEqual(os.path.getsize(storage.journal_path), 0)
+        self.assertEqual(storage.commit_journal(), (0, 0))
+
+    def test_journal_with_torn_line(self):
+        """Тест: оборванная строка в середине журнала пропускается, а не ломает фиксацию"""
+        storage = JSONStorage(file_path=self.test_file, journal=True)
+        storage._append_journal([{"id": "1", "name": "Before"}])
+        with open(storage.journal_path, "ab") as file:
+            file.write(b'{"id": "2", "na')
+        storage._append_journal([{"id": "3", "name": "After"}])
+        with open(storage.journal_path, "ab") as file:
+            file.write(b'{"id": "4", "na\n')
+
+        self.assertEqual(storage.commit_journal(), (2, 2))
+        self.assertEqual([v["id"] for v in storage._read_file()], ["1", "3"])
+        self.assertEqual(storage.add_vacancies([{"id": "5", "name": "Next"}]), {"inserted": 1, "skipped": 0})
+
+    def _vacancy(self, vacancy_id, salary_from=None, salary_to=None, area="Москва", name="Python developer"):
+        return {
+            "id": vacancy_id,
+            "name": name,
+            "salary": {"from": salary_from, "to": salary_to, "currency": "RUR"},
+            "area": {"name": area},
+            "employer": {"name": f"Company {vacancy_id}"},
+        }
+
+    def test_get_vacancies_by_criteria(self):
+        """Тест выборки по критериям через индексы"""
+        self.storage.add_vacancies(
+            [
+                self._vacancy("1", 50000, 80000),
+                self._vacancy("2", 150000, name="Java developer"),
+                self._vacancy("3", 200000, 250000, area="Казань"),
+                self._vacancy("4", 120000, 180000),
+            ]
+        )
+        result = self.storage.get_vacancies({"salary_from": 100000, "area": "Москва"})
+        self.assertEqual([v.id for v in result], ["2", "4"])
+        result = self.storage.get_vacancies({"salary_to": 200000})
+        self.assertEqual([v.id for v in result], ["1", "4"])
+        result = self.storage.get_vacancies({"keywords": ["PYTHON", "dev"], "salary_from": 60000})
+        self.assertEqual([v.id for v in result], ["3", "4"])
+        self.assertEqual([v.id for v in self.storage.get_vacancies({"employer": "Company 3"})], ["3"])
+        self.assertEqual(len(self.storage.get_vacancies()), 4)
+        self.assertEqual(self.storage.get_vacancies({"id": "5"}), [])
+        with self.assertRaises(ValueError):
+            self.storage.get_vacancies({"unknown": 1})
+
+    def test_index_is_rebuilt_after_change(self):
+        """Тест: индекс перестраивается после изменения файла другим экземпляром"""
+        self.storage.add_vacancies([self._vacancy("1", 100000)])
+        self.assertEqual(len(self.storage.get_vacancies()), 1)
+
+        JSONStorage(file_path=self.test_file).add_vacancy(self._vacancy("2", 100000))
+        self.assertEqual([v.id for v in self.storage.get_vacancies()], ["1", "2"])
+
+    def test_delete_vacancy(self):
+        """Тест удаления вакансии по объекту и по id"""
+        self.storage.add_vacancies([self._vacancy("1"), self._vacancy("2"), self._vacancy("3")])
+        self.storage.delete_vacancy(self._vacancy("1"))
+        self.storage.delete_vacancy("3")
+        self.storage.delete_vacancy("missing")
+        self.assertEqual([v.id for v in self.storage.get_vacancies()], ["2"])
+        self.assertEqual([v["id"] for v in self.storage._read_file()], ["2"])
+
+    def test_upsert_vacancies(self):
+        """Тест замены существующих и добавления новых вакансий"""
+        self.storage.add_vacancies([self._vacancy("1"), self._vacancy("2")])
+        written = self.storage.upsert_vacancies([self._vacancy("2", name="Updated"), self._vacancy("3")])
+        self.assertEqual(written, 2)
+        self.assertEqual(
+            [v.name for v in self.storage.get_vacancies()], ["Python developer", "Updated", "Python developer"]
+        )
+
+    def test_concurrent_writers(self):
+        """Тест: параллельные процессы не теряют вакансии друг друга"""
+        for journal in (False, True):
+            file_path = os.path.join(self.temp_dir.name, f"concurrent_{journal}.json")
+            processes = [
+                multiprocessing.Process(target=add_batch, args=(file_path, worker, journal))
+                for worker in range(4)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            vacancies = JSONStorage(file_path=file_path)._read_file()
+            self.assertEqual(len(vacancies), 4 * 5 * 10)
+            self.assertEqual(len({v["id"] for v in vacancies}), 4 * 5 * 10)
+
 
 if __name__ == "__main__":
     unittest.main()
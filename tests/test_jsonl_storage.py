@@ -0,0 +1,121 @@
+import unittest
+import os
+import tempfile
+from src.models.vacancy import Vacancy, Salary, Area
+from src.storage.jsonl_storage import JSONLinesStorage
+
+
+class TestJSONLinesStorage(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_file = os.path.join(self.temp_dir.name, "vacancies.jsonl")
+        self.storage = JSONLinesStorage(file_path=self.test_file)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _vacancy(self, id_, salary_from=None, area="Москва"):
+        return Vacancy(
+            id=id_,
+            name=f"Vacancy {id_}",
+            salary=Salary(from_=salary_from, to=None, currency="RUR"),
+            area=Area(name=area),
+        )
+
+    def test_add_and_get_vacancy(self):
+        """Тест добавления и чтения вакансии по id"""
+        self.storage.add_vacancy(self._vacancy("1", 100000))
+
+        vacancy = self.storage.get_vacancy("1")
+        self.assertEqual(vacancy.name, "Vacancy 1")
+        self.assertEqual(vacancy.salary_from, 100000)
+        self.assertIsNone(self.storage.get_vacancy("2"))
+
+    def test_add_is_append_only(self):
+        """Тест: добавление дописывает одну строку, не переписывая файл"""
+        self.storage.add_vacancy(self._vacancy("1"))
+        size_before = os.path.getsize(self.test_file)
+        self.storage.add_vacancy(self._vacancy("2"))
+
+        with open(self.test_file, "rb") as file:
+            lines = file.readlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(sum(len(line) for line in lines[:1]), size_before)
+
+    def test_add_vacancies_skips_duplicates(self):
+        """Тест пакетного добавления с дубликатами"""
+        self.storage.add_vacancy(self._vacancy("1"))
+        result = self.storage.add_vacancies(
+            [self._vacancy("1"), self._vacancy("2"), self._vacancy("2")]
+        )
+        self.assertEqual(result, {"inserted": 1, "skipped": 2})
+        self.assertEqual(len(self.storage), 2)
+
+    def test_get_vacancies_by_criteria(self):
+        """Тест выборки по критериям"""
+        self.storage.add_vacancies(
+            [
+                self._vacancy("1", 50000),
+                self._vacancy("2", 150000),
+                self._vacancy("3", 200000, area="Казань"),
+            ]
+        )
+        result = self.storage.get_vacancies({"salary_from": 100000, "area": "Москва"})
+        self.assertEqual([v.id for v in result], ["2"])
+        self.assertEqual(len(self.storage.get_vacancies()), 3)
+
+    def test_delete_and_upsert(self):
+        """Тест удаления и замены вакансии"""
+        self.storage.add_vacancies([self._vacancy("1", 1), self._vacancy("2", 2)])
+        self.storage.delete_vacancy(self._vacancy("1"))
+        self.storage.upsert_vacancy(self._vacancy("2", 20))
+
+        self.assertIsNone(self.storage.get_vacancy("1"))
+        self.assertEqual(self.storage.get_vacancy("2").salary_from, 20)
+        self.assertEqual(len(self.storage), 1)
+
+    def test_index_survives_reopen(self):
+        """Тест восстановления индекса из файла-индекса"""
+        self.storage.add_vacancies([self._vacancy("1"), self._vacancy("2")])
+        self.storage.delete_vacancy("1")
+
+        reopened = JSONLinesStorage(file_path=self.test_file)
+        self.assertEqual([v.id for v in reopened.get_vacancies()], ["2"])
+
+    def test_reopen_without_index_file(self):
+        """Тест перестроения индекса при потере файла-индекса"""
+        self.storage.add_vacancies([self._vacancy("1"), self._vacancy("2")])
+        self.storage.upsert_vacancy(self._vacancy("1", 10))
+        os.remove(self.storage.index_path)
+
+        reopened = JSONLinesStorage(file_path=self.test_file)
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened.get_vacancy("1").salary_from, 10)
+
+    def test_reopen_drops_partial_line(self):
+        """Тест отбрасывания недописанной строки после сбоя"""
+        self.storage.add_vacancy(self._vacancy("1"))
+        with open(self.test_file, "ab") as file:
+            file.write(b'{"id": "2", "na')
+
+        reopened = JSONLinesStorage(file_path=self.test_file)
+        reopened.add_vacancy(self._vacancy("3"))
+        self.assertEqual(sorted(v.id for v in reopened.get_vacancies()), ["1", "3"])
+
+    def test_compact(self):
+        """Тест сжатия хранилища"""
+        self.storage.add_vacancies([self._vacancy("1"), self._vacancy("2")])
+        self.storage.upsert_vacancy(self._vacancy("2", 5))
+        self.storage.delete_vacancy("1")
+
+        removed = self.storage.compact()
+        self.assertEqual(removed, 3)
+        with open(self.test_file, "rb") as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+        reopened = JSONLinesStorage(file_path=self.test_file)
+        self.assertEqual(reopened.get_vacancy("2").salary_from, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
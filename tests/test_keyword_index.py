@@ -0,0 +1,143 @@
+import unittest
+import os
+import tempfile
+from src.models.vacancy import Vacancy, Snippet
+from src.storage.jsonl_storage import JSONLinesStorage
+from src.utils.keyword_index import KeywordIndex, tokenize
+
+
+def make_vacancy(id_, name, requirement=None):
+    """Создаёт вакансию с заданным текстом"""
+    return Vacancy(id=id_, name=name, snippet=Snippet(requirement=requirement, responsibility=None))
+
+
+class TestKeywordIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.vacancies = [
+            make_vacancy("1", "Python разработчик", "Django, PostgreSQL"),
+            make_vacancy("2", "Python Developer", "Flask"),
+            make_vacancy("3", "Java разработчик", "Spring"),
+            make_vacancy("4", "Стажёр Python"),
+        ]
+        self.index = KeywordIndex.build(self.vacancies)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tokenize(self):
+        """Тест разбиения текста на слова"""
+        self.assertEqual(tokenize("Python-разработчик, ЁЖ!"), {"python", "разработчик", "еж"})
+
+    def test_and_or_not(self):
+        """Тест запросов AND/OR/NOT"""
+        self.assertEqual(self.index.query(all_words=["python", "разработчик"]), {"1"})
+        self.assertEqual(self.index.query(any_words=["django", "flask"]), {"1", "2"})
+        self.assertEqual(self.index.query(all_words=["python"], not_words=["стажер"]), {"1", "2"})
+        self.assertEqual(self.index.query(not_words=["python"]), {"3"})
+
+    def test_prefix(self):
+        """Тест поиска по началу слова"""
+        self.assertEqual(self.index.query(all_words=["разраб"]), set())
+        self.assertEqual(self.index.query(all_words=["разраб"], prefix=True), {"1", "3"})
+
+    def test_substring(self):
+        """Тест поиска по части слова через n-граммы словаря, в том числе после изменений индекса"""
+        self.assertEqual(self.index.query(all_words=["работ"], substring=True), {"1", "3"})
+        self.assertEqual(self.index.query(all_words=["gr"], substring=True), {"1"})
+        self.assertEqual(self.index.query(all_words=["y"], substring=True), {"1", "2", "4"})
+        self.assertEqual(self.index.query(all_words=["ythonx"], substring=True), set())
+
+        self.index.add(make_vacancy("5", "Разработка на Go"))
+        self.index.remove("3")
+        self.assertEqual(self.index.query(all_words=["работ"], substring=True), {"1", "5"})
+        self.assertEqual(self.index.query(all_words=["spring"], substring=True), set())
+        self.assertNotIn("spr", self.index._grams)
+
+    def test_search_expression(self):
+        """Тест строки запроса"""
+        self.assertEqual(self.index.search("python django|flask"), {"1", "2"})
+        self.assertEqual(self.index.search("разработчик -java"), {"1"})
+        self.assertEqual(self.index.search("-python"), {"3"})
+
+    def test_incremental_updates(self):
+        """Тест добавления, замены и удаления"""
+        self.index.add(make_vacancy("5", "Go разработчик"))
+        self.index.add(make_vacancy("3", "Kotlin разработчик"))
+        self.index.remove("1")
+
+        self.assertEqual(self.index.query(all_words=["разработчик"]), {"3", "5"})
+        self.assertEqual(self.index.query(all_words=["java"]), set())
+        self.assertEqual(self.index.query(all_words=["kot"], prefix=True), {"3"})
+        self.assertEqual(len(self.index), 4)
+
+    def test_persistence(self):
+        """Тест сохранения снимка и журнала изменений"""
+        path = os.path.join(self.temp_dir.name, "keywords.json")
+        index = KeywordIndex.build(self.vacancies, path=path)
+        index.add(make_vacancy("5", "Go разработчик"))
+        index.remove("2")
+
+        reopened = KeywordIndex(path=path)
+        self.assertEqual(reopened.query(all_words=["разработчик"]), {"1", "3", "5"})
+        self.assertEqual(reopened.query(all_words=["flask"]), set())
+
+        reopened.save()
+        self.assertFalse(os.path.exists(f"{path}.log"))
+        self.assertEqual(KeywordIndex(path=path).query(all_words=["go"]), {"5"})
+
+    def test_storage_integration(self):
+        """Тест обновления индекса хранилищем JSON Lines"""
+        storage = JSONLinesStorage(
+            file_path=os.path.join(self.temp_dir.name, "vacancies.jsonl"),
+            keyword_index=KeywordIndex(),
+        )
+        storage.add_vacancies(self.vacancies)
+        storage.delete_vacancy("4")
+
+        self.assertEqual(storage.keyword_index.query(all_words=["python"]), {"1", "2"})
+        result = storage.get_vacancies({"keywords": ["python", "разраб"]})
+        self.assertEqual([v.id for v in result], ["1"])
+
+    def test_storage_builds_index_for_existing_records(self):
+        """Тест: новый или отставший индекс перестраивается по хранилищу при открытии"""
+        file_path = os.path.join(self.temp_dir.name, "vacancies.jsonl")
+        index_path = os.path.join(self.temp_dir.name, "keywords.json")
+        JSONLinesStorage(file_path=file_path).add_vacancies(self.vacancies[:2])
+
+        storage = JSONLinesStorage(file_path=file_path, keyword_index=KeywordIndex(path=index_path))
+        self.assertEqual([v.id for v in storage.get_vacancies({"keywords": ["python"]})], ["1", "2"])
+
+        # Записи дописаны без индекса: сохранённый индекс отстал от хранилища
+        JSONLinesStorage(file_path=file_path).add_vacancies(self.vacancies[2:])
+        storage = JSONLinesStorage(file_path=file_path, keyword_index=KeywordIndex(path=index_path))
+        self.assertEqual([v.id for v in storage.get_vacancies({"keywords": ["python"]})], ["1", "2", "4"])
+        self.assertEqual(KeywordIndex(path=index_path).generation, os.path.getsize(file_path))
+
+    def test_storage_matches_with_and_without_index(self):
+        """Тест: ответ хранилища не зависит от наличия индекса слов"""
+        plain = JSONLinesStorage(file_path=os.path.join(self.temp_dir.name, "plain.jsonl"))
+        indexed = JSONLinesStorage(
+            file_path=os.path.join(self.temp_dir.name, "indexed.jsonl"),
+            keyword_index=KeywordIndex(),
+        )
+        plain.add_vacancies(self.vacancies)
+        indexed.add_vacancies(self.vacancies)
+        for keywords in (["стажер"], ["СТАЖЁР"], ["работ"], ["thon dev"], ["++"], ["python", "sql"]):
+            expected = [v.id for v in plain.get_vacancies({"keywords": keywords})]
+            self.assertEqual([v.id for v in indexed.get_vacancies({"keywords": keywords})], expected, keywords)
+        self.assertEqual([v.id for v in indexed.get_vacancies({"keywords": ["работ"]})], ["1", "3"])
+
+    def test_batch_writes_log_once(self):
+        """Тест: изменения пачки попадают в журнал вместе"""
+        path = os.path.join(self.temp_dir.name, "keywords.json")
+        index = KeywordIndex(path=path)
+        with index.batch():
+            index.add(self.vacancies[0])
+            index.add(self.vacancies[1])
+            self.assertFalse(os.path.exists(f"{path}.log"))
+        self.assertEqual(KeywordIndex(path=path).query(all_words=["python"]), {"1", "2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
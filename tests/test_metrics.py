@@ -0,0 +1,104 @@
+import unittest
+import json
+import os
+import tempfile
+from unittest.mock import patch
+from src.storage.json_storage import JSONStorage
+from src.utils.metrics import METRICS_ENV, PROFILE_ENV, Metrics, instrumentation_from_env, metrics
+from src.utils.pipeline import run_pipeline
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Metrics()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled_metrics_collect_nothing(self):
+        """Тест: выключенные метрики ничего не накапливают"""
+        with self.metrics.timer("parse") as timer:
+            timer.records = 10
+        self.metrics.observe("fetch", 1.0)
+        self.metrics.increment("errors")
+        self.assertEqual(self.metrics.snapshot(), {"stages": {}, "counters": {}})
+
+    def test_timer_observe_and_counters(self):
+        """Тест накопления времени, записей, байт и счётчиков"""
+        self.metrics.enable()
+        with self.metrics.timer("parse") as timer:
+            timer.records = 10
+        self.metrics.observe("fetch", 0.5, records=2, size=100)
+        self.metrics.observe("fetch", 0.25, records=3, size=50)
+        self.metrics.increment("errors", 2)
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["stages"]["fetch"], {"calls": 2, "seconds": 0.75, "records": 5, "bytes": 150})
+        self.assertEqual(snapshot["stages"]["parse"]["records"], 10)
+        self.assertEqual(snapshot["counters"], {"errors": 2})
+
+    def test_instrument_decorator(self):
+        """Тест декоратора: учитывается длина возвращённого списка"""
+        @self.metrics.instrument("filter")
+        def keep_even(values):
+            return [v for v in values if v % 2 == 0]
+
+        self.assertEqual(keep_even(range(4)), [0, 2])
+        self.assertNotIn("filter", self.metrics.snapshot()["stages"])
+        self.metrics.enable()
+        keep_even(range(10))
+        self.assertEqual(self.metrics.snapshot()["stages"]["filter"]["records"], 5)
+
+    def test_prometheus_export(self):
+        """Тест выгрузки в формате Prometheus"""
+        self.metrics.enable()
+        self.metrics.observe("api.request", 0.5, size=10)
+        self.metrics.increment("api.cache_hits")
+        text = self.metrics.to_prometheus()
+        self.assertIn("# TYPE vacancy_stage_seconds_total counter", text)
+        self.assertIn('vacancy_stage_bytes_total{stage="api.request"} 10', text)
+        self.assertIn('vacancy_events_total{event="api.cache_hits"} 1', text)
+
+    def test_pipeline_and_storage_stages(self):
+        """Тест: конвейер и хранилище учитывают свои этапы"""
+        raw = [
+            {
+                "id": str(i),
+                "name": "Python" if i % 2 else "Java",
+                "salary": {"from": 1000 * i, "currency": "RUR"},
+                "snippet": {"requirement": None, "responsibility": None},
+            }
+            for i in range(10)
+        ]
+        storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.json"))
+        metrics.enable()
+        top, stats = run_pipeline(raw, ["python"], "3000", 2, storage=storage)
+
+        stages = metrics.snapshot()["stages"]
+        self.assertEqual(stages["pipeline.fetch"]["records"], 10)
+        self.assertEqual(stages["filter.keywords"]["records"], stats["filtered"])
+        self.assertEqual(stages["filter.salary"]["records"], stats["ranged"])
+        self.assertEqual(stages["pipeline.top"]["records"], 2)
+        self.assertEqual(stages["storage.write"]["records"], 10)
+        self.assertGreater(stages["storage.write"]["bytes"], 0)
+
+    def test_instrumentation_from_env(self):
+        """Тест включения метрик и профиля через переменные окружения"""
+        metrics_path = os.path.join(self.temp_dir.name, "metrics.json")
+        prefix = os.path.join(self.temp_dir.name, "profile")
+        with patch.dict(os.environ, {METRICS_ENV: metrics_path, PROFILE_ENV: prefix}):
+            with instrumentation_from_env():
+                metrics.increment("runs")
+
+        self.assertFalse(metrics.enabled)
+        with open(metrics_path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["counters"], {"runs": 1})
+        self.assertTrue(os.path.exists(f"{prefix}.prof"))
+        self.assertTrue(os.path.exists(f"{prefix}.memory.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
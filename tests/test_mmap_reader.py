@@ -0,0 +1,101 @@
+import unittest
+import mmap
+import os
+import tempfile
+from unittest.mock import patch
+from src.models.vacancy import Vacancy, Salary, Employer
+from src.storage.json_storage import JSONStorage
+from src.storage.mmap_reader import MappedVacancyReader
+
+
+class TestMappedVacancyReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_file = os.path.join(self.temp_dir.name, "vacancies.json")
+        self.storage = JSONStorage(file_path=self.test_file)
+        self.storage.add_vacancies(
+            [
+                Vacancy(id="1", name='Name with "quotes" and {braces} [1]', salary=Salary(from_=100)),
+                # Вложенный объект с собственным ключом "id" не должен путать индекс
+                {"id": "2", "name": "Raw", "employer": {"id": "999", "name": "Company"}},
+                Vacancy(id="3", name="Третья", employer=Employer(name="id")),
+            ]
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_random_access(self):
+        """Тест доступа по id"""
+        with self.storage.open_reader() as reader:
+            self.assertEqual(len(reader), 3)
+            self.assertEqual(reader.ids(), ["1", "2", "3"])
+            self.assertIn("2", reader)
+            self.assertNotIn("999", reader)
+            self.assertEqual(reader.get("1").salary_from, 100)
+            self.assertEqual(reader.get("3").employer.name, "id")
+            self.assertIsNone(reader.get("404"))
+
+    def test_iteration_matches_full_read(self):
+        """Тест: ленивый обход совпадает с полным чтением файла"""
+        with self.storage.open_reader() as reader:
+            self.assertEqual(list(reader.iter_dicts()), self.storage._read_file())
+            self.assertEqual([v.id for v in reader], ["1", "2", "3"])
+
+    def test_compact_file(self):
+        """Тест разметки компактного файла"""
+        storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "compact.json"), compact=True)
+        storage.add_vacancies(self.storage._read_file())
+        with storage.open_reader() as reader:
+            self.assertEqual(reader.ids(), ["1", "2", "3"])
+            self.assertEqual(reader.get_dict("2")["employer"]["id"], "999")
+
+    def test_offsets_cache(self):
+        """Тест кэша смещений и его сброса после изменения файла"""
+        MappedVacancyReader(self.test_file).close()
+        self.assertTrue(os.path.exists(f"{self.test_file}.offsets"))
+
+        self.storage.add_vacancy({"id": "4", "name": "Новая вакансия"})
+        with MappedVacancyReader(self.test_file) as reader:
+            self.assertEqual(reader.ids(), ["1", "2", "3", "4"])
+
+    def test_offsets_written_by_storage(self):
+        """Тест: хранилище обновляет кэш смещений при записи, разметка не нужна"""
+        for compact in (False, True):
+            storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, f"store_{compact}.json"), compact=compact)
+            storage.add_vacancies(self.storage._read_file())
+            with patch.object(MappedVacancyReader, "_scan") as scan, storage.open_reader() as reader:
+                scan.assert_not_called()
+                cached = (reader._spans, reader.ids())
+            with MappedVacancyReader(storage.file_path, use_offsets_cache=False) as reader:
+                self.assertEqual(cached, (reader._spans, reader.ids()))
+
+    def test_file_replaced_while_opening(self):
+        """Тест: кэш смещений нового файла не применяется к уже открытому старому"""
+        old_ids = [v["id"] for v in self.storage._read_file()]
+        real_mmap = mmap.mmap
+
+        def replace_then_map(*args, **kwargs):
+            # Другой процесс заменяет хранилище между открытием файла и его разметкой
+            self.storage._write_file([{"id": "new", "name": "Новая вакансия " * 10}])
+            return real_mmap(*args, **kwargs)
+
+        with patch("src.storage.mmap_reader.mmap.mmap", side_effect=replace_then_map):
+            reader = MappedVacancyReader(self.test_file)
+        with reader:
+            self.assertEqual(reader.ids(), old_ids)
+            self.assertEqual([v.id for v in reader], old_ids)
+
+    def test_missing_and_empty_file(self):
+        """Тест отсутствующего и пустого файла"""
+        with MappedVacancyReader(os.path.join(self.temp_dir.name, "missing.json")) as reader:
+            self.assertEqual(len(reader), 0)
+
+        empty = os.path.join(self.temp_dir.name, "empty.json")
+        open(empty, "w").close()
+        with MappedVacancyReader(empty) as reader:
+            self.assertEqual(list(reader), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
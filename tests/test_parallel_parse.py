@@ -0,0 +1,65 @@
+import unittest
+import json
+import os
+import tempfile
+from src.models.vacancy import Vacancy
+from src.storage.json_storage import JSONStorage
+from src.utils.parallel_parse import ingest_files, ingest_parallel, parse_files, parse_parallel
+
+
+def make_raw(count):
+    """Данные API, каждая десятая запись невалидна"""
+    for i in range(count):
+        yield {"id": str(i), "name": f"Vacancy {i}"} if i % 10 else {"name": "no id"}
+
+
+class TestParallelParse(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_parallel_matches_serial(self):
+        """Тест: результат совпадает с последовательным разбором"""
+        serial_errors = []
+        expected = Vacancy.from_hh_data_many(list(make_raw(95)), serial_errors)
+
+        for max_workers in (1, 2):
+            errors = []
+            result = parse_parallel(make_raw(95), chunk_size=10, max_workers=max_workers, errors=errors)
+            self.assertEqual(result, expected)
+            self.assertEqual(errors, serial_errors)
+
+    def test_ingest_parallel(self):
+        """Тест сохранения разобранных вакансий в хранилище"""
+        storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.json"))
+        stats = ingest_parallel(make_raw(50), storage, chunk_size=7, max_workers=2)
+        self.assertEqual(stats, {"parsed": 45, "errors": 5, "inserted": 45, "skipped": 0})
+        self.assertEqual(len(storage._read_file()), 45)
+
+    def test_parse_files(self):
+        """Тест разбора сохранённых страниц выдачи"""
+        paths = []
+        raw = list(make_raw(30))
+        for page in range(3):
+            path = os.path.join(self.temp_dir.name, f"page_{page}.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"items": raw[page * 10:(page + 1) * 10]}, file)
+            paths.append(path)
+        broken = os.path.join(self.temp_dir.name, "broken.json")
+        with open(broken, "w", encoding="utf-8") as file:
+            file.write("{")
+
+        errors = []
+        result = parse_files(paths + [broken], max_workers=2, errors=errors)
+        self.assertEqual([v.id for v in result], [str(i) for i in range(30) if i % 10])
+        self.assertEqual(errors[0][0], f"{paths[0]}:0")
+        self.assertEqual(errors[-1][0], broken)
+
+        storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.json"))
+        self.assertEqual(ingest_files(paths, storage, max_workers=2)["inserted"], 27)
+
+
+if __name__ == "__main__":
+    unittest.main()
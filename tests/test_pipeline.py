@@ -0,0 +1,76 @@
+import unittest
+import os
+import tempfile
+from src.storage.json_storage import JSONStorage
+from src.utils.filters import filter_vacancies, get_vacancies_by_salary, sort_vacancies, get_top_vacancies
+from src.utils.pipeline import parse_vacancies, run_pipeline, save_stream
+from src.models.vacancy import Vacancy
+
+
+def make_raw(count):
+    """Генерирует данные вакансий в формате API"""
+    for i in range(count):
+        yield {
+            "id": str(i),
+            "name": "Python Developer" if i % 2 else "Java Developer",
+            "salary": {"from": 1000 * i, "to": 1000 * i + 500, "currency": "RUR"},
+            "snippet": {"requirement": "Опыт", "responsibility": None},
+        }
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.json"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_vacancies_skips_invalid(self):
+        """Тест пропуска невалидных записей при разборе"""
+        stats = {}
+        parsed = list(parse_vacancies([{"id": "1", "name": "Ok"}, "bad", {"name": "no id"}], stats))
+        self.assertEqual([v.id for v in parsed], ["1"])
+        self.assertEqual(stats, {"parsed": 1, "errors": 2})
+
+    def test_run_pipeline_matches_list_filters(self):
+        """Тест: результат конвейера совпадает со списочными фильтрами"""
+        vacancies = [Vacancy.from_hh_data(raw) for raw in make_raw(50)]
+        expected = get_top_vacancies(
+            sort_vacancies(get_vacancies_by_salary(filter_vacancies(vacancies, ["python"]), "10000")),
+            5,
+        )
+
+        top, stats = run_pipeline(make_raw(50), ["python"], "10000", 5)
+
+        self.assertEqual([v.id for v in top], [v.id for v in expected])
+        self.assertEqual(stats["parsed"], 50)
+        self.assertEqual(stats["filtered"], 25)
+        self.assertEqual(stats["ranged"], 20)
+
+    def test_run_pipeline_saves_all_parsed(self):
+        """Тест сохранения всех разобранных вакансий пачками"""
+        top, stats = run_pipeline(make_raw(25), ["nothing"], "", 3, storage=self.storage, batch_size=10)
+
+        self.assertEqual(top, [])
+        self.assertEqual(stats["saved"], 25)
+        self.assertEqual(len(self.storage._read_file()), 25)
+
+    def test_run_pipeline_is_lazy(self):
+        """Тест: конвейер не материализует входной поток"""
+        consumed = []
+
+        def source():
+            for raw in make_raw(10):
+                consumed.append(raw["id"])
+                yield raw
+
+        stream = save_stream(parse_vacancies(source()), self.storage, batch_size=100)
+        next(stream)
+        self.assertEqual(consumed, ["0"])
+        stream.close()
+        self.assertEqual(len(self.storage._read_file()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch, MagicMock
+from src.api.cache import ResponseCache
+from src.api.hh_api import HeadHunterAPI
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(cache_dir=self.temp_dir.name, ttl=60, max_entries=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_make_key_normalizes_params(self):
+        """Тест нормализации параметров: порядок ключей и регистр текста не важны"""
+        key1 = ResponseCache.make_key({"text": "Python  Developer", "per_page": 100})
+        key2 = ResponseCache.make_key({"per_page": "100", "text": "python developer"})
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, ResponseCache.make_key({"text": "java", "per_page": 100}))
+
+    def test_put_and_lookup(self):
+        """Тест сохранения и поиска записи"""
+        self.assertIsNone(self.cache.lookup("a"))
+        self.cache.put("a", {"items": [1]}, etag='"v1"')
+
+        entry = self.cache.lookup("a")
+        self.assertTrue(entry["fresh"])
+        self.assertEqual(entry["body"], {"items": [1]})
+        self.assertEqual(entry["etag"], '"v1"')
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_ttl_expiry(self):
+        """Тест устаревания записи"""
+        cache = ResponseCache(cache_dir=self.temp_dir.name, ttl=0)
+        cache.put("a", {})
+        self.assertFalse(cache.lookup("a")["fresh"])
+        self.assertEqual(cache.get_stats()["stale"], 1)
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использовавшихся записей"""
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.lookup("a")
+        self.cache.put("c", 3)
+
+        self.assertIsNotNone(self.cache.lookup("a"))
+        self.assertIsNone(self.cache.lookup("b"))
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+
+    def test_entries_survive_restart(self):
+        """Тест сохранения записей между экземплярами кэша"""
+        self.cache.put("a", {"x": 1})
+        cache = ResponseCache(cache_dir=self.temp_dir.name)
+        self.assertEqual(cache.lookup("a")["body"], {"x": 1})
+        self.assertEqual(cache.get_stats()["entries"], 1)
+
+
+class TestHeadHunterAPICache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _response(status_code=200, body=None, headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = body
+        response.headers = headers or {}
+        return response
+
+    @patch("requests.Session.get")
+    def test_repeated_query_served_from_cache(self, mock_get):
+        """Тест: повторный запрос не обращается к сети"""
+        mock_get.return_value = self._response(body={"items": [{"id": "1"}]})
+        api = HeadHunterAPI(cache=ResponseCache(cache_dir=self.temp_dir.name))
+
+        self.assertEqual(api.get_vacancies("python"), [{"id": "1"}])
+        self.assertEqual(api.get_vacancies("Python"), [{"id": "1"}])
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(api.cache.get_stats()["hits"], 1)
+
+    @patch("requests.Session.get")
+    def test_stale_entry_revalidated(self, mock_get):
+        """Тест условного запроса для устаревшей записи и ответа 304"""
+        api = HeadHunterAPI(cache=ResponseCache(cache_dir=self.temp_dir.name, ttl=0))
+        mock_get.return_value = self._response(
+            body={"items": [{"id": "1"}]},
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        api.get_vacancies("python")
+
+        mock_get.return_value = self._response(status_code=304)
+        self.assertEqual(api.get_vacancies("python"), [{"id": "1"}])
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertEqual(api.cache.get_stats()["revalidated"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+from src.models.vacancy import Vacancy, Salary
+from src.utils.filters import get_vacancies_by_salary
+from src.utils.salary_index import SalaryIndex
+
+
+class TestSalaryIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        self.vacancies = []
+        for i in range(300):
+            salary = None
+            if i % 7:
+                from_ = rng.choice([None, rng.randrange(0, 300000, 10000)])
+                to = rng.choice([None, (from_ or 0) + rng.randrange(0, 200000, 10000)])
+                salary = Salary(from_=from_, to=to, currency="RUR")
+            self.vacancies.append(Vacancy(id=str(i), name=f"Vacancy {i}", salary=salary))
+        self.index = SalaryIndex(self.vacancies)
+
+    def test_matches_linear_filter(self):
+        """Тест: результаты совпадают с get_vacancies_by_salary"""
+        for salary_range in ["", "0", "100000", "-150000", "100000-200000", "0-0", "500000", "abc"]:
+            expected = get_vacancies_by_salary(self.vacancies, salary_range)
+            self.assertEqual(
+                [v.id for v in self.index.query(salary_range)],
+                [v.id for v in expected],
+                salary_range,
+            )
+
+    def test_open_ended_forks(self):
+        """Тест вилок без одной из границ"""
+        index = SalaryIndex(
+            [
+                Vacancy(id="1", name="a", salary=Salary(from_=100000)),
+                Vacancy(id="2", name="b", salary=Salary(to=80000)),
+                Vacancy(id="3", name="c"),
+            ]
+        )
+        self.assertEqual([v.id for v in index.query_bounds(min_salary=50000)], ["1"])
+        self.assertEqual([v.id for v in index.query_bounds(max_salary=90000)], ["2"])
+        self.assertEqual([v.id for v in index.query_bounds()], ["1", "2"])
+
+    def test_count_bounds(self):
+        """Тест подсчёта без выборки"""
+        self.assertEqual(self.index.count_bounds(min_salary=100000), len(self.index.query("100000")))
+        self.assertEqual(self.index.count_bounds(max_salary=150000), len(self.index.query("-150000")))
+        self.assertEqual(
+            self.index.count_bounds(100000, 200000), len(self.index.query("100000-200000"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+from src.models.vacancy import Vacancy, Salary, Area, Employer, Snippet
+from src.storage.sqlite_storage import SQLiteStorage
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = SQLiteStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.db"))
+        self.storage.add_vacancies(
+            [
+                Vacancy(
+                    id="1",
+                    name="Python разработчик",
+                    salary=Salary(from_=100000, to=150000, currency="RUR"),
+                    area=Area(name="Москва"),
+                    employer=Employer(name="Яндекс"),
+                    snippet=Snippet(requirement="Знание Django", responsibility=None),
+                ),
+                Vacancy(
+                    id="2",
+                    name="Java Developer",
+                    salary=Salary(from_=200000, to=None, currency="RUR"),
+                    area=Area(name="Казань"),
+                ),
+                {"id": "3", "name": "Стажёр", "area": {"name": "Москва"}},
+            ]
+        )
+
+    def tearDown(self):
+        self.storage.close()
+        self.temp_dir.cleanup()
+
+    def test_add_vacancies_counts(self):
+        """Тест пакетной вставки с дубликатами"""
+        result = self.storage.add_vacancies([{"id": "1", "name": "Дубликат"}, {"id": "4", "name": "Новая"}])
+        self.assertEqual(result, {"inserted": 1, "skipped": 1})
+        self.assertEqual(len(self.storage), 4)
+
+    def test_roundtrip(self):
+        """Тест сохранения и восстановления вакансии"""
+        vacancy = self.storage.get_vacancies({"id": "1"})[0]
+        self.assertEqual(vacancy.salary, Salary(from_=100000, to=150000, currency="RUR"))
+        self.assertEqual(vacancy.employer.name, "Яндекс")
+        self.assertEqual(vacancy.snippet.requirement, "Знание Django")
+        self.assertIsNone(self.storage.get_vacancies({"id": "3"})[0].salary)
+
+    def test_roundtrip_keeps_base_salary(self):
+        """Тест: границы вилки в базовой валюте сохраняются вместе с вакансией"""
+        salary = Salary(from_=1000, to=2000, currency="USD", from_base=90000.0, to_base=180000.0)
+        self.storage.add_vacancies([Vacancy(id="4", name="Remote Python", salary=salary)])
+        vacancy = self.storage.get_vacancies({"id": "4"})[0]
+        self.assertEqual(vacancy.salary, salary)
+        self.assertEqual(vacancy.salary_from_base, 90000.0)
+
+    def test_old_database_is_migrated(self):
+        """Тест: в базу без столбцов базовой валюты они добавляются при открытии"""
+        file_path = os.path.join(self.temp_dir.name, "old.db")
+        connection = sqlite3.connect(file_path)
+        connection.execute("CREATE TABLE vacancies (id TEXT PRIMARY KEY, name TEXT NOT NULL, salary_from INTEGER, "
+                           "salary_to INTEGER, currency TEXT, area TEXT, employer TEXT, experience TEXT, "
+                           "employment TEXT, requirement TEXT, responsibility TEXT, alternate_url TEXT)")
+        connection.execute("INSERT INTO vacancies (id, name, salary_from) VALUES ('1', 'Старая', 100000)")
+        connection.commit()
+        connection.close()
+
+        with SQLiteStorage(file_path=file_path) as storage:
+            old = storage.get_vacancies({"id": "1"})[0]
+            self.assertEqual(old.salary, Salary(from_=100000, to=None, currency=None))
+            storage.upsert_vacancy(Vacancy(id="1", name="Старая", salary=Salary(from_=1, to=None, from_base=90.0)))
+            self.assertEqual(storage.get_vacancies()[0].salary.from_base, 90.0)
+
+    def test_salary_and_area_criteria(self):
+        """Тест выборки по зарплате и региону"""
+        self.assertEqual([v.id for v in self.storage.get_vacancies({"salary_from": 150000})], ["2"])
+        self.assertEqual([v.id for v in self.storage.get_vacancies({"salary_to": 150000})], ["1"])
+        self.assertEqual(
+            [v.id for v in self.storage.get_vacancies({"area": "Москва", "salary_from": 50000})],
+            ["1"],
+        )
+
+    def test_keywords_case_insensitive(self):
+        """Тест поиска по ключевым словам без учёта регистра (включая кириллицу)"""
+        result = self.storage.get_vacancies({"keywords": ["РАЗРАБОТЧИК", "django"]})
+        self.assertEqual([v.id for v in result], ["1"])
+
+    def test_queries_use_indexes(self):
+        """Тест использования индексов для зарплаты и региона"""
+        plan = " ".join(self.storage.explain({"salary_from": 100000}))
+        self.assertIn("idx_vacancies_salary_from", plan)
+        plan = " ".join(self.storage.explain({"area": "Москва"}))
+        self.assertIn("idx_vacancies_area", plan)
+
+    def test_delete_and_upsert(self):
+        """Тест удаления и замены вакансии"""
+        self.storage.delete_vacancy("2")
+        self.storage.upsert_vacancy({"id": "1", "name": "Обновлённая"})
+        self.assertEqual(len(self.storage), 2)
+        self.assertEqual(self.storage.get_vacancies({"id": "1"})[0].name, "Обновлённая")
+
+    def test_unknown_criteria(self):
+        """Тест ошибки на неизвестный критерий"""
+        with self.assertRaises(ValueError):
+            self.storage.get_vacancies({"unknown": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+import os
+import tempfile
+from datetime import timedelta
+from src.storage.json_storage import JSONStorage
+from src.utils.sync import IncrementalSync, parse_hh_date
+
+
+def make_item(vacancy_id, published_at, name="Python Developer"):
+    """Данные вакансии в формате API"""
+    return {
+        "id": vacancy_id,
+        "name": name,
+        "published_at": published_at,
+        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+    }
+
+
+class FakeAPI:
+    """API с фиксированным набором вакансий, поддержкой date_from/date_to и окном выдачи max_results"""
+
+    def __init__(self, items, max_results=2000):
+        self.items = items
+        self.max_results = max_results
+        self.calls = []
+
+    def _search(self, extra_params):
+        date_from = parse_hh_date(extra_params.get("date_from"))
+        date_to = parse_hh_date(extra_params.get("date_to"))
+        for item in self.items:
+            published = parse_hh_date(item["published_at"])
+            if (date_from is None or published >= date_from) and (date_to is None or published <= date_to):
+                yield item
+
+    def iter_all_vacancies(self, search_query, extra_params=None):
+        extra_params = extra_params or {}
+        self.calls.append(dict(extra_params))
+        items = list(self._search(extra_params))
+        if extra_params.get("order_by") == "publication_time":
+            # Как HH: сначала новые
+            items.sort(key=lambda item: parse_hh_date(item["published_at"]), reverse=True)
+        return iter(items[:self.max_results])
+
+    def count_vacancies(self, search_query, extra_params=None):
+        return sum(1 for _ in self._search(extra_params or {}))
+
+
+class TestIncrementalSync(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = JSONStorage(file_path=os.path.join(self.temp_dir.name, "vacancies.json"))
+        self.state_path = os.path.join(self.temp_dir.name, "sync_state.json")
+        self.api = FakeAPI(
+            [
+                make_item("1", "2024-01-10T10:00:00+0300"),
+                make_item("2", "2024-01-11T10:00:00+0300"),
+            ]
+        )
+        self.sync = IncrementalSync(self.api, self.storage, state_path=self.state_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def stored_ids(self):
+        return [v["id"] for v in self.storage._read_file()]
+
+    def test_first_run_is_full(self):
+        """Тест: первый запуск загружает результат целиком и запоминает водяной знак"""
+        stats = self.sync.sync("python")
+        self.assertTrue(stats["full"])
+        self.assertEqual(stats["inserted"], 2)
+        self.assertEqual(stats["watermark"], "2024-01-11T10:00:00+0300")
+        self.assertNotIn("date_from", self.api.calls[0])
+        self.assertEqual(self.stored_ids(), ["1", "2"])
+
+    def test_next_run_fetches_only_delta(self):
+        """Тест: повторный запуск запрашивает только изменения и обновляет вакансии"""
+        self.sync.sync("python")
+        self.api.items[1] = make_item("2", "2024-01-12T09:00:00+0300", name="Senior Python Developer")
+        self.api.items.append(make_item("3", "2024-01-12T10:00:00+0300"))
+
+        stats = self.sync.sync("python")
+        self.assertFalse(stats["full"])
+        self.assertEqual(self.api.calls[-1]["date_from"], "2024-01-11T09:55:00+0300")
+        self.assertEqual((stats["fetched"], stats["inserted"], stats["updated"]), (2, 1, 1))
+        self.assertEqual(self.stored_ids(), ["1", "2", "3"])
+        self.assertEqual(self.storage.get_vacancies({"id": "2"})[0].name, "Senior Python Developer")
+
+    def test_disappeared_vacancies_are_deleted(self):
+        """Тест: вакансии, исчезнувшие из результата, получают надгробие и удаляются из хранилища"""
+        sync = IncrementalSync(self.api, self.storage, state_path=self.state_path, sweep_interval=timedelta(0))
+        sync.sync("python")
+        del self.api.items[0]
+
+        stats = sync.sync("python")
+        self.assertEqual((stats["tombstoned"], stats["deleted"]), (1, 1))
+        self.assertEqual(self.stored_ids(), ["2"])
+        self.assertEqual(list(sync.load_state()["python"]["tombstones"]), ["1"])
+
+        # Без исчезновений полная сверка не выполняется
+        calls = len(self.api.calls)
+        self.assertEqual(sync.sync("python")["deleted"], 0)
+        self.assertEqual(len(self.api.calls), calls + 1)
+
+    def test_sweep_is_rate_limited(self):
+        """Тест: полная сверка выполняется не чаще раза в sweep_interval"""
+        self.sync.sync("python")
+        del self.api.items[0]
+
+        stats = self.sync.sync("python")
+        self.assertFalse(stats["swept"])
+        self.assertEqual(stats["tombstoned"], 0)
+        self.assertEqual(len(self.api.calls), 2)
+        self.assertEqual(self.stored_ids(), ["1", "2"])
+
+    def test_vacancy_referenced_by_other_query_is_kept(self):
+        """Тест: вакансия, которую ещё возвращает другой запрос, остаётся в хранилище"""
+        sync = IncrementalSync(self.api, self.storage, state_path=self.state_path, sweep_interval=timedelta(0))
+        sync.sync("python")
+        other = IncrementalSync(FakeAPI([make_item("1", "2024-01-10T10:00:00+0300")]), self.storage, self.state_path)
+        other.sync("django")
+        del self.api.items[0]
+
+        stats = sync.sync("python")
+        self.assertEqual((stats["tombstoned"], stats["deleted"]), (1, 0))
+        self.assertEqual(self.stored_ids(), ["1", "2"])
+
+    def test_delta_larger_than_window_is_fetched_by_dates(self):
+        """Тест: изменения, не помещающиеся в окно выдачи, загружаются по интервалам дат"""
+        self.api.max_results = 3
+        sync = IncrementalSync(self.api, self.storage, state_path=self.state_path, max_results=3)
+        sync.sync("python")
+        for i in range(6):
+            self.api.items.append(make_item(str(i + 3), f"2024-01-12T1{i}:00:00+0300"))
+
+        stats = sync.sync("python")
+        self.assertEqual(stats["truncated"], 0)
+        self.assertEqual(stats["inserted"], 6)
+        self.assertEqual(sorted(self.stored_ids(), key=int), [str(i) for i in range(1, 9)])
+        self.assertEqual(stats["watermark"], "2024-01-12T15:00:00+0300")
+
+    def test_truncated_window_keeps_watermark(self):
+        """Тест: если интервал нельзя поделить, водяной знак не сдвигается за его начало"""
+        self.api.max_results = 3
+        sync = IncrementalSync(
+            self.api, self.storage, state_path=self.state_path, max_results=3, min_window=timedelta(days=3650)
+        )
+        sync.sync("python")
+        for i in range(6):
+            self.api.items.append(make_item(str(i + 3), f"2024-01-12T1{i}:00:00+0300"))
+
+        stats = sync.sync("python")
+        self.assertEqual(stats["truncated"], 1)
+        self.assertEqual(stats["watermark"], "2024-01-11T10:00:00+0300")
+
+    def test_corrupted_state_triggers_full_sync(self):
+        """Тест: повреждённый файл состояния не мешает синхронизации, запрос загружается целиком"""
+        self.sync.sync("python")
+        with open(self.state_path, "w", encoding="utf-8") as file:
+            file.write('{"python": {"water')
+
+        stats = self.sync.sync("python")
+        self.assertTrue(stats["full"])
+        self.assertEqual(stats["fetched"], 2)
+        self.assertIn("python", self.sync.load_state())
+
+    def test_queries_have_separate_state(self):
+        """Тест: у каждого запроса свой водяной знак"""
+        self.sync.sync("python")
+        self.assertTrue(self.sync.sync("python", extra_params={"area": 1})["full"])
+        self.assertEqual(len(IncrementalSync(self.api, self.storage, self.state_path).load_state()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
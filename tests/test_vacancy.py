@@ -1,4 +1,5 @@
 import unittest
+from dataclasses import asdict
 from src.models.vacancy import (
     Vacancy,
     Salary,
@@ -85,6 +86,66 @@ class TestVacancy(unittest.TestCase):
         self.assertIsInstance(vacancy.area, Area)
         self.assertEqual(vacancy.area.name, "Moscow")
 
+    def test_from_dict_roundtrip(self):
+        """Тест восстановления вакансии из to_dict()"""
+        vacancy = Vacancy.from_hh_data(self.sample_data)
+        restored = Vacancy.from_dict(vacancy.to_dict())
+
+        self.assertEqual(restored, vacancy)
+
+    def test_to_dict_matches_asdict(self):
+        """Тест: to_dict совпадает с dataclasses.asdict"""
+        for data in (self.sample_data, {"id": "789", "name": "Minimal Vacancy"}):
+            vacancy = Vacancy.from_hh_data(data)
+            self.assertEqual(list(vacancy.to_dict().items()), list(asdict(vacancy).items()))
+
+    def test_shared_nested_objects(self):
+        """Тест: одинаковые вложенные объекты разделяются между вакансиями"""
+        first = Vacancy.from_hh_data(self.sample_data)
+        second = Vacancy.from_hh_data(dict(self.sample_data, id="654321"))
+
+        self.assertIs(first.area, second.area)
+        self.assertIs(first.salary, second.salary)
+        self.assertIs(first.employer, second.employer)
+        self.assertIsNot(first.snippet, second.snippet)
+
+    def test_shared_objects_with_unusual_values(self):
+        """Тест: нехэшируемые значения не ломают разбор, 1 и 1.0 не делят объект"""
+        data = {"id": "1", "name": "a", "salary": {"from": 100, "to": None, "currency": ["RUR"]}}
+        self.assertEqual(Vacancy.from_hh_data(data).salary.currency, ["RUR"])
+
+        as_int = Vacancy.from_hh_data({"id": "2", "name": "b", "salary": {"from": 1, "currency": "RUR"}})
+        as_float = Vacancy.from_hh_data({"id": "3", "name": "c", "salary": {"from": 1.0, "currency": "RUR"}})
+        self.assertIs(type(as_int.salary.from_), int)
+        self.assertIs(type(as_float.salary.from_), float)
+
+    def test_public_shared_constructors(self):
+        """Тест: Salary.shared и Vacancy.from_parts разделяют объекты так же, как разбор данных API"""
+        parsed = Vacancy.from_hh_data(self.sample_data)
+        salary = parsed.salary
+        built = Vacancy.from_parts(
+            "654321",
+            parsed.name,
+            salary=Salary.shared(salary.from_, salary.to, salary.currency),
+            area=parsed.area.name,
+            employer=parsed.employer.name,
+        )
+
+        self.assertIs(built.salary, parsed.salary)
+        self.assertIs(built.area, parsed.area)
+        self.assertIs(built.employer, parsed.employer)
+        self.assertIsNone(built.experience)
+
+    def test_from_hh_data_many(self):
+        """Тест пакетного создания вакансий со сбором ошибок"""
+        errors = []
+        vacancies = Vacancy.from_hh_data_many(
+            [self.sample_data, {"invalid": "data"}, "not a dict"], errors
+        )
+
+        self.assertEqual([v.id for v in vacancies], ["123456"])
+        self.assertEqual([position for position, _ in errors], [1, 2])
+
 
 if __name__ == "__main__":
     unittest.main()